@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Benchmark: prefix scan time as the number of prefixes grows.
+
+Generates one synthetic source text (shell and YAML-like lines that mention
+paths under many prefixes, including URL-embedded ones that must not match),
+then scans it with the Aho-Corasick PrefixScanner and with the RegexScanner
+alternation for each prefix count. Reports the best-of-N time per scan and
+the scanner check_path_refs.compile_scanner picks; the crossover is what
+AUTOMATON_MIN_PREFIXES is set from. Exits 1 if the two disagree on any token,
+or, only if --max-growth is given, when the automaton's time at the largest
+prefix count exceeds that many times its time at the smallest.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from collections.abc import Callable, Iterable
+from functools import partial
+
+from check_path_refs import (
+    PREFIXES,
+    PrefixScanner,
+    RegexScanner,
+    compile_scanner,
+)
+
+WORDS = ("setup", "lint", "reference", "hooks", "nvim", "zsh", "mise", "tool")
+LINES = (
+    "run: bash {path}.sh --verbose\n",
+    '    - "{path}/**"\n',
+    "curl -fsSL https://example.com/raw/main/{path}.bash | sh\n",
+    "# {path} is documented elsewhere\n",
+    'local cfg = vim.fn.expand("{path}.lua")\n',
+    "        echo 'nothing to see on this line at all'\n",
+)
+
+
+def synthetic_prefixes(count: int) -> tuple[str, ...]:
+    """The real PREFIXES followed by generated ones sharing their characters."""
+    extra = (f"{WORDS[index % len(WORDS)]}{index}/" for index in range(count))
+    return (PREFIXES + tuple(extra))[:count]
+
+
+def synthetic_text(prefixes: Iterable[str], lines: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    choices = list(prefixes)
+    return "".join(
+        rng.choice(LINES).format(path=rng.choice(choices) + rng.choice(WORDS))
+        for _ in range(lines)
+    )
+
+
+def scan_all(scanner: PrefixScanner | RegexScanner, text: str) -> list[tuple[int, int]]:
+    return list(scanner.scan(text))
+
+
+def best_time(scan: Callable[[str], object], text: str, repeat: int) -> float:
+    timings: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        scan(text)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--prefixes", type=int, nargs="+", default=[1, 5, 25, 125, 625])
+    parser.add_argument("--lines", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-growth", type=float, default=None)
+    args = parser.parse_args()
+
+    counts = sorted(args.prefixes)
+    text = synthetic_text(synthetic_prefixes(counts[-1]), args.lines)
+    sys.stdout.write(
+        f"{len(text):,} chars\n"
+        f"{'prefixes':>8} {'tokens':>8} {'automaton':>11} {'regex':>11}  picked\n"
+    )
+    timings: list[float] = []
+    for count in counts:
+        prefixes = synthetic_prefixes(count)
+        scanner = PrefixScanner.compile(prefixes)
+        regex = RegexScanner.compile(prefixes)
+        tokens = scan_all(scanner, text)
+        if tokens != scan_all(regex, text):
+            sys.stderr.write(f"✗ automaton and regex disagree at {count} prefixes\n")
+            return 1
+        automaton = best_time(partial(scan_all, scanner), text, args.repeat)
+        alternation = best_time(partial(scan_all, regex), text, args.repeat)
+        timings.append(automaton)
+        chosen = compile_scanner(prefixes)
+        picked = "automaton" if isinstance(chosen, PrefixScanner) else "regex"
+        sys.stdout.write(
+            f"{count:>8} {len(tokens):>8} {automaton:>10.4f}s {alternation:>10.4f}s"
+            f"  {picked}\n"
+        )
+
+    growth = timings[-1] / timings[0]
+    if args.max_growth is not None and growth > args.max_growth:
+        sys.stderr.write(
+            f"✗ scan time grew {growth:.2f}x from {counts[0]} to {counts[-1]} "
+            f"prefixes, above --max-growth {args.max_growth}\n"
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
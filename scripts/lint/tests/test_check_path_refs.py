@@ -1,7 +1,9 @@
-"""Tests for scripts/ path reference checking."""
+"""Tests for repo path reference checking."""
 
 from __future__ import annotations
 
+import json
+import re
 import tempfile
 import unittest
 from pathlib import Path
@@ -135,6 +137,304 @@ class TestCheckPathRefs(unittest.TestCase):
 
             self.assertEqual(violations, [])
 
+    def test_recursive_glob_under_missing_directory_is_reported(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _write(root, "scripts/reference/extract.py", "")
+            _write(root, ".github/workflows/test.yml", '      - "scripts/gone/**"\n')
+
+            violations, _ = checker.check_path_refs(root)
+
+            self.assertEqual(
+                violations, [".github/workflows/test.yml:1: scripts/gone/**"]
+            )
+
+    def test_repeated_token_is_resolved_once(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _write(root, "scripts/build.sh", "")
+            _write(root, ".github/workflows/a.yml", "run: bash scripts/build.sh\n" * 3)
+            _write(root, "mise.toml", 'run = "bash scripts/build.sh"\n')
+
+            with mock.patch.object(
+                checker, "token_resolves", wraps=checker.token_resolves
+            ) as resolves:
+                violations, tokens_checked = checker.check_path_refs(root)
+
+            self.assertEqual(violations, [])
+            self.assertEqual(tokens_checked, 4)
+            self.assertEqual(resolves.call_count, 1)
+
+    def test_every_prefix_is_extracted(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _write(root, ".config/zsh/.zshrc", "")
+            _write(root, "bin/u.sh", "")
+            _write(
+                root,
+                "Dockerfile",
+                "COPY .config/zsh/.zshrc bin/u.sh docs/missing.md /home/\n",
+            )
+
+            violations, tokens_checked = checker.check_path_refs(root)
+
+            self.assertEqual(violations, ["Dockerfile:1: docs/missing.md"])
+            self.assertEqual(tokens_checked, 3)
+
+    def test_lua_comment_line_is_ignored(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _write(
+                root,
+                ".config/nvim/init.lua",
+                '-- see scripts/missing.sh\nlocal x = "# scripts/gone.sh"\n',
+            )
+
+            violations, _ = checker.check_path_refs(root)
+
+            self.assertEqual(violations, [".config/nvim/init.lua:2: scripts/gone.sh"])
+
+    def test_optional_root_is_only_checked_when_present(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _write(root, "mise.toml", 'run = "shellcheck .claude/hooks/*.sh"\n')
+
+            self.assertEqual(checker.check_path_refs(root)[0], [])
+
+            (root / ".claude").mkdir()
+            self.assertEqual(
+                checker.check_path_refs(root)[0], ["mise.toml:1: .claude/hooks/*.sh"]
+            )
+
+
+class TestPrefixScanner(unittest.TestCase):
+    def _tokens(self, prefixes: tuple[str, ...], text: str) -> list[str]:
+        scanner = checker.PrefixScanner.compile(prefixes)
+        return [text[start:end] for start, end in scanner.scan(text)]
+
+    def test_embedded_prefix_belongs_to_the_outer_token(self) -> None:
+        self.assertEqual(
+            self._tokens(checker.PREFIXES, "cp .claude/skills/x/scripts/a.sh bin/"),
+            [".claude/skills/x/scripts/a.sh", "bin/"],
+        )
+
+    def test_overlapping_prefixes_match_like_an_alternation(self) -> None:
+        prefixes = ("sbin/", "bin/", "in/", "a/b/", "b/")
+        pattern = re.compile(
+            r"(?<![A-Za-z0-9_./-])(?:sbin/|bin/|in/|a/b/|b/)[A-Za-z0-9_./*?\[\]-]*"
+        )
+        for text in ("sbin/x bin/y in/z", "a/b/c b/d xa/b/", "(in/*.sh) =b/", ""):
+            with self.subTest(text=text):
+                self.assertEqual(self._tokens(prefixes, text), pattern.findall(text))
+
+    def test_regex_scanner_finds_the_same_tokens(self) -> None:
+        prefixes = ("sbin/", "bin/", "in/", "a/b/", "b/", *checker.PREFIXES)
+        automaton = checker.PrefixScanner.compile(prefixes)
+        regex = checker.RegexScanner.compile(prefixes)
+        text = "sbin/x bin/y in/z\na/b/c b/d xa/b/ (in/*.sh)\nhttps://h/scripts/a.sh"
+        self.assertEqual(list(regex.scan(text)), list(automaton.scan(text)))
+
+    def test_automaton_only_for_many_prefixes(self) -> None:
+        self.assertIsInstance(checker.SCANNER, checker.RegexScanner)
+        many = tuple(f"p{index}/" for index in range(checker.AUTOMATON_MIN_PREFIXES))
+        self.assertIsInstance(checker.compile_scanner(many), checker.PrefixScanner)
+        self.assertIsInstance(checker.compile_scanner(many[:-1]), checker.RegexScanner)
+
+
+class TestFileTreeIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        root = Path(tmp.name)
+        for rel_path in (
+            "scripts/lib.sh",
+            "scripts/setup/base.sh",
+            "scripts/reference/common/nav.py",
+            "scripts/.hidden/tool.sh",
+            "other/file.sh",
+        ):
+            _write(root, rel_path, "")
+        self.index = checker.FileTreeIndex.build(root, ("scripts/",))
+
+    def test_literal_files_and_directories(self) -> None:
+        self.assertTrue(self.index.exists("scripts/lib.sh"))
+        self.assertTrue(self.index.exists("scripts/reference/"))
+        self.assertFalse(self.index.exists("scripts/missing.sh"))
+        # Only the prefix roots are indexed.
+        self.assertNotIn("other/file.sh", self.index.files)
+
+    def test_globs_match_like_glob_module(self) -> None:
+        self.assertTrue(self.index.glob_exists("scripts/*.sh"))
+        self.assertTrue(self.index.glob_exists("scripts/**/nav.py"))
+        self.assertTrue(self.index.glob_exists("scripts/[rs]*/"))
+        self.assertTrue(self.index.glob_exists("scripts/reference/**"))
+        self.assertFalse(self.index.glob_exists("scripts/*.py"))
+        self.assertFalse(self.index.glob_exists("scripts/lib.sh/"))
+
+    def test_wildcards_skip_hidden_entries(self) -> None:
+        self.assertFalse(self.index.glob_exists("scripts/*/tool.sh"))
+        self.assertFalse(self.index.glob_exists("scripts/**/tool.sh"))
+        self.assertTrue(self.index.glob_exists("scripts/.hidden/*.sh"))
+
+
+class TestCheckChanged(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        _write(self.root, "scripts/build.sh", "")
+        _write(self.root, "scripts/setup/base.sh", "")
+        _write(self.root, ".github/workflows/a.yml", "run: bash scripts/build.sh\n")
+        _write(self.root, "mise.toml", 'run = "shellcheck scripts/setup/*.sh"\n')
+        self.refs = checker.scan_sources(
+            self.root, checker.collect_source_files(self.root)
+        )
+
+    def test_changed_source_is_rescanned(self) -> None:
+        _write(self.root, "mise.toml", 'run = "bash scripts/missing.sh"\n')
+
+        violations, checked, refs = checker.check_changed(
+            self.root, ["mise.toml"], self.refs
+        )
+
+        self.assertEqual(violations, ["mise.toml:1: scripts/missing.sh"])
+        self.assertEqual(checked, 1)
+        self.assertEqual(refs["mise.toml"], [(1, "scripts/missing.sh")])
+
+    def test_deleted_target_rechecks_unchanged_sources(self) -> None:
+        (self.root / "scripts/build.sh").unlink()
+
+        violations, checked, _ = checker.check_changed(
+            self.root, ["scripts/build.sh"], self.refs
+        )
+
+        self.assertEqual(violations, [".github/workflows/a.yml:1: scripts/build.sh"])
+        self.assertEqual(checked, 1)
+
+    def test_renamed_directory_rechecks_globs_below_it(self) -> None:
+        (self.root / "scripts/setup").rename(self.root / "scripts/install")
+
+        violations, _, _ = checker.check_changed(
+            self.root, ["scripts/setup/base.sh", "scripts/install/base.sh"], self.refs
+        )
+
+        self.assertEqual(violations, ["mise.toml:1: scripts/setup/*.sh"])
+
+    def test_unrelated_change_checks_nothing(self) -> None:
+        violations, checked, _ = checker.check_changed(
+            self.root, ["README.md", "scripts/other/new.py"], self.refs
+        )
+
+        self.assertEqual((violations, checked), ([], 0))
+
+    def test_deleted_source_is_dropped(self) -> None:
+        (self.root / "mise.toml").unlink()
+
+        _, _, refs = checker.check_changed(self.root, ["mise.toml"], self.refs)
+
+        self.assertNotIn("mise.toml", refs)
+
+    def _saved(self, head: str = "abc123") -> checker.RefIndex:
+        hashes = checker.source_hashes(
+            self.root, checker.collect_source_files(self.root)
+        )
+        return checker.RefIndex(self.refs, hashes, head, ("scripts/new.sh",))
+
+    def test_ref_index_round_trip(self) -> None:
+        path = self.root / "cache" / "refs.json"
+        saved = self._saved()
+        checker.save_ref_index(path, self.root, saved)
+
+        self.assertEqual(checker.load_ref_index(path, self.root), saved)
+        self.assertIsNone(checker.load_ref_index(path, self.root / "elsewhere"))
+        raw = json.loads(path.read_text(encoding="utf-8"))
+        self.assertEqual(raw["targets"]["scripts/setup/*.sh"], "scripts/setup")
+
+    def test_sources_edited_outside_the_diff_are_stale(self) -> None:
+        saved = self._saved()
+        # e.g. changed by a pull: committed, so invisible to `git diff HEAD`.
+        _write(self.root, "mise.toml", 'run = "bash scripts/missing.sh"\n')
+        (self.root / ".github/workflows/a.yml").unlink()
+        hashes = checker.source_hashes(
+            self.root, checker.collect_source_files(self.root)
+        )
+
+        changed = checker.changed_since_index(self.root, saved, hashes, "abc123")
+
+        self.assertEqual(
+            changed, [".github/workflows/a.yml", "mise.toml", "scripts/new.sh"]
+        )
+        violations, _, _ = checker.check_changed(self.root, changed or [], saved.refs)
+        self.assertEqual(violations, ["mise.toml:1: scripts/missing.sh"])
+
+    def test_moved_head_adds_the_commits_in_between(self) -> None:
+        saved = self._saved()
+        diff = mock.Mock(stdout="scripts/build.sh\n")
+        with mock.patch("subprocess.run", return_value=diff) as run:
+            changed = checker.changed_since_index(
+                self.root, saved, saved.hashes, "def456"
+            )
+
+        self.assertEqual(changed, ["scripts/new.sh", "scripts/build.sh"])
+        self.assertEqual(run.call_args.args[0][-2:], ["abc123", "def456"])
+
+    def test_unknown_saved_commit_checks_everything(self) -> None:
+        saved = self._saved(head="")
+
+        self.assertIsNone(
+            checker.changed_since_index(self.root, saved, saved.hashes, "def456")
+        )
+
+
+class TestReport(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        _write(self.root, "scripts/setup/base.sh", "")
+        _write(
+            self.root,
+            "mise.toml",
+            'run = "bash scripts/setup/base.sh"\n'
+            'run = "shellcheck scripts/setup/*.sh scripts/setup/base.sh"\n'
+            'run = "bash scripts/missing.sh"\n'
+            'run = "bash scripts/gone.sh"\n',
+        )
+        self.stats = checker.CheckStats()
+        with mock.patch.object(checker, "ALLOWLIST", frozenset({"mise.toml:4"})):
+            self.violations, self.checked = checker.check_path_refs(
+                self.root, self.stats
+            )
+
+    def test_stats_count_references_by_kind(self) -> None:
+        self.assertEqual(self.violations, ["mise.toml:3: scripts/missing.sh"])
+        self.assertEqual(
+            (self.stats.literal, self.stats.glob, self.stats.allowlisted), (3, 1, 1)
+        )
+        self.assertEqual(self.stats.resolved, 3)
+        self.assertEqual(len(self.stats.sources["mise.toml"].refs), self.checked)
+
+    def test_json_report_lists_violations_and_sources(self) -> None:
+        report = json.loads(
+            json.dumps(checker.json_report(self.stats, self.checked, "checked", 0.5))
+        )
+
+        self.assertFalse(report["ok"])
+        self.assertEqual(
+            report["violations"],
+            [{"source": "mise.toml", "line": 3, "token": "scripts/missing.sh"}],
+        )
+        self.assertEqual(
+            report["sources"]["mise.toml"],
+            {"tokens": 5, "read": mock.ANY, "scan": mock.ANY},
+        )
+
+    def test_profile_names_every_phase(self) -> None:
+        profile = checker.format_profile(self.stats, 0.5)
+
+        for phase in ("read", "scan", "index", "resolve", "total", "mise.toml"):
+            self.assertIn(phase, profile)
+
 
 class TestCheckPathRefsIntegration(unittest.TestCase):
     def test_repo_has_zero_violations(self) -> None:
@@ -144,6 +444,19 @@ class TestCheckPathRefsIntegration(unittest.TestCase):
 
         self.assertEqual(violations, [])
 
+    def test_plain_check_runs_no_git_and_writes_no_index(self) -> None:
+        with (
+            tempfile.TemporaryDirectory() as tmp,
+            mock.patch.dict("os.environ", {"XDG_CACHE_HOME": tmp}),
+            mock.patch("sys.argv", ["check_path_refs.py"]),
+            mock.patch("subprocess.run") as run,
+            mock.patch("sys.stdout"),
+        ):
+            self.assertEqual(checker.main(), 0)
+            self.assertEqual(list(Path(tmp).iterdir()), [])
+
+        run.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
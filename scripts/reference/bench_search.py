@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Benchmark: fuzzy ranked search vs the substring scan at several sizes.
+
+Generates synthetic keybinding records, builds the precomputed structures
+both searches use (joined lowercase haystacks for the substring scan; field
+texts and character masks for common/fuzzy.py), and reports the best-of-N
+time per query set at each size. Exits 1 if a record found by the substring
+scan is missing from the fuzzy results, since every substring match is also
+a subsequence match.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from collections.abc import Callable, Sequence
+from functools import partial
+
+from common.fuzzy import FuzzyIndex
+from common.page_config import search_field_specs
+from keybindings.page import PAGE_CONFIG
+
+QUERIES = ("split", "ctrl", "goto def", "pane lft", "zq", "lsp")
+WORDS = [
+    "split",
+    "pane",
+    "window",
+    "tab",
+    "goto",
+    "definition",
+    "references",
+    "lsp",
+    "diagnostic",
+    "next",
+    "previous",
+    "scroll",
+    "page",
+    "half",
+    "copy",
+    "paste",
+    "search",
+    "history",
+    "line",
+    "word",
+    "buffer",
+    "quit",
+    "close",
+    "toggle",
+    "zoom",
+    "focus",
+    "left",
+    "right",
+    "up",
+    "down",
+    "resize",
+    "activate",
+]
+KEYS = ("<C-w>", "<leader>f", "gd", "ctrl-a", "alt-h", "shift-tab", "^R", "]d")
+
+
+def synthetic_records(count: int, seed: int = 0) -> list[dict[str, str]]:
+    rng = random.Random(seed)
+    return [
+        {
+            "tool": rng.choice(("wezterm", "zsh", "skhd", "nvim")),
+            "mode": rng.choice(("n", "v", "i", "")),
+            "key": f"{rng.choice(KEYS)}{index % 97}",
+            "action": " ".join(rng.choices(WORDS, k=3)),
+            "description": " ".join(rng.choices(WORDS, k=5)),
+            "source": f".config/{rng.choice(WORDS)}/{rng.choice(WORDS)}.lua",
+            "origin": rng.choice(("custom", "default")),
+        }
+        for index in range(count)
+    ]
+
+
+def substring_search(haystacks: Sequence[str], query: str) -> list[int]:
+    needle = query.lower()
+    return [index for index, hay in enumerate(haystacks) if needle in hay]
+
+
+def best_time(search: Callable[[str], object], repeat: int) -> float:
+    """Best-of-``repeat`` time to run every query in QUERIES."""
+    timings: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for query in QUERIES:
+            search(query)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    fields = search_field_specs(PAGE_CONFIG.search_fields)
+    sys.stdout.write(
+        f"{'records':>8} {'substring':>11} {'fuzzy':>11} {'ratio':>7} {'index':>9}\n"
+    )
+    for size in args.sizes:
+        records = synthetic_records(size)
+        haystacks = [
+            " ".join(record.get(field.name, "") for field in fields).lower()
+            for record in records
+        ]
+        start = time.perf_counter()
+        index = FuzzyIndex(records, fields)
+        build = time.perf_counter() - start
+
+        for query in QUERIES:
+            missing = set(substring_search(haystacks, query)) - set(index.search(query))
+            if missing:
+                sys.stderr.write(
+                    f"✗ {len(missing)} substring match(es) for {query!r} "
+                    f"missing from the fuzzy results at {size} records\n"
+                )
+                return 1
+
+        substring = best_time(partial(substring_search, haystacks), args.repeat)
+        fuzzy = best_time(index.search, args.repeat)
+        sys.stdout.write(
+            f"{size:>8} {substring:>10.4f}s {fuzzy:>10.4f}s "
+            f"{fuzzy / substring:>6.1f}x {build:>8.3f}s\n"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: combined shortcut classifier vs three per-parser passes.
+
+Generates a large synthetic Zsh file (aliases, abbreviations, functions with
+comment descriptions, bindkeys, and filler), checks that both approaches yield
+the same shortcuts, and reports the best-of-N time for each. Exits 1 when the
+outputs differ, or, only if --min-speedup is given, when the combined
+classifier is not at least that many times faster. CI runs the equality check
+alone: wall-clock ratios on shared runners are too noisy to gate on.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+
+from shortcuts.abbr_parser import parse_abbr_text
+from shortcuts.alias_parser import parse_alias_text
+from shortcuts.function_parser import parse_function_text
+from shortcuts.line_classifier import parse_shortcut_text
+from shortcuts.schema import Shortcut
+
+SOURCE = "synthetic.zsh"
+BLOCK = """\
+alias ll{n}='ls -l --color=auto'
+alias -g G{n}='| grep'
+abbr -S --quieter add gs{n}='git status --short'
+# Jump to project {n}
+# (second description line)
+proj{n}() {{
+  cd "$HOME/src/{n}" || return
+}}
+function helper{n} {{
+  echo "{n}"
+}}
+bindkey '^X{n}' widget-{n}
+export PATH="$HOME/bin/{n}:$PATH"
+[[ -f ~/.local{n} ]] && source ~/.local{n}
+
+"""
+
+
+def synthetic_zsh(blocks: int) -> str:
+    return "".join(BLOCK.format(n=n) for n in range(blocks))
+
+
+def parse_three_passes(text: str, source: str) -> list[Shortcut]:
+    return [
+        *parse_alias_text(text, source),
+        *parse_abbr_text(text, source),
+        *parse_function_text(text, source),
+    ]
+
+
+def best_time(
+    parse: Callable[[str, str], list[Shortcut]], text: str, repeat: int
+) -> float:
+    timings: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(text, SOURCE)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def same_shortcuts(text: str) -> bool:
+    """Combined output, grouped by kind, must equal the three passes."""
+    combined = parse_shortcut_text(text, SOURCE)
+    grouped = [
+        shortcut
+        for kind in ("alias", "abbr", "function")
+        for shortcut in combined
+        if shortcut.kind == kind
+    ]
+    return grouped == parse_three_passes(text, SOURCE)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--blocks", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-speedup", type=float, default=None)
+    args = parser.parse_args()
+
+    text = synthetic_zsh(args.blocks)
+    if not same_shortcuts(text):
+        sys.stderr.write("✗ combined classifier output differs from the parsers\n")
+        return 1
+
+    three = best_time(parse_three_passes, text, args.repeat)
+    combined = best_time(parse_shortcut_text, text, args.repeat)
+    speedup = three / combined
+    sys.stdout.write(
+        f"lines: {len(text.splitlines())}\n"
+        f"three passes: {three:7.3f}s\n"
+        f"combined:     {combined:7.3f}s\n"
+        f"speedup:      {speedup:7.2f}x\n"
+    )
+    if args.min_speedup is not None and speedup < args.min_speedup:
+        sys.stderr.write(
+            f"✗ speedup {speedup:.2f}x is below --min-speedup {args.min_speedup}\n"
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
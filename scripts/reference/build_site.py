@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""Build the full reference site (hub + all domain pages) in one process.
+
+Every extractor, the keybinding validation, and both renderers are called
+directly; records stay in memory between stages instead of round-tripping
+through intermediate JSON files and a fresh interpreter per step. A per-stage
+timing report goes to stderr.
+
+Pages link one shared, minified stylesheet and script under assets/, named
+by content hash (see common/assets.py); --inline embeds them in every page
+instead, so each index.html is a standalone file.
+
+With --split-data each domain page fetches its records from a content-hashed
+data file instead of inlining them, so the data stays cached across visits
+until it changes.
+
+Every output file is written through manifest.json (common/site_manifest.py):
+unchanged files are left alone, changed ones get .gz/.br siblings compressed
+on --jobs threads, and files the build no longer produces are removed. A
+page whose records and renderer are unchanged since the last build is not
+rendered again, so it keeps its bytes and its generated_at (--no-cache
+renders every page).
+
+Extractors that launch external binaries (wezterm, nvim, mise) run on a
+thread pool sized by --jobs while the pure parsers run on the main thread.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from functools import partial
+from pathlib import Path
+
+from claude.extract import (
+    claude_dir_state,
+    claude_file_records,
+    collect_claude_assets,
+    merge_claude_records,
+)
+from common.assets import build_asset_bundle
+from common.build_cache import BuildCache
+from common.hub_html import render_hub
+from common.nav import DOMAIN_ORDER
+from common.page_data import data_file_name, encode_page_data
+from common.parallel import DEFAULT_JOBS, ExtractStage, run_extract_stages
+from common.render_inputs import render_inputs_key
+from common.site_manifest import load_manifest, publish_site, reusable_output
+from common.timing import StageTimer
+from extract_keybindings import (
+    REPO_ROOT,
+    keybinding_stages,
+    merge_stage_records,
+    zsh_scanner,
+)
+from extract_nvim import BASELINES
+from extract_shortcuts import collect_shortcuts, merge_shortcuts, shortcut_file_records
+from extract_tasks import collect_tasks, mise_config_state, read_mise_version
+from keybindings.leaders import keybinding_leaders
+from render import domain_payload, render_domain_html, resolve_git_commit
+from render_hub import build_cards
+from validate import validate_keybinding_records
+
+Records = list[dict[str, str]]
+
+
+def extract_domains(
+    root: Path,
+    timer: StageTimer,
+    jobs: int,
+    nvim_baseline: str = "clean",
+    cache: BuildCache | None = None,
+) -> dict[str, Records]:
+    use_cache = cache is not None
+    scanner = zsh_scanner(root, use_cache=use_cache)
+    keybindings = keybinding_stages(
+        root, nvim_baseline, use_cache=use_cache, scanner=scanner
+    )
+    stages = [
+        *keybindings,
+        ExtractStage(
+            "extract:shortcuts",
+            lambda: collect_shortcuts(root, scanner),
+            inputs=(".config/zsh/**/*.zsh",),
+            parse_input=partial(shortcut_file_records, scanner),
+            combine=partial(merge_shortcuts, root / ".config" / "zsh"),
+        ),
+        ExtractStage(
+            "extract:tasks",
+            lambda: collect_tasks(root),
+            spawns_process=True,
+            inputs=("mise.toml", ".config/mise/**/*"),
+            salt=mise_config_state,
+            tools=("mise",),
+            version=read_mise_version,
+        ),
+        ExtractStage(
+            "extract:claude",
+            lambda: collect_claude_assets(root),
+            inputs=(".claude/**/*.md", ".apm/agents/**/*.agent.md"),
+            salt=partial(claude_dir_state, root),
+            parse_input=partial(claude_file_records, root),
+            combine=merge_claude_records,
+        ),
+    ]
+    with timer.stage("extract:wall"):
+        results = run_extract_stages(stages, timer, jobs, cache)
+
+    return {
+        "keybindings": merge_stage_records(
+            keybindings, results, keybinding_leaders(root)
+        ),
+        "shortcuts": results["extract:shortcuts"],
+        "tasks": results["extract:tasks"],
+        "claude": results["extract:claude"],
+    }
+
+
+@dataclass(frozen=True)
+class RenderedSite:
+    """Every output file of a build, keyed by site-relative path.
+
+    inputs: render-inputs key of each page (common/render_inputs.py)
+    reused: pages copied from the previous build because their key matched
+    """
+
+    files: dict[str, bytes]
+    inputs: dict[str, str]
+    reused: tuple[str, ...]
+    counts: dict[str, int]
+
+
+def render_site(
+    domains: dict[str, Records],
+    timer: StageTimer,
+    *,
+    split_data: bool = False,
+    inline: bool = False,
+    previous_site: Path | None = None,
+) -> RenderedSite:
+    """Render every page.
+
+    With ``previous_site``, a page whose render inputs match that site's
+    manifest is taken over unchanged, generated_at included.
+    """
+    generated_at = datetime.now(UTC).isoformat()
+    commit = resolve_git_commit()
+    previous = load_manifest(previous_site) if previous_site is not None else {}
+    files: dict[str, bytes] = {}
+    inputs: dict[str, str] = {}
+    reused: list[str] = []
+
+    def emit(path: str, key: str, render: Callable[[], str]) -> None:
+        content = (
+            reusable_output(previous_site, path, previous.get(path), key)
+            if previous_site is not None
+            else None
+        )
+        if content is None:
+            content = render().encode("utf-8")
+        else:
+            reused.append(path)
+        files[path] = content
+        inputs[path] = key
+
+    # Domain pages sit one level below the site root, like their nav links.
+    page_assets = hub_assets = None
+    if not inline:
+        with timer.stage("render:assets"):
+            bundle = build_asset_bundle()
+        files.update(bundle.files())
+        page_assets = bundle.links("../")
+        hub_assets = bundle.links("./")
+
+    counts: dict[str, int] = {}
+    for slug, _label in DOMAIN_ORDER:
+        records = domains.get(slug, [])
+        with timer.stage(f"render:{slug}"):
+            data_url = None
+            if split_data:
+                data = encode_page_data(domain_payload(slug, records))
+                data_url = data_file_name(data)
+                files[f"{slug}/{data_url}"] = data
+            key = render_inputs_key(
+                "page", slug, records, data_url, page_assets and asdict(page_assets)
+            )
+            render = partial(
+                render_domain_html,
+                slug,
+                records,
+                generated_at=generated_at,
+                commit=commit,
+                data_url=data_url,
+                assets=page_assets,
+            )
+            emit(f"{slug}/index.html", key, render)
+        counts[slug] = len(records)
+
+    with timer.stage("render:hub"):
+        meta = {"generated_at": generated_at, "commit": commit}
+        cards = build_cards(counts)
+        key = render_inputs_key("hub", cards, hub_assets and asdict(hub_assets))
+        emit("index.html", key, partial(render_hub, cards, meta, assets=hub_assets))
+
+    return RenderedSite(files, inputs, tuple(reused), counts)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build the reference site")
+    parser.add_argument("--root", type=Path, default=REPO_ROOT)
+    parser.add_argument("--out", type=Path, default=Path("site"))
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help="maximum concurrent extractor processes and compression threads "
+        "(1 = fully serial)",
+    )
+    parser.add_argument("--nvim-baseline", choices=BASELINES, default="clean")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="ignore the content-hash build cache and the tool baseline caches, "
+        "and render every page even if its inputs are unchanged",
+    )
+    parser.add_argument(
+        "--split-data",
+        action="store_true",
+        help="write records to hashed data files fetched by the pages",
+    )
+    parser.add_argument(
+        "--inline",
+        action="store_true",
+        help="embed the stylesheet and script in every page instead of assets/",
+    )
+    args = parser.parse_args()
+
+    root = args.root.resolve()
+    timer = StageTimer()
+    cache = None if args.no_cache else BuildCache(root)
+
+    print("==> extracting all domains...")
+    try:
+        domains = extract_domains(root, timer, args.jobs, args.nvim_baseline, cache)
+    except (subprocess.CalledProcessError, OSError, ValueError) as exc:
+        print(f"extraction failed: {exc}", file=sys.stderr)
+        return 1
+
+    with timer.stage("validate:keybindings"):
+        errors = validate_keybinding_records(domains["keybindings"])
+    if errors:
+        for error in errors:
+            print(error, file=sys.stderr)
+        return 1
+
+    print("==> rendering pages...")
+    site = render_site(
+        domains,
+        timer,
+        split_data=args.split_data,
+        inline=args.inline,
+        previous_site=None if args.no_cache else args.out,
+    )
+    with timer.stage("publish"):
+        published = publish_site(args.out, site.files, args.jobs, site.inputs)
+
+    sys.stderr.write(timer.format_report())
+    if site.reused:
+        sys.stderr.write(f"unchanged pages: {', '.join(site.reused)}\n")
+    sys.stderr.write(
+        f"published: {len(published.written)} written, "
+        f"{len(published.unchanged)} unchanged, {len(published.removed)} removed\n"
+    )
+    if cache is not None and cache.hits:
+        sys.stderr.write(f"cached: {', '.join(cache.hits)}\n")
+    print(f"✓ reference site built at {args.out}/ ({json.dumps(site.counts)})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
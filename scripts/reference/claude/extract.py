@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from pathlib import Path
 
 from claude.frontmatter import parse_frontmatter
@@ -47,6 +48,15 @@ def relative_source(file_path: Path, claude_dir: Path, root: Path) -> str:
         return (Path(".claude") / relative).as_posix()
 
 
+def claude_dir_state(root: Path) -> str:
+    """Cache key component: whether ``root / .claude`` exists at all.
+
+    A checkout without ``.claude`` yields no records, which the digest of
+    the (then empty) input globs alone cannot tell from an empty tree.
+    """
+    return "present" if (root / ".claude").is_dir() else "absent"
+
+
 def collect_claude_assets(root: Path) -> list[dict[str, str]]:
     """Collect Claude Code assets from ``root / .claude``."""
     claude_dir = root / ".claude"
@@ -61,12 +71,35 @@ def collect_from_claude_dir(claude_dir: Path, root: Path) -> list[dict[str, str]
     assets.extend(_collect_agents(claude_dir, root))
     assets.extend(_collect_commands(claude_dir, root))
     assets.extend(_collect_rules(claude_dir, root))
+    return sorted((to_record(asset) for asset in assets), key=_asset_order)
 
-    records = [to_record(asset) for asset in assets]
-    return sorted(
-        records,
-        key=lambda record: (TYPE_ORDER.get(record["type"], 99), record["source"]),
-    )
+
+def claude_file_records(root: Path, file_path: Path) -> list[dict[str, str]]:
+    """The asset record of one input file, classified by where it lives."""
+    claude_dir = root / ".claude"
+    if not claude_dir.is_dir():
+        return []
+    asset: ClaudeAsset | None = None
+    if file_path.is_relative_to(root / ".apm" / "agents"):
+        if file_path.name.endswith(".agent.md"):
+            asset = _agent_asset(file_path, claude_dir, root)
+    elif file_path.is_relative_to(claude_dir / "commands"):
+        asset = _command_asset(file_path, claude_dir, root)
+    elif file_path.is_relative_to(claude_dir / "rules"):
+        asset = _rule_asset(file_path, claude_dir, root)
+    return [to_record(asset)] if asset is not None else []
+
+
+def merge_claude_records(
+    by_file: Mapping[Path, list[dict[str, str]]],
+) -> list[dict[str, str]]:
+    """Merge per-file records ordered by asset type, then source."""
+    records = (record for records in by_file.values() for record in records)
+    return sorted(records, key=_asset_order)
+
+
+def _asset_order(record: dict[str, str]) -> tuple[int, str]:
+    return (TYPE_ORDER.get(record["type"], 99), record["source"])
 
 
 def _collect_agents(claude_dir: Path, root: Path) -> list[ClaudeAsset]:
@@ -75,78 +108,81 @@ def _collect_agents(claude_dir: Path, root: Path) -> list[ClaudeAsset]:
     agents_root = root / ".apm" / "agents"
     if not agents_root.is_dir():
         return []
-
-    assets: list[ClaudeAsset] = []
-    for agent_file in sorted(agents_root.rglob("*.agent.md")):
-        text = agent_file.read_text(encoding="utf-8")
-        frontmatter = parse_frontmatter(text) or {}
-        name = frontmatter.get("name", "").strip() or agent_file.stem
-        description = frontmatter.get("description", "")
-        model = frontmatter.get("model", "").strip()
-        assets.append(
-            ClaudeAsset(
-                type="agent",
-                name=name,
-                description=description,
-                model=model,
-                source=relative_source(agent_file, claude_dir, root),
-            )
-        )
-    return assets
+    return [
+        _agent_asset(agent_file, claude_dir, root)
+        for agent_file in sorted(agents_root.rglob("*.agent.md"))
+    ]
+
+
+def _agent_asset(agent_file: Path, claude_dir: Path, root: Path) -> ClaudeAsset:
+    text = agent_file.read_text(encoding="utf-8")
+    frontmatter = parse_frontmatter(text) or {}
+    name = frontmatter.get("name", "").strip() or agent_file.stem
+    description = frontmatter.get("description", "")
+    model = frontmatter.get("model", "").strip()
+    return ClaudeAsset(
+        type="agent",
+        name=name,
+        description=description,
+        model=model,
+        source=relative_source(agent_file, claude_dir, root),
+    )
 
 
 def _collect_commands(claude_dir: Path, root: Path) -> list[ClaudeAsset]:
     commands_root = claude_dir / "commands"
     if not commands_root.is_dir():
         return []
-
-    assets: list[ClaudeAsset] = []
-    for command_file in sorted(commands_root.rglob("*.md")):
-        text = command_file.read_text(encoding="utf-8")
-        frontmatter = parse_frontmatter(text)
-        body = extract_body(text)
-
-        if frontmatter is None:
-            name = command_file.stem
-            description = first_heading_or_line(body)
-        else:
-            name = frontmatter.get("name", "").strip() or command_file.stem
-            description = frontmatter.get(
-                "description", ""
-            ).strip() or first_heading_or_line(body)
-
-        assets.append(
-            ClaudeAsset(
-                type="command",
-                name=name,
-                description=collapse_whitespace(description),
-                model="",
-                source=relative_source(command_file, claude_dir, root),
-            )
-        )
-    return assets
+    return [
+        _command_asset(command_file, claude_dir, root)
+        for command_file in sorted(commands_root.rglob("*.md"))
+    ]
+
+
+def _command_asset(command_file: Path, claude_dir: Path, root: Path) -> ClaudeAsset:
+    text = command_file.read_text(encoding="utf-8")
+    frontmatter = parse_frontmatter(text)
+    body = extract_body(text)
+
+    if frontmatter is None:
+        name = command_file.stem
+        description = first_heading_or_line(body)
+    else:
+        name = frontmatter.get("name", "").strip() or command_file.stem
+        description = frontmatter.get(
+            "description", ""
+        ).strip() or first_heading_or_line(body)
+
+    return ClaudeAsset(
+        type="command",
+        name=name,
+        description=collapse_whitespace(description),
+        model="",
+        source=relative_source(command_file, claude_dir, root),
+    )
 
 
 def _collect_rules(claude_dir: Path, root: Path) -> list[ClaudeAsset]:
     rules_root = claude_dir / "rules"
     if not rules_root.is_dir():
         return []
-
-    assets: list[ClaudeAsset] = []
-    for rule_file in sorted(rules_root.rglob("*.md")):
-        # private-*.md と symlink は別の private な dotfiles が配備する非公開ルール。
-        # 生成物は公開されるため、見出しすら読み込まない
-        if rule_file.name.startswith("private-") or rule_file.is_symlink():
-            continue
-        text = rule_file.read_text(encoding="utf-8")
-        description = first_heading_or_line(text)
-        assets.append(
-            ClaudeAsset(
-                type="rule",
-                name=rule_file.stem,
-                description=description,
-                model="",
-                source=relative_source(rule_file, claude_dir, root),
-            )
-        )
-    return assets
+    rules = (
+        _rule_asset(rule_file, claude_dir, root)
+        for rule_file in sorted(rules_root.rglob("*.md"))
+    )
+    return [rule for rule in rules if rule is not None]
+
+
+def _rule_asset(rule_file: Path, claude_dir: Path, root: Path) -> ClaudeAsset | None:
+    # private-*.md と symlink は別の private な dotfiles が配備する非公開ルール。
+    # 生成物は公開されるため、見出しすら読み込まない
+    if rule_file.name.startswith("private-") or rule_file.is_symlink():
+        return None
+    text = rule_file.read_text(encoding="utf-8")
+    return ClaudeAsset(
+        type="rule",
+        name=rule_file.stem,
+        description=first_heading_or_line(text),
+        model="",
+        source=relative_source(rule_file, claude_dir, root),
+    )
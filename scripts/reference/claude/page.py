@@ -6,7 +6,7 @@ import json
 from collections import Counter
 
 from common.nav import build_nav
-from common.page_config import Column, Filter, PageConfig
+from common.page_config import Column, Filter, PageConfig, SearchField
 
 PAGE_CONFIG = PageConfig(
     title="Claude Assets",
@@ -18,7 +18,11 @@ PAGE_CONFIG = PageConfig(
         Column("source", "Source", kind="wrap"),
     ),
     filters=(Filter("type", "Type", values=("agent", "command", "rule")),),
-    search_fields=("name", "description", "source"),
+    search_fields=(
+        SearchField("name", weight=3),
+        SearchField("description", weight=2),
+        "source",
+    ),
     badge_classes={
         "agent": "badge-purple",
         "command": "badge-green",
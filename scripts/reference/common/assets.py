@@ -0,0 +1,92 @@
+"""Site-wide stylesheet and page script, shared by the hub and every page.
+
+Without it each page inlines the same few kilobytes of CSS and JS. The site
+build instead writes them once, minified, as ``assets/app.<hash>.css`` and
+``assets/app.<hash>.js``; the name changes whenever the content does, so
+browsers download the bundle once for the whole site and keep it cached
+until the next change (bundles from earlier builds are dropped through the
+site manifest, common/site_manifest.py). The minifiers only drop comments
+and whitespace, which is all these hand-written sources need; the JS keeps
+one statement per line so automatic semicolon insertion sees the same line
+breaks.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from dataclasses import dataclass
+
+from common.hub_html import HUB_CSS
+from common.page_config import AssetLinks
+from common.render_html import PAGE_CSS, page_script
+from common.site_style import SHARED_CSS
+
+ASSET_DIR = "assets"
+_HASH_LENGTH = 16
+
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_SPACE = re.compile(r"\s+")
+_CSS_PUNCTUATION = re.compile(r"\s*([{};,>])\s*")
+_CSS_COLON = re.compile(r":\s+")
+
+
+def minify_css(source: str) -> str:
+    """Drop comments and whitespace that CSS does not need.
+
+    Spaces around ``+`` and ``-`` are kept (``calc()`` requires them), and so
+    is a space before ``:``, which separates a descendant pseudo-class.
+    """
+    text = _CSS_SPACE.sub(" ", _CSS_COMMENT.sub("", source))
+    text = _CSS_COLON.sub(":", _CSS_PUNCTUATION.sub(r"\1", text))
+    return text.replace(";}", "}").strip()
+
+
+def minify_js(source: str) -> str:
+    """Drop indentation, blank lines, and whole-line ``//`` comments.
+
+    Line breaks between statements are kept, and so is everything within a
+    line, so string and regex literals pass through untouched.
+    """
+    lines = (line.strip() for line in source.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+
+def asset_file_name(content: str, suffix: str) -> str:
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:_HASH_LENGTH]
+    return f"app.{digest}{suffix}"
+
+
+@dataclass(frozen=True)
+class AssetBundle:
+    css: str
+    js: str
+
+    @property
+    def css_name(self) -> str:
+        return asset_file_name(self.css, ".css")
+
+    @property
+    def js_name(self) -> str:
+        return asset_file_name(self.js, ".js")
+
+    def files(self) -> dict[str, bytes]:
+        """Site-relative path -> content, for common/site_manifest.py."""
+        return {
+            f"{ASSET_DIR}/{self.css_name}": self.css.encode("utf-8"),
+            f"{ASSET_DIR}/{self.js_name}": self.js.encode("utf-8"),
+        }
+
+    def links(self, base: str) -> AssetLinks:
+        """Hrefs for a page whose site root is ``base`` ("./" or "../")."""
+        return AssetLinks(
+            css=f"{base}{ASSET_DIR}/{self.css_name}",
+            js=f"{base}{ASSET_DIR}/{self.js_name}",
+        )
+
+
+def build_asset_bundle() -> AssetBundle:
+    return AssetBundle(
+        css=minify_css(SHARED_CSS + PAGE_CSS + HUB_CSS),
+        js=minify_js(page_script()),
+    )
@@ -0,0 +1,198 @@
+"""Content-hash incremental cache for extractor outputs.
+
+Each extraction stage declares the files it reads as glob patterns relative
+to the repo root. Its records are stored under a digest of those files'
+contents, the reference pipeline's own source (the parser code version), and
+an optional cheap salt. A rebuild re-runs only the stages whose inputs or
+parser code changed and reuses the stored records for the rest.
+
+A stage that runs external tools also stores their version string (e.g.
+``wezterm --version``) with its records. Spawning a tool just to read its
+version would dominate a warm run, so a hit only compares each executable's
+path, size and mtime (tool_stamp); the version is read only when the inputs
+digest misses or a stamp changed, and an unchanged version keeps the records.
+
+Stages that parse each input file on its own (zsh, shortcuts, claude) store
+records per file instead (records_per_input): each file's entry is keyed by
+the digest of that file alone, so editing one file re-parses only it and the
+stage's records are re-merged from the stored per-file entries.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import shutil
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from pathlib import Path
+from typing import TypedDict, TypeGuard
+
+from common.cache import cache_dir, file_digest, read_keyed_json, write_keyed_json
+
+Records = list[dict[str, str]]
+
+
+class Entry(TypedDict):
+    stamp: str
+    version: str
+    records: Records
+
+
+class InputEntry(TypedDict):
+    digest: str
+    records: Records
+
+
+REFERENCE_DIR = Path(__file__).resolve().parents[1]
+
+
+def code_version(reference_dir: Path = REFERENCE_DIR) -> str:
+    """Digest every pipeline source file except the tests."""
+    sources = [
+        path
+        for path in sorted(reference_dir.rglob("*"))
+        if path.suffix in {".py", ".lua"} and "tests" not in path.parts
+    ]
+    return file_digest(*sources)
+
+
+def expand_inputs(root: Path, patterns: Sequence[str]) -> list[Path]:
+    files: set[Path] = set()
+    for pattern in patterns:
+        files.update(match for match in root.glob(pattern) if match.is_file())
+    return sorted(files)
+
+
+def inputs_digest(root: Path, inputs: Iterable[Path], salt: str = "") -> str:
+    """Hash (relative path, content) pairs so renames and edits both count."""
+    digest = hashlib.sha256(salt.encode("utf-8"))
+    for path in inputs:
+        digest.update(path.relative_to(root).as_posix().encode("utf-8") + b"\0")
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def tool_stamp(tools: Iterable[str]) -> str:
+    """Resolved path, size and mtime of each executable, without running it."""
+    parts: list[str] = []
+    for tool in tools:
+        found = shutil.which(tool)
+        try:
+            stat = Path(found).resolve().stat() if found else None
+        except OSError:
+            stat = None
+        if stat is None:
+            parts.append(f"{tool}:missing")
+        else:
+            parts.append(f"{found}:{stat.st_size}:{stat.st_mtime_ns}")
+    return "\n".join(parts)
+
+
+def _is_records(value: object) -> TypeGuard[Records]:
+    return isinstance(value, list) and all(isinstance(item, dict) for item in value)
+
+
+def _is_input_entry(value: object) -> TypeGuard[InputEntry]:
+    return (
+        isinstance(value, dict)
+        and isinstance(value.get("digest"), str)
+        and _is_records(value.get("records"))
+    )
+
+
+def _is_entry(value: object) -> TypeGuard[Entry]:
+    return (
+        isinstance(value, dict)
+        and isinstance(value.get("stamp"), str)
+        and isinstance(value.get("version"), str)
+        and _is_records(value.get("records"))
+    )
+
+
+class BuildCache:
+    """Per-stage record cache rooted at ``$XDG_CACHE_HOME/dotfiles/reference``."""
+
+    def __init__(self, root: Path, directory: Path | None = None) -> None:
+        self.root = root
+        self.directory = directory or cache_dir() / "reference"
+        self.code = code_version()
+        self.hits: list[str] = []
+
+    def path_for(self, name: str) -> Path:
+        return self.directory / f"{name.replace(':', '-')}.json"
+
+    def records(
+        self,
+        name: str,
+        patterns: Sequence[str],
+        compute: Callable[[], Records],
+        *,
+        salt: str = "",
+        tools: Sequence[str] = (),
+        version: Callable[[], str] | None = None,
+    ) -> Records:
+        """Return cached records for ``name`` or compute and store them.
+
+        ``version`` is called only when the inputs digest misses or the stamp
+        of one of ``tools`` changed since the records were stored.
+        """
+        key = inputs_digest(
+            self.root, expand_inputs(self.root, patterns), f"{self.code}:{salt}"
+        )
+        stamp = tool_stamp(tools)
+        path = self.path_for(name)
+        cached = read_keyed_json(path, key)
+        if _is_entry(cached):
+            if cached["stamp"] == stamp:
+                self.hits.append(name)
+                return cached["records"]
+            current = version() if version is not None else ""
+            if cached["version"] == current:
+                write_keyed_json(path, key, {**cached, "stamp": stamp})
+                self.hits.append(name)
+                return cached["records"]
+        else:
+            current = version() if version is not None else ""
+
+        records = compute()
+        entry: Entry = {"stamp": stamp, "version": current, "records": records}
+        write_keyed_json(path, key, entry)
+        return records
+
+    def records_per_input(
+        self,
+        name: str,
+        patterns: Sequence[str],
+        parse: Callable[[Path], Records],
+        combine: Callable[[Mapping[Path, Records]], Records],
+        *,
+        salt: str = "",
+    ) -> Records:
+        """Parse only the inputs whose content changed, then ``combine`` all.
+
+        ``parse`` returns the records of one input file; ``combine`` receives
+        every input's records in sorted path order and returns the stage's.
+        """
+        salt = f"{self.code}:{salt}"
+        path = self.path_for(name)
+        cached = read_keyed_json(path, salt)
+        stored = cached if isinstance(cached, dict) else {}
+        entries: dict[str, InputEntry] = {}
+        by_file: dict[Path, Records] = {}
+        parsed = 0
+        for input_path in expand_inputs(self.root, patterns):
+            rel_path = input_path.relative_to(self.root).as_posix()
+            digest = inputs_digest(self.root, [input_path], salt)
+            entry = stored.get(rel_path)
+            if _is_input_entry(entry) and entry["digest"] == digest:
+                records = entry["records"]
+            else:
+                records = parse(input_path)
+                parsed += 1
+            entries[rel_path] = {"digest": digest, "records": records}
+            by_file[input_path] = records
+
+        if parsed or entries.keys() != stored.keys():
+            write_keyed_json(path, salt, entries)
+        if not parsed:
+            self.hits.append(name)
+        return combine(by_file)
@@ -0,0 +1,61 @@
+"""Persistent, keyed JSON caches under ``$XDG_CACHE_HOME/dotfiles/``.
+
+Each cache file stores one payload together with the key it was computed
+for (a tool version, a content hash, ...). A lookup with a different key is
+a miss, so stale entries are simply overwritten on the next write. Caches are
+best-effort: unreadable or unwritable files never fail a build.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from types import ModuleType
+
+
+def cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "dotfiles"
+
+
+def file_digest(*paths: Path) -> str:
+    """Hash the contents of ``paths`` in order."""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def source_digest(*modules: ModuleType) -> str:
+    """Hash the source files of parser modules so code changes invalidate caches."""
+    return file_digest(
+        *(Path(module.__file__) for module in modules if module.__file__ is not None)
+    )
+
+
+def read_keyed_json(path: Path, key: str) -> object | None:
+    """Return the cached payload when it was stored under ``key``, else None."""
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(raw, dict) or raw.get("key") != key:
+        return None
+    payload: object = raw.get("payload")
+    return payload
+
+
+def write_keyed_json(path: Path, key: str, payload: object) -> None:
+    """Atomically store ``payload`` under ``key``; errors are ignored."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=path.parent, delete=False, suffix=".tmp"
+        ) as handle:
+            json.dump({"key": key, "payload": payload}, handle, ensure_ascii=False)
+        os.replace(handle.name, path)
+    except OSError:
+        return
@@ -0,0 +1,63 @@
+"""Columnar, dictionary-encoded payload for page records.
+
+A list of record dicts repeats every key in every row, and most fields (tool,
+mode, origin, change, ...) only take a handful of values. The columnar form
+stores each field name once; a field with few distinct values becomes a
+dictionary plus one integer code per row, the rest a plain value list::
+
+    {"length": 2,
+     "columns": {"tool": {"dict": ["zsh"], "codes": [0, 0]},
+                 "key": {"values": ["^R", "^A"]}}}
+
+Missing fields are stored as empty strings, like common/record_table.py.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+Record = dict[str, str]
+Column = dict[str, list[str] | list[int]]
+ColumnarPayload = dict[str, object]
+
+
+def _field_order(records: Sequence[Record]) -> list[str]:
+    fields: dict[str, None] = {}
+    for record in records:
+        fields.update(dict.fromkeys(record))
+    return list(fields)
+
+
+def _encode_column(values: list[str]) -> Column:
+    codes: dict[str, int] = {}
+    for value in values:
+        codes.setdefault(value, len(codes))
+    # A dictionary only pays off when values repeat.
+    if len(codes) * 2 > len(values):
+        return {"values": values}
+    return {"dict": list(codes), "codes": [codes[value] for value in values]}
+
+
+def encode_columnar(records: Sequence[Record]) -> ColumnarPayload:
+    columns = {
+        name: _encode_column([record.get(name, "") for record in records])
+        for name in _field_order(records)
+    }
+    return {"length": len(records), "columns": columns}
+
+
+def decode_columnar(payload: ColumnarPayload) -> list[Record]:
+    """Inverse of encode_columnar (missing fields come back as "")."""
+    length = payload["length"]
+    columns = payload["columns"]
+    if not isinstance(length, int) or not isinstance(columns, dict):
+        raise TypeError("not a columnar payload")
+    records: list[Record] = [{} for _ in range(length)]
+    for name, column in columns.items():
+        if "dict" in column:
+            values = [column["dict"][code] for code in column["codes"]]
+        else:
+            values = column["values"]
+        for record, value in zip(records, values, strict=True):
+            record[name] = value
+    return records
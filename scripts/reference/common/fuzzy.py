@@ -0,0 +1,148 @@
+"""Fuzzy, ranked record search shared by the TSV output and the HTML page.
+
+A query is split on whitespace into terms, and every term has to occur as a
+subsequence of one of the search fields (like fzf's extended mode). Each
+term is scored fzf-v1 style: the first subsequence match found left to
+right is shrunk back from its end to the shortest window, then every matched
+character earns SCORE_MATCH plus a bonus at word boundaries and inside runs
+(a run keeps the bonus of its first character, so "split" in "split pane"
+beats "s-p-l-i-t"), and every skipped character in the window costs a gap
+penalty. A record's
+score is the sum over terms of its best field score times that field's
+weight; records are ranked by score, then by their original order.
+
+common/render_html.py embeds these constants next to a line-for-line port of
+fuzzy_score, so the page and ``render.py --tsv --query`` rank alike.
+"""
+
+from __future__ import annotations
+
+import string
+from collections.abc import Iterable, Sequence
+
+from common.page_config import SearchField
+
+Record = dict[str, str]
+
+SCORE_MATCH = 16
+SCORE_GAP_START = -3
+SCORE_GAP_EXTENSION = -1
+BONUS_BOUNDARY = 8
+BONUS_CONSECUTIVE = 4
+BONUS_FIRST_CHAR_MULTIPLIER = 2
+
+_WORD_CHARS = frozenset(string.ascii_lowercase + string.digits)
+
+
+def query_terms(query: str) -> list[str]:
+    return query.lower().split()
+
+
+def char_mask(text: str) -> int:
+    """Bitset of the ASCII letters and digits in ``text``.
+
+    A record whose mask lacks a bit of the term's mask cannot match it, which
+    rejects most records before any scoring. Digits share five bits.
+    """
+    mask = 0
+    for char in set(text):
+        if "a" <= char <= "z":
+            mask |= 1 << (ord(char) - 97)
+        elif "0" <= char <= "9":
+            mask |= 1 << (26 + (ord(char) - 48) % 5)
+    return mask
+
+
+def fuzzy_score(term: str, text: str) -> int | None:
+    """Score a lowercased ``term`` against lowercased ``text``; None = no match.
+
+    Matches always score at least 1, so field weights never invert the order.
+    """
+    # The leftmost match fixes where the earliest complete match ends ...
+    end = -1
+    for char in term:
+        end = text.find(char, end + 1)
+        if end < 0:
+            return None
+    # ... and walking back from there finds the latest start: the shortest
+    # window ending at ``end``.
+    start = end + 1
+    for char in reversed(term):
+        start = text.rfind(char, 0, start)
+
+    score = 0
+    run_bonus = 0
+    index = start - 1
+    for position, char in enumerate(term):
+        previous = index
+        index = text.find(char, index + 1)
+        gap = index - previous - 1 if position > 0 else 0
+        if gap > 0:
+            score += SCORE_GAP_START + (gap - 1) * SCORE_GAP_EXTENSION
+        boundary = index == 0 or text[index - 1] not in _WORD_CHARS
+        bonus = BONUS_BOUNDARY if boundary else 0
+        if position > 0 and gap == 0:
+            bonus = max(bonus, run_bonus, BONUS_CONSECUTIVE)
+        else:
+            run_bonus = bonus
+        if position == 0:
+            bonus *= BONUS_FIRST_CHAR_MULTIPLIER
+        score += SCORE_MATCH + bonus
+    return max(score, 1)
+
+
+class FuzzyIndex:
+    """Precomputed search structures, built once per record set.
+
+    Field values repeat a lot (sources, tools, shared descriptions), so each
+    field's lowercased texts are interned with their character masks. A query
+    is evaluated one term and one field at a time: every distinct text that
+    a remaining record uses is scored once, and records pick their scores up
+    by code. Records dropped by one term are not looked at by the next.
+    """
+
+    def __init__(self, records: Sequence[Record], fields: Sequence[SearchField]):
+        self._count = len(records)
+        self._fields: list[tuple[list[str], list[int], list[int], int]] = []
+        for field in fields:
+            interned: dict[str, int] = {}
+            codes = [
+                interned.setdefault(record.get(field.name, "").lower(), len(interned))
+                for record in records
+            ]
+            texts = list(interned)
+            masks = [char_mask(text) for text in texts]
+            self._fields.append((texts, masks, codes, field.weight))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def search(self, query: str, candidates: Iterable[int] | None = None) -> list[int]:
+        """Indices of matching records, best first (all of them for no terms)."""
+        pool = list(range(self._count) if candidates is None else candidates)
+        terms = query_terms(query)
+        if not terms:
+            return pool
+        totals = [0] * len(pool)
+        for term in terms:
+            term_mask = char_mask(term)
+            bests = [0] * len(pool)
+            for texts, masks, codes, weight in self._fields:
+                pool_codes = [codes[index] for index in pool]
+                scores = [0] * len(texts)
+                for code in set(pool_codes):
+                    if not term_mask & ~masks[code]:
+                        scores[code] = (fuzzy_score(term, texts[code]) or 0) * weight
+                bests = list(map(max, bests, map(scores.__getitem__, pool_codes)))
+            kept = [position for position, best in enumerate(bests) if best]
+            pool = [pool[position] for position in kept]
+            totals = [totals[position] + bests[position] for position in kept]
+        order = sorted(range(len(pool)), key=lambda k: (-totals[k], pool[k]))
+        return [pool[k] for k in order]
+
+
+def rank_records(
+    records: Sequence[Record], query: str, fields: Sequence[SearchField]
+) -> list[Record]:
+    """Records matching ``query``, best first."""
+    return [records[index] for index in FuzzyIndex(records, fields).search(query)]
@@ -41,6 +41,29 @@ class Filter:
     default: tuple[str, ...] = ()
 
 
+@dataclass(frozen=True)
+class SearchField:
+    """One searchable field.
+
+    weight: multiplies the field's fuzzy match score, so a match in a heavy
+            field (a key or a name) ranks above the same match in a light one
+            (a source path). Substring search ignores it.
+    """
+
+    name: str
+    weight: int = 1
+
+
+def search_field_specs(
+    fields: tuple[str | SearchField, ...],
+) -> tuple[SearchField, ...]:
+    """Normalize PageConfig.search_fields; a bare name has weight 1."""
+    return tuple(
+        field if isinstance(field, SearchField) else SearchField(field)
+        for field in fields
+    )
+
+
 @dataclass(frozen=True)
 class NavLink:
     label: str
@@ -48,12 +71,66 @@ class NavLink:
     active: bool = False
 
 
+@dataclass(frozen=True)
+class AssetLinks:
+    """Hrefs of the shared site stylesheet and page script (common/assets.py)."""
+
+    css: str
+    js: str
+
+
 @dataclass(frozen=True)
 class PageConfig:
+    """One reference page.
+
+    table_mode:
+      - "full": every matching row is a DOM node
+      - "virtual": only the rows visible in the scroll area are rendered, from
+        a recycled pool of row nodes; rows are fixed at row_height pixels and
+        wrap cells are truncated to one line
+      - "auto" (default): "virtual" once the page has at least
+        VIRTUAL_AUTO_MIN_RECORDS records (common/render_html.py), else "full"
+
+    search_fields: field names or SearchField entries (names with weights).
+
+    search_mode:
+      - "substring" (default): rows containing the query, in data order
+      - "fuzzy": every whitespace-separated term must match a field as a
+        subsequence; rows are ranked by a weighted score (common/fuzzy.py)
+
+    search_index:
+      - "none": the search box scans every record's lowercased haystack
+        (search_fields joined, built once at page load)
+      - "trigram": a trigram -> records inverted index, also built at load;
+        queries of 3+ characters only check records holding every trigram
+        (substring search only)
+      - "auto" (default): "trigram" from TRIGRAM_AUTO_MIN_RECORDS records
+        for substring search, else "none"
+
+    data_encoding:
+      - "rows": records are embedded as a list of objects
+      - "columnar": field names once, low-cardinality fields dictionary-encoded
+        as integer codes (common/columnar.py); cells are decoded on demand
+      - "auto" (default): whichever of the two serializes smaller
+
+    search_thread:
+      - "main": queries run in the input handler on the main thread
+      - "worker": queries run in a Web Worker holding the haystacks and the
+        trigram index; the main thread only renders, and answers to queries
+        superseded by newer keystrokes are dropped
+      - "auto" (default): "worker" from WORKER_AUTO_MIN_RECORDS records
+    """
+
     title: str
     columns: tuple[Column, ...]
     filters: tuple[Filter, ...]
-    search_fields: tuple[str, ...]
+    search_fields: tuple[str | SearchField, ...]
     badge_classes: dict[str, str] = field(default_factory=dict)
     nav: tuple[NavLink, ...] = ()
     note: str = ""
+    table_mode: str = "auto"
+    row_height: int = 24
+    search_index: str = "auto"
+    data_encoding: str = "auto"
+    search_thread: str = "auto"
+    search_mode: str = "substring"
@@ -0,0 +1,57 @@
+"""Page records as a separate, content-hashed data file.
+
+In split-data mode a page's records are written next to its index.html as
+``data.<hash>.json`` instead of being inlined into the HTML. The name changes
+whenever the records do, so browsers can keep the file cached across visits
+and only the small HTML shell is re-fetched. Precompressed ``.gz`` and ``.br``
+siblings are written for servers that can serve them directly (see
+common/precompress.py).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+
+from common.precompress import write_brotli, write_gzip
+
+DATA_GLOB = "data.*.json*"
+_HASH_LENGTH = 16
+
+
+def encode_page_data(payload: object) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode(
+        "utf-8"
+    )
+
+
+def data_file_name(payload: bytes) -> str:
+    digest = hashlib.sha256(payload).hexdigest()[:_HASH_LENGTH]
+    return f"data.{digest}.json"
+
+
+def write_page_data(payload: object, out_dir: Path) -> str:
+    """Write the data file and its compressed siblings; return its name.
+
+    ``payload`` is what the page expects in DATA: the records, or their
+    columnar form (common/render_html.page_payload). A file whose name is
+    already present is left untouched (same name, same content), and data
+    files from earlier builds are removed.
+    """
+    encoded = encode_page_data(payload)
+    name = data_file_name(encoded)
+    path = out_dir / name
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    if not path.exists():
+        path.write_bytes(encoded)
+        write_gzip(path)
+    if not (out_dir / f"{name}.br").exists():
+        write_brotli(path)
+
+    current = {name, f"{name}.gz", f"{name}.br"}
+    for stale in out_dir.glob(DATA_GLOB):
+        if stale.name not in current:
+            stale.unlink()
+    return name
@@ -0,0 +1,103 @@
+"""Concurrent execution of independent extraction stages.
+
+Stages that spawn an external process (wezterm, nvim, mise) spend their time
+blocked on the child, so they run on a thread pool while pure-Python parsing
+stages run on the calling thread in the meantime. Wall-clock cost is then
+close to the slowest stage instead of the sum of all of them.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from common.build_cache import BuildCache
+from common.timing import StageTimer
+
+Records = list[dict[str, str]]
+
+# Enough workers for every process-spawning stage (wezterm, nvim, mise) at
+# once. The workers only wait on children, so this is independent of CPU count.
+DEFAULT_JOBS = 4
+
+
+@dataclass(frozen=True)
+class ExtractStage:
+    """One extractor.
+
+    inputs: glob patterns (relative to the repo root) of every file the
+            extractor reads; stages without inputs are never cached.
+    salt: returns a cheap extra cache key component computed on every run,
+          e.g. whether an optional directory exists.
+    tools: executables the extractor runs; a cache hit checks only their
+           path, size and mtime (common/build_cache.py:tool_stamp).
+    version: returns the tools' version, e.g. their --version output; called
+             only when the inputs or a tool stamp changed.
+    parse_input, combine: set both to cache records per input file
+                          (common/build_cache.py:records_per_input); ``run``
+                          is then used only without a cache.
+    """
+
+    name: str
+    run: Callable[[], Records]
+    spawns_process: bool = False
+    inputs: tuple[str, ...] = ()
+    salt: Callable[[], str] | None = None
+    tools: tuple[str, ...] = ()
+    version: Callable[[], str] | None = None
+    parse_input: Callable[[Path], Records] | None = None
+    combine: Callable[[Mapping[Path, Records]], Records] | None = None
+
+
+def _run_timed(
+    stage: ExtractStage, timer: StageTimer, cache: BuildCache | None
+) -> Records:
+    with timer.stage(stage.name):
+        if cache is None or not stage.inputs:
+            return stage.run()
+        salt = stage.salt() if stage.salt is not None else ""
+        if stage.parse_input is not None and stage.combine is not None:
+            return cache.records_per_input(
+                stage.name, stage.inputs, stage.parse_input, stage.combine, salt=salt
+            )
+        return cache.records(
+            stage.name,
+            stage.inputs,
+            stage.run,
+            salt=salt,
+            tools=stage.tools,
+            version=stage.version,
+        )
+
+
+def run_extract_stages(
+    stages: Sequence[ExtractStage],
+    timer: StageTimer,
+    jobs: int,
+    cache: BuildCache | None = None,
+) -> dict[str, Records]:
+    """Run stages and return their records keyed by stage name.
+
+    ``jobs <= 1`` runs every stage serially in declaration order. Otherwise up
+    to ``jobs`` process-spawning stages run concurrently on worker threads.
+    With a cache, stages whose inputs are unchanged reuse their stored records.
+    """
+    if jobs <= 1:
+        return {stage.name: _run_timed(stage, timer, cache) for stage in stages}
+
+    results: dict[str, Records] = {}
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        pending: dict[str, Future[Records]] = {
+            stage.name: pool.submit(_run_timed, stage, timer, cache)
+            for stage in stages
+            if stage.spawns_process
+        }
+        for stage in stages:
+            if not stage.spawns_process:
+                results[stage.name] = _run_timed(stage, timer, cache)
+        for name, future in pending.items():
+            results[name] = future.result()
+
+    return {stage.name: results[stage.name] for stage in stages}
@@ -0,0 +1,38 @@
+"""Precompressed ``.gz`` and ``.br`` siblings for static site files.
+
+Servers that support precompressed files (nginx ``gzip_static``, miniserve,
+most CDNs) send these instead of compressing every response. ``.br`` needs
+the ``brotli`` command and is skipped when it is not on PATH.
+"""
+
+from __future__ import annotations
+
+import gzip
+import shutil
+import subprocess
+from pathlib import Path
+
+
+def write_gzip(path: Path) -> int:
+    """Write ``<path>.gz`` and return its size."""
+    # mtime=0 keeps the gzip bytes reproducible across builds.
+    compressed = gzip.compress(path.read_bytes(), compresslevel=9, mtime=0)
+    Path(f"{path}.gz").write_bytes(compressed)
+    return len(compressed)
+
+
+def brotli_available() -> bool:
+    return shutil.which("brotli") is not None
+
+
+def write_brotli(path: Path) -> int | None:
+    """Write ``<path>.br`` and return its size; None without ``brotli``."""
+    brotli = shutil.which("brotli")
+    if brotli is None:
+        return None
+    target = Path(f"{path}.br")
+    subprocess.run(
+        [brotli, "--force", "--best", f"--output={target}", "--", str(path)],
+        check=True,
+    )
+    return target.stat().st_size
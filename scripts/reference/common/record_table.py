@@ -0,0 +1,207 @@
+"""Compact columnar record cache that can be memory-mapped.
+
+Records share few distinct strings (tool, mode, origin, source paths, ...),
+so every string is stored once in a table and each row is a fixed-width run
+of indices into it. Reading a table does not parse JSON: it maps the file and
+decodes only the strings that are actually requested.
+
+Layout (little-endian)::
+
+    header    magic "RTB1", u16 version, u16 index width (2 or 4),
+              u32 field count, u32 row count, u32 string count, 4 pad bytes
+    fields    u32 string index per field name
+    offsets   u32 byte offset per string into the blob, plus the end offset
+    rows      row count x field count indices of the index width
+    blob      UTF-8 string bytes
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from pathlib import Path
+from types import TracebackType
+from typing import Literal, Self
+
+Record = dict[str, str]
+
+MAGIC = b"RTB1"
+VERSION = 1
+_HEADER = struct.Struct("<4sHHIII4x")
+
+
+def _le_array(typecode: str, values: Iterable[int]) -> array[int]:
+    packed = array(typecode, values)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed
+
+
+def _field_order(records: Sequence[Record]) -> list[str]:
+    fields: dict[str, None] = {}
+    for record in records:
+        fields.update(dict.fromkeys(record))
+    return list(fields)
+
+
+def encode_record_table(
+    records: Iterable[Record], fields: Sequence[str] | None = None
+) -> bytes:
+    """Encode records; missing fields are stored as empty strings."""
+    rows = list(records)
+    columns = list(fields) if fields is not None else _field_order(rows)
+
+    strings: dict[str, int] = {}
+
+    def intern(value: str) -> int:
+        return strings.setdefault(value, len(strings))
+
+    field_ids = [intern(name) for name in columns]
+    cells = [intern(record.get(name, "")) for record in rows for name in columns]
+
+    index_width = 2 if len(strings) <= 0xFFFF else 4
+    blob = bytearray()
+    offsets = [0]
+    for value in strings:
+        blob += value.encode("utf-8")
+        offsets.append(len(blob))
+
+    header = _HEADER.pack(
+        MAGIC, VERSION, index_width, len(columns), len(rows), len(strings)
+    )
+    return b"".join(
+        (
+            header,
+            _le_array("I", field_ids).tobytes(),
+            _le_array("I", offsets).tobytes(),
+            _le_array("H" if index_width == 2 else "I", cells).tobytes(),
+            bytes(blob),
+        )
+    )
+
+
+def write_record_table(
+    path: Path, records: Iterable[Record], fields: Sequence[str] | None = None
+) -> bool:
+    """Write a table unless ``path`` already holds the same bytes."""
+    data = encode_record_table(records, fields)
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return True
+
+
+def is_record_table(path: Path) -> bool:
+    try:
+        with path.open("rb") as handle:
+            return handle.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def _cast(view: memoryview, typecode: Literal["H", "I"]) -> Sequence[int]:
+    if sys.byteorder == "little":
+        return view.cast(typecode)
+    swapped = array(typecode, view.tobytes())
+    swapped.byteswap()
+    return swapped
+
+
+class RecordTable:
+    """Read-only view over an encoded table (bytes or an mmap)."""
+
+    def __init__(self, buffer: bytes | mmap.mmap) -> None:
+        self._buffer = buffer
+        view = memoryview(buffer)
+        magic, version, index_width, field_count, row_count, string_count = (
+            _HEADER.unpack_from(view)
+        )
+        if magic != MAGIC or version != VERSION or index_width not in {2, 4}:
+            raise ValueError("not a record table (or an unsupported version)")
+
+        start = _HEADER.size
+        field_ids = _cast(view[start : start + 4 * field_count], "I")
+        start += 4 * field_count
+        self._offsets = _cast(view[start : start + 4 * (string_count + 1)], "I")
+        start += 4 * (string_count + 1)
+        rows_size = index_width * row_count * field_count
+        self._cells = _cast(
+            view[start : start + rows_size], "H" if index_width == 2 else "I"
+        )
+        self._blob = view[start + rows_size :]
+        self._strings: list[str | None] = [None] * string_count
+        self._row_count: int = row_count
+        self.fields = tuple(self.string(index) for index in field_ids)
+
+    @classmethod
+    def open(cls, path: Path) -> RecordTable:
+        with path.open("rb") as handle:
+            return cls(mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def close(self) -> None:
+        # Views into the mapping must be released before it can close.
+        del self._offsets, self._cells, self._blob
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._row_count
+
+    def string(self, index: int) -> str:
+        cached = self._strings[index]
+        if cached is None:
+            raw = self._blob[self._offsets[index] : self._offsets[index + 1]]
+            cached = bytes(raw).decode("utf-8")
+            self._strings[index] = cached
+        return cached
+
+    def find_string(self, value: str) -> int | None:
+        encoded = value.encode("utf-8")
+        for index in range(len(self._strings)):
+            if self._blob[self._offsets[index] : self._offsets[index + 1]] == encoded:
+                return index
+        return None
+
+    def row(self, row_index: int) -> Record:
+        width = len(self.fields)
+        base = row_index * width
+        return {
+            name: self.string(self._cells[base + column])
+            for column, name in enumerate(self.fields)
+        }
+
+    def records(self, where: Mapping[str, str] | None = None) -> Iterator[Record]:
+        """Yield rows, optionally only those whose fields equal ``where``.
+
+        Filters compare string indices, so non-matching rows are never decoded.
+        """
+        width = len(self.fields)
+        wanted: list[tuple[int, int]] = []
+        for name, value in (where or {}).items():
+            index = self.find_string(value)
+            if name not in self.fields or index is None:
+                return
+            wanted.append((self.fields.index(name), index))
+
+        for row_index in range(self._row_count):
+            base = row_index * width
+            if all(self._cells[base + column] == index for column, index in wanted):
+                yield self.row(row_index)
@@ -0,0 +1,84 @@
+"""Record stream I/O shared by the extract, validate, and render CLIs.
+
+Two wire formats are supported:
+
+- ``json``: one indented array (the default, human-readable)
+- ``jsonl``: one compact object per line, so a consumer can process records
+  as they arrive without holding the whole document
+
+Readers detect the format from the first non-blank character, so
+``validate.py`` and ``render.py`` accept either without a flag.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from collections.abc import Iterable, Iterator
+from typing import TextIO
+
+Record = dict[str, str]
+
+RECORD_FORMATS = ("json", "jsonl")
+
+
+def format_records(records: Iterable[Record], fmt: str = "json") -> str:
+    if fmt == "jsonl":
+        return "".join(
+            json.dumps(record, ensure_ascii=False) + "\n" for record in records
+        )
+    return json.dumps(list(records), indent=2, ensure_ascii=False) + "\n"
+
+
+def dump_records(records: Iterable[Record], out: TextIO, fmt: str = "json") -> None:
+    """Write records to ``out``; jsonl is written one line per record."""
+    if fmt != "jsonl":
+        out.write(format_records(records, fmt))
+        return
+    for record in records:
+        out.write(json.dumps(record, ensure_ascii=False))
+        out.write("\n")
+
+
+def _as_record(value: object, where: str) -> Record:
+    if not isinstance(value, dict):
+        raise TypeError(f"{where}: record must be a JSON object")
+    return value
+
+
+def iter_records(stream: TextIO) -> Iterator[Record]:
+    """Yield records from a JSON array or a JSONL stream.
+
+    JSONL input is decoded one line at a time. A JSON array has to be parsed
+    as a whole and is then yielded record by record.
+    """
+    first_line = ""
+    first_number = 0
+    for first_number, line in enumerate(stream, start=1):
+        if line.strip():
+            first_line = line
+            break
+    if not first_line:
+        return
+
+    if first_line.lstrip().startswith("["):
+        loaded = json.loads(first_line + stream.read())
+        if not isinstance(loaded, list):
+            raise TypeError("input JSON must be an array")
+        for index, item in enumerate(loaded):
+            yield _as_record(item, f"record[{index}]")
+        return
+
+    yield _as_record(json.loads(first_line), f"line {first_number}")
+    for number, line in enumerate(stream, start=first_number + 1):
+        if line.strip():
+            yield _as_record(json.loads(line), f"line {number}")
+
+
+def read_records(input_path: str | None) -> Iterator[Record]:
+    """Stream records from ``input_path`` (or stdin for None / ``-``)."""
+    if input_path is None or input_path == "-":
+        yield from iter_records(sys.stdin)
+        return
+    with open(input_path, encoding="utf-8") as handle:
+        yield from iter_records(handle)
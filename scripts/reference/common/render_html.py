@@ -2,8 +2,9 @@
 
 Domain-agnostic: the table columns, chip filters, search fields, badge
 colours, and top navigation all come from a PageConfig. Records are embedded
-as JSON and the table is built client-side with textContent, so record values
-never reach the static HTML as markup.
+as JSON (or, with ``data_url``, fetched from a separate data file after the
+page shell is shown) and the table is built client-side with textContent, so
+record values never reach the static HTML as markup.
 """
 
 from __future__ import annotations
@@ -11,7 +12,25 @@ from __future__ import annotations
 import html
 import json
 
-from common.page_config import PageConfig
+from common import fuzzy
+from common.columnar import encode_columnar
+from common.page_config import AssetLinks, PageConfig, search_field_specs
+from common.site_style import SHARED_CSS
+
+TABLE_MODES = ("auto", "full", "virtual")
+SEARCH_INDEXES = ("auto", "none", "trigram")
+DATA_ENCODINGS = ("auto", "rows", "columnar")
+SEARCH_THREADS = ("auto", "main", "worker")
+SEARCH_MODES = ("substring", "fuzzy")
+
+# Below this many records a fully rendered table stays responsive.
+VIRTUAL_AUTO_MIN_RECORDS = 1000
+# Below this many records a linear scan of the haystacks is fast enough that
+# building a trigram index at page load does not pay for itself.
+TRIGRAM_AUTO_MIN_RECORDS = 2000
+# Below this many records an indexed, narrowing search finishes well within a
+# frame, so posting queries to a worker only adds latency.
+WORKER_AUTO_MIN_RECORDS = 10000
 
 
 def _embed_json(value: object) -> str:
@@ -29,6 +48,62 @@ def _derive_filter_values(records: list[dict[str, str]], field: str) -> list[str
     return sorted(values)
 
 
+def resolve_table_mode(config: PageConfig, record_count: int) -> str:
+    """Return "full" or "virtual" for a page with ``record_count`` records."""
+    if config.table_mode not in TABLE_MODES:
+        raise ValueError(f"unknown table_mode: {config.table_mode!r}")
+    if config.table_mode != "auto":
+        return config.table_mode
+    return "virtual" if record_count >= VIRTUAL_AUTO_MIN_RECORDS else "full"
+
+
+def resolve_search_mode(config: PageConfig) -> str:
+    if config.search_mode not in SEARCH_MODES:
+        raise ValueError(f"unknown search_mode: {config.search_mode!r}")
+    return config.search_mode
+
+
+def resolve_search_index(config: PageConfig, record_count: int) -> str:
+    """Return "none" or "trigram" for a page with ``record_count`` records."""
+    if config.search_index not in SEARCH_INDEXES:
+        raise ValueError(f"unknown search_index: {config.search_index!r}")
+    fuzzy_mode = resolve_search_mode(config) == "fuzzy"
+    if config.search_index == "trigram" and fuzzy_mode:
+        # Subsequence matches need not contain any of the query's trigrams.
+        raise ValueError("search_index 'trigram' requires substring search")
+    if config.search_index != "auto":
+        return config.search_index
+    if fuzzy_mode:
+        return "none"
+    return "trigram" if record_count >= TRIGRAM_AUTO_MIN_RECORDS else "none"
+
+
+def resolve_search_thread(config: PageConfig, record_count: int) -> str:
+    """Return "main" or "worker" for a page with ``record_count`` records."""
+    if config.search_thread not in SEARCH_THREADS:
+        raise ValueError(f"unknown search_thread: {config.search_thread!r}")
+    if config.search_thread != "auto":
+        return config.search_thread
+    return "worker" if record_count >= WORKER_AUTO_MIN_RECORDS else "main"
+
+
+def page_payload(records: list[dict[str, str]], config: PageConfig) -> object:
+    """Return the records in the page's data encoding.
+
+    "auto" picks whichever of the row and columnar forms serializes smaller.
+    """
+    if config.data_encoding not in DATA_ENCODINGS:
+        raise ValueError(f"unknown data_encoding: {config.data_encoding!r}")
+    if config.data_encoding == "rows":
+        return records
+    columnar = encode_columnar(records)
+    if config.data_encoding == "columnar":
+        return columnar
+    rows_size = len(json.dumps(records, ensure_ascii=False))
+    columnar_size = len(json.dumps(columnar, ensure_ascii=False))
+    return columnar if columnar_size < rows_size else records
+
+
 def _config_to_js(
     config: PageConfig, records: list[dict[str, str]]
 ) -> dict[str, object]:
@@ -47,13 +122,20 @@ def _config_to_js(
                 "default": list(flt.default),
             }
         )
+    search_fields = search_field_specs(config.search_fields)
     return {
         "columns": [
             {"key": c.key, "label": c.label, "kind": c.kind} for c in config.columns
         ],
         "filters": filters,
-        "searchFields": list(config.search_fields),
+        "searchFields": [spec.name for spec in search_fields],
+        "searchWeights": [spec.weight for spec in search_fields],
+        "searchMode": resolve_search_mode(config),
         "badgeClasses": config.badge_classes,
+        "tableMode": resolve_table_mode(config, len(records)),
+        "rowHeight": config.row_height,
+        "searchIndex": resolve_search_index(config, len(records)),
+        "searchThread": resolve_search_thread(config, len(records)),
     }
 
 
@@ -84,140 +166,91 @@ def _nav_html(config: PageConfig) -> str:
     return f"<nav class='top-nav'>{links}</nav>"
 
 
-def render_searchable_html(
-    records: list[dict[str, str]], config: PageConfig, meta: dict[str, str]
-) -> str:
-    """Return a self-contained searchable HTML page for the given records."""
-    data_json = _embed_json(records)
-    config_json = _embed_json(_config_to_js(config, records))
-    title = _escape(config.title)
-    generated_at = _escape(meta.get("generated_at", ""))
-    commit = _escape(meta.get("commit", ""))
-    note = _escape(config.note or meta.get("note", ""))
-    count_items = _meta_count_items(meta)
-    nav = _nav_html(config)
-
-    return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="utf-8">
-<meta name="viewport" content="width=device-width, initial-scale=1">
-<title>{title}</title>
-<style>
-:root {{
-  color-scheme: light dark;
-  font-family: system-ui, -apple-system, "Segoe UI", Roboto, sans-serif;
-  font-size: 13px;
-  line-height: 1.35;
-}}
-* {{ box-sizing: border-box; }}
-body {{ margin: 0; padding: 12px 16px; }}
-header {{ margin-bottom: 12px; }}
-h1 {{ margin: 0 0 8px; font-size: 1.25rem; }}
-.top-nav {{ display: flex; flex-wrap: wrap; gap: 4px 8px; margin-bottom: 8px; }}
-.nav-link {{
-  text-decoration: none; padding: 2px 10px; border-radius: 4px;
-  border: 1px solid #8884; color: inherit; font-size: 12px;
-}}
-.nav-link.active {{ background: #06c; color: #fff; border-color: #06c; }}
-@media (prefers-color-scheme: dark) {{
-  .nav-link.active {{ background: #4a9eff; border-color: #4a9eff; }}
-}}
-.meta {{ display: flex; flex-wrap: wrap; gap: 8px 16px; color: #666; font-size: 12px; }}
-@media (prefers-color-scheme: dark) {{ .meta {{ color: #aaa; }} }}
-.meta-count {{ white-space: nowrap; }}
-.controls {{ display: flex; flex-wrap: wrap; gap: 12px; align-items: flex-start; margin-bottom: 10px; }}
-.filter-group {{ display: flex; flex-direction: column; gap: 4px; }}
-.filter-group > label {{ font-weight: 600; font-size: 11px; text-transform: uppercase; letter-spacing: 0.04em; }}
-.chips {{ display: flex; flex-wrap: wrap; gap: 4px; }}
-.chip {{
+# Page-specific styles; SHARED_CSS (common/site_style.py) goes first.
+PAGE_CSS = """\
+header { margin-bottom: 12px; }
+.meta { display: flex; flex-wrap: wrap; gap: 8px 16px; color: #666; font-size: 12px; }
+@media (prefers-color-scheme: dark) { .meta { color: #aaa; } }
+.meta-count { white-space: nowrap; }
+.controls { display: flex; flex-wrap: wrap; gap: 12px; align-items: flex-start; margin-bottom: 10px; }
+.filter-group { display: flex; flex-direction: column; gap: 4px; }
+.filter-group > label { font-weight: 600; font-size: 11px; text-transform: uppercase; letter-spacing: 0.04em; }
+.chips { display: flex; flex-wrap: wrap; gap: 4px; }
+.chip {
   border: 1px solid #8884; border-radius: 4px; padding: 2px 8px;
   cursor: pointer; user-select: none; font-size: 12px; background: transparent; color: inherit;
-}}
-.chip.active {{ background: #06c; color: #fff; border-color: #06c; }}
-@media (prefers-color-scheme: dark) {{
-  .chip.active {{ background: #4a9eff; border-color: #4a9eff; }}
-}}
-.search-box input {{
+}
+.search-box input {
   width: 240px; padding: 4px 8px; font: inherit;
   border: 1px solid #8884; border-radius: 4px; background: transparent; color: inherit;
-}}
-.count-display {{ font-size: 12px; color: #666; align-self: center; }}
-@media (prefers-color-scheme: dark) {{ .count-display {{ color: #aaa; }} }}
-.table-wrap {{ overflow: auto; max-height: calc(100vh - 190px); border: 1px solid #8884; border-radius: 4px; }}
-table {{ width: 100%; border-collapse: collapse; }}
-th, td {{ padding: 3px 8px; text-align: left; border-bottom: 1px solid #8882; white-space: nowrap; }}
-th {{ position: sticky; top: 0; background: Canvas; z-index: 1; font-size: 11px; text-transform: uppercase; }}
-td.col-wrap {{ white-space: normal; max-width: 320px; overflow: hidden; text-overflow: ellipsis; }}
-.badge {{
+}
+.count-display { font-size: 12px; color: #666; align-self: center; }
+@media (prefers-color-scheme: dark) { .count-display { color: #aaa; } }
+.table-wrap { overflow: auto; max-height: calc(100vh - 190px); border: 1px solid #8884; border-radius: 4px; }
+table { width: 100%; border-collapse: collapse; }
+th, td { padding: 3px 8px; text-align: left; border-bottom: 1px solid #8882; white-space: nowrap; }
+th { position: sticky; top: 0; background: Canvas; z-index: 1; font-size: 11px; text-transform: uppercase; }
+td.col-wrap { white-space: normal; max-width: 320px; overflow: hidden; text-overflow: ellipsis; }
+.virtual table { table-layout: fixed; }
+.virtual td { height: var(--row-height); padding-top: 0; padding-bottom: 0; overflow: hidden; text-overflow: ellipsis; }
+.virtual td.col-wrap { white-space: nowrap; max-width: none; }
+.virtual tr.spacer td { height: auto; padding: 0; border: 0; }
+.badge {
   display: inline-block; padding: 1px 6px; border-radius: 3px;
   font-size: 10px; font-weight: 600; text-transform: uppercase;
-}}
-.badge-green {{ background: #2a7; color: #fff; }}
-.badge-orange {{ background: #e80; color: #fff; }}
-.badge-gray {{ background: #8884; color: inherit; }}
-.badge-blue {{ background: #06c; color: #fff; }}
-.badge-purple {{ background: #84c; color: #fff; }}
-</style>
-</head>
-<body>
-<header>
-  {nav}
-  <h1>{title}</h1>
-  <div class="meta">
-    <span>generated: {generated_at}</span>
-    <span>commit: {commit}</span>
-    {count_items}
-    <span>{note}</span>
-  </div>
-</header>
-<div class="controls" id="controls"></div>
-<div class="table-wrap">
-  <table>
-    <thead><tr id="thead-row"></tr></thead>
-    <tbody id="tbody"></tbody>
-  </table>
-</div>
-<script>
-const DATA = {data_json};
-const CONFIG = {config_json};
+}
+.badge-green { background: #2a7; color: #fff; }
+.badge-orange { background: #e80; color: #fff; }
+.badge-gray { background: #8884; color: inherit; }
+.badge-blue { background: #06c; color: #fff; }
+.badge-purple { background: #84c; color: #fff; }
+"""
 
-let state = {{ filters: {{}}, q: "" }};
+# The page script, generic across domains. The records and the PageConfig are
+# not part of it: the page declares DATA, DATA_URL, and CONFIG beforehand.
+PAGE_JS = """\
+let state = { filters: {}, q: "" };
 
-function parseHash() {{
+function parseHash() {
   const params = new URLSearchParams(location.hash.slice(1));
-  const filters = {{}};
-  for (const f of CONFIG.filters) {{
+  const filters = {};
+  for (const f of CONFIG.filters) {
     const vals = params.getAll(f.field);
     filters[f.field] = vals.length > 0 ? vals : [...f.default];
-  }}
-  return {{ filters, q: params.get("q") || "" }};
-}}
+  }
+  return { filters, q: params.get("q") || "" };
+}
 
-function writeHash() {{
+function writeHash() {
   const params = new URLSearchParams();
-  for (const f of CONFIG.filters) {{
+  for (const f of CONFIG.filters) {
     for (const v of state.filters[f.field] || []) params.append(f.field, v);
-  }}
+  }
   if (state.q) params.set("q", state.q);
   const hash = params.toString();
   history.replaceState(null, "", hash ? "#" + hash : location.pathname);
-}}
+}
 
-function makeChip(label, active, onToggle) {{
+function makeChip(label, onToggle) {
   const btn = document.createElement("button");
   btn.type = "button";
-  btn.className = "chip" + (active ? " active" : "");
+  btn.className = "chip";
   btn.textContent = label;
   btn.addEventListener("click", onToggle);
   return btn;
-}}
+}
 
-function renderControls() {{
+// field -> value -> chip button; controls are built once and then only
+// have their state synced.
+const chipButtons = {};
+const SEARCH_DEBOUNCE_MS = 120;
+let searchTimer = 0;
+
+function buildControls() {
   const controls = document.getElementById("controls");
   controls.replaceChildren();
 
-  for (const f of CONFIG.filters) {{
+  for (const f of CONFIG.filters) {
     const group = document.createElement("div");
     group.className = "filter-group";
     const label = document.createElement("label");
@@ -225,21 +258,15 @@ function renderControls() {{
     group.appendChild(label);
     const chips = document.createElement("div");
     chips.className = "chips";
-    for (const value of f.values) {{
-      const selected = (state.filters[f.field] || []).includes(value);
-      chips.appendChild(makeChip(value, selected, () => {{
-        const cur = state.filters[f.field] || [];
-        state.filters[f.field] = cur.includes(value)
-          ? cur.filter((v) => v !== value)
-          : [...cur, value];
-        writeHash();
-        renderControls();
-        applyFilters();
-      }}));
-    }}
+    chipButtons[f.field] = {};
+    for (const value of f.values) {
+      const chip = makeChip(value, () => toggleChip(f.field, value));
+      chipButtons[f.field][value] = chip;
+      chips.appendChild(chip);
+    }
     group.appendChild(chips);
     controls.appendChild(group);
-  }}
+  }
 
   const searchWrap = document.createElement("div");
   searchWrap.className = "search-box";
@@ -251,12 +278,14 @@ function renderControls() {{
   input.id = "search-input";
   input.placeholder = CONFIG.searchFields.join(", ") + "…";
   input.autocomplete = "off";
-  input.value = state.q;
-  input.addEventListener("input", (e) => {{
+  input.addEventListener("input", (e) => {
     state.q = e.target.value;
-    writeHash();
-    applyFilters();
-  }});
+    clearTimeout(searchTimer);
+    searchTimer = setTimeout(() => {
+      writeHash();
+      applyFilters();
+    }, SEARCH_DEBOUNCE_MS);
+  });
   searchWrap.appendChild(searchLabel);
   searchWrap.appendChild(document.createElement("br"));
   searchWrap.appendChild(input);
@@ -266,80 +295,701 @@ function renderControls() {{
   counter.className = "count-display";
   counter.id = "count-display";
   controls.appendChild(counter);
-}}
+}
 
-function renderHead() {{
+function syncControls() {
+  for (const f of CONFIG.filters) {
+    const sel = state.filters[f.field] || [];
+    for (const [value, chip] of Object.entries(chipButtons[f.field])) {
+      chip.classList.toggle("active", sel.includes(value));
+    }
+  }
+  const input = document.getElementById("search-input");
+  if (input.value !== state.q) input.value = state.q;
+}
+
+function toggleChip(field, value) {
+  const cur = state.filters[field] || [];
+  const on = !cur.includes(value);
+  state.filters[field] = on ? [...cur, value] : cur.filter((v) => v !== value);
+  chipButtons[field][value].classList.toggle("active", on);
+  writeHash();
+  chipMask = computeChipMask();
+  applyFilters();
+}
+
+function renderHead() {
   const row = document.getElementById("thead-row");
   row.replaceChildren();
-  for (const col of CONFIG.columns) {{
+  for (const col of CONFIG.columns) {
     const th = document.createElement("th");
     th.textContent = col.label;
     row.appendChild(th);
-  }}
-}}
-
-function matchesSearch(record, query) {{
-  if (!query) return true;
-  const hay = CONFIG.searchFields
-    .map((f) => record[f] || "")
-    .join(" ")
-    .toLowerCase();
-  return hay.includes(query);
-}}
-
-function recordPasses(record) {{
-  for (const f of CONFIG.filters) {{
+  }
+}
+
+// Lowercased search text per record, built once by indexData() instead of
+// per keystroke. HAYSTACK joins the search fields. Fuzzy search interns each
+// field instead: FIELD_DICT[f] holds its distinct texts, FIELD_MASKS[f] their
+// character masks and FIELD_CODES[f][i] the text of record i.
+let HAYSTACK = [];
+let TRIGRAMS = null;
+let FIELD_DICT = [];
+let FIELD_MASKS = [];
+let FIELD_CODES = [];
+
+// Fuzzy search, ported line for line from common/fuzzy.py.
+
+function charMask(text) {
+  let mask = 0;
+  for (let i = 0; i < text.length; i += 1) {
+    const code = text.charCodeAt(i);
+    if (code >= 97 && code <= 122) mask |= 1 << (code - 97);
+    else if (code >= 48 && code <= 57) mask |= 1 << (26 + ((code - 48) % 5));
+  }
+  return mask;
+}
+
+function isWordChar(c) {
+  return (c >= "a" && c <= "z") || (c >= "0" && c <= "9");
+}
+
+function fuzzyScore(term, text) {
+  let end = -1;
+  for (let p = 0; p < term.length; p += 1) {
+    end = text.indexOf(term[p], end + 1);
+    if (end < 0) return null;
+  }
+  let start = end + 1;
+  for (let p = term.length - 1; p >= 0; p -= 1) {
+    start = text.lastIndexOf(term[p], start - 1);
+  }
+
+  let score = 0;
+  let runBonus = 0;
+  let index = start - 1;
+  for (let p = 0; p < term.length; p += 1) {
+    const previous = index;
+    index = text.indexOf(term[p], index + 1);
+    const gap = p > 0 ? index - previous - 1 : 0;
+    if (gap > 0) score += FUZZY.gapStart + (gap - 1) * FUZZY.gapExtension;
+    let bonus = index === 0 || !isWordChar(text[index - 1]) ? FUZZY.boundary : 0;
+    if (p > 0 && gap === 0) bonus = Math.max(bonus, runBonus, FUZZY.consecutive);
+    else runBonus = bonus;
+    if (p === 0) bonus *= FUZZY.firstCharMultiplier;
+    score += FUZZY.match + bonus;
+  }
+  return Math.max(score, 1);
+}
+
+// Matching record indices, best score first (ties keep data order). Terms
+// are applied one at a time and fields column by column, so each distinct
+// text is scored at most once per term.
+function fuzzyMatches(query, candidates) {
+  const terms = query.split(/\\s+/).filter(Boolean);
+  if (terms.length === 0) return null;
+  let pool = candidates
+    ? Array.from(candidates)
+    : Array.from({ length: HAYSTACK.length }, (_, i) => i);
+  let totals = new Array(pool.length).fill(0);
+  for (const term of terms) {
+    const termMask = charMask(term);
+    const bests = new Array(pool.length).fill(0);
+    for (let f = 0; f < FIELD_DICT.length; f += 1) {
+      const texts = FIELD_DICT[f];
+      const masks = FIELD_MASKS[f];
+      const codes = FIELD_CODES[f];
+      const weight = CONFIG.searchWeights[f];
+      const scores = new Int32Array(texts.length).fill(-1);
+      for (let k = 0; k < pool.length; k += 1) {
+        const code = codes[pool[k]];
+        let score = scores[code];
+        if (score < 0) {
+          score =
+            (termMask & ~masks[code]) !== 0
+              ? 0
+              : (fuzzyScore(term, texts[code]) || 0) * weight;
+          scores[code] = score;
+        }
+        if (score > bests[k]) bests[k] = score;
+      }
+    }
+    const nextPool = [];
+    const nextTotals = [];
+    for (let k = 0; k < pool.length; k += 1) {
+      if (bests[k] > 0) {
+        nextPool.push(pool[k]);
+        nextTotals.push(totals[k] + bests[k]);
+      }
+    }
+    pool = nextPool;
+    totals = nextTotals;
+  }
+  const order = pool.map((_, k) => k);
+  order.sort((a, b) => totals[b] - totals[a] || pool[a] - pool[b]);
+  return order.map((k) => pool[k]);
+}
+
+// trigram -> ascending record indices whose haystack contains it.
+function buildTrigramIndex() {
+  const index = new Map();
+  HAYSTACK.forEach((hay, id) => {
+    for (let i = 0; i + 3 <= hay.length; i += 1) {
+      const gram = hay.slice(i, i + 3);
+      const list = index.get(gram);
+      if (!list) index.set(gram, [id]);
+      else if (list[list.length - 1] !== id) list.push(id);
+    }
+  });
+  return index;
+}
+
+function intersectSorted(a, b) {
+  const out = [];
+  let i = 0;
+  let j = 0;
+  while (i < a.length && j < b.length) {
+    if (a[i] === b[j]) {
+      out.push(a[i]);
+      i += 1;
+      j += 1;
+    } else if (a[i] < b[j]) {
+      i += 1;
+    } else {
+      j += 1;
+    }
+  }
+  return out;
+}
+
+// Records that may contain query, in ascending order; null means all of
+// them. Every trigram of the query must occur, so candidates still need a
+// substring check against HAYSTACK.
+function searchCandidates(query) {
+  if (!TRIGRAMS || query.length < 3) return null;
+  const lists = [];
+  for (let i = 0; i + 3 <= query.length; i += 1) {
+    const list = TRIGRAMS.get(query.slice(i, i + 3));
+    if (!list) return [];
+    lists.push(list);
+  }
+  lists.sort((a, b) => a.length - b.length);
+  return lists.slice(1).reduce(intersectSorted, lists[0]);
+}
+
+// Chip filters as row bitsets: bit i of CHIP_BITS[field].get(value) is set
+// when fieldValue(i, field) === value. Combining chips is OR within a filter
+// and AND across filters, one word at a time.
+let WORDS = 0;
+let CHIP_BITS = {};
+let chipMask = null;
+
+function chipBits(field, value) {
+  if (!CHIP_BITS[field]) CHIP_BITS[field] = new Map();
+  let bits = CHIP_BITS[field].get(value);
+  if (!bits) {
+    bits = new Uint32Array(WORDS);
+    const column = Array.isArray(DATA) ? null : DATA.columns[field];
+    if (column && column.dict) {
+      // Dictionary columns compare integer codes, not strings.
+      const code = column.dict.indexOf(value);
+      const codes = column.codes;
+      for (let i = 0; code >= 0 && i < codes.length; i += 1) {
+        if (codes[i] === code) bits[i >>> 5] |= 1 << (i & 31);
+      }
+    } else {
+      for (let i = 0; i < DATA.length; i += 1) {
+        if (fieldValue(i, field) === value) bits[i >>> 5] |= 1 << (i & 31);
+      }
+    }
+    CHIP_BITS[field].set(value, bits);
+  }
+  return bits;
+}
+
+// Bitset of rows passing every chip filter, or null when none is selected.
+function computeChipMask() {
+  let mask = null;
+  for (const f of CONFIG.filters) {
     const sel = state.filters[f.field] || [];
-    if (sel.length > 0 && !sel.includes(record[f.field])) return false;
-  }}
-  return matchesSearch(record, state.q.toLowerCase());
-}}
-
-function appendCell(row, col, record) {{
-  const td = document.createElement("td");
-  const value = record[col.key] || "";
-  if (col.kind === "wrap") {{
-    td.className = "col-wrap";
-    td.textContent = value;
-  }} else if (col.kind === "badge") {{
-    if (value) {{
+    if (sel.length === 0) continue;
+    const union = new Uint32Array(WORDS);
+    for (const value of sel) {
+      const bits = chipBits(f.field, value);
+      for (let w = 0; w < WORDS; w += 1) union[w] |= bits[w];
+    }
+    if (mask === null) {
+      mask = union;
+    } else {
+      for (let w = 0; w < WORDS; w += 1) mask[w] &= union[w];
+    }
+  }
+  return mask;
+}
+
+// Records matching lastQuery (null = all). A query that still contains the
+// previous one can only match a subset of it, so typing on narrows this list
+// instead of rescanning DATA.
+let lastQuery = "";
+let lastMatches = null;
+// False until DATA is indexed; input before that only updates state.
+let ready = false;
+
+// Worker search: the haystacks are posted to the worker once, which builds
+// the trigram index and answers each query with matching record indices.
+// Only the newest query counts: the worker drops queries that were
+// superseded while it was busy, and the main thread ignores any answer
+// whose seq is not the latest one it sent.
+let searchWorker = makeSearchWorker();
+let searchSeq = 0;
+let pendingQuery = null;
+
+// Runs inside the worker, next to copies of the search functions above.
+function searchWorkerMain() {
+  let pending = null;
+  function runPending() {
+    const { seq, query } = pending;
+    pending = null;
+    lastMatches = searchMatches(query);
+    lastQuery = query;
+    postMessage({ seq, query, matches: lastMatches });
+  }
+  onmessage = (event) => {
+    const msg = event.data;
+    if (msg.type === "index") {
+      HAYSTACK = msg.haystack;
+      FIELD_DICT = msg.fieldDict;
+      FIELD_MASKS = msg.fieldMasks;
+      FIELD_CODES = msg.fieldCodes;
+      TRIGRAMS = msg.trigram ? buildTrigramIndex() : null;
+      lastQuery = "";
+      lastMatches = null;
+      pending = null;
+      return;
+    }
+    const idle = pending === null;
+    pending = msg;
+    if (idle) setTimeout(runPending, 0);
+  };
+}
+
+function makeSearchWorker() {
+  if (CONFIG.searchThread !== "worker" || typeof Worker === "undefined") return null;
+  const source = [
+    "const CONFIG = " + JSON.stringify(CONFIG) + ";",
+    "const FUZZY = " + JSON.stringify(FUZZY) + ";",
+    "let HAYSTACK = [], TRIGRAMS = null;",
+    "let FIELD_DICT = [], FIELD_MASKS = [], FIELD_CODES = [];",
+    'let lastQuery = "", lastMatches = null;',
+    buildTrigramIndex,
+    intersectSorted,
+    searchCandidates,
+    charMask,
+    isWordChar,
+    fuzzyScore,
+    fuzzyMatches,
+    searchMatches,
+    searchWorkerMain,
+    "searchWorkerMain();",
+  ].join("\\n");
+  try {
+    const url = URL.createObjectURL(new Blob([source], { type: "text/javascript" }));
+    const worker = new Worker(url);
+    worker.onmessage = onWorkerMatches;
+    worker.onerror = () => {
+      // Fall back to searching on the main thread.
+      worker.terminate();
+      searchWorker = null;
+      pendingQuery = null;
+      applyFilters();
+    };
+    return worker;
+  } catch {
+    return null;
+  }
+}
+
+function postQuery(query) {
+  searchSeq += 1;
+  pendingQuery = query;
+  searchWorker.postMessage({ type: "query", seq: searchSeq, query });
+}
+
+function onWorkerMatches(event) {
+  const { seq, query, matches } = event.data;
+  if (seq !== searchSeq || query !== pendingQuery) return;
+  pendingQuery = null;
+  lastQuery = query;
+  lastMatches = matches;
+  showMatches();
+}
+
+// Builds every per-record structure from DATA; chip bitsets computed while
+// the data file was still loading are discarded.
+function indexData() {
+  const texts = CONFIG.searchFields.map((f) => {
+    const column = [];
+    for (let i = 0; i < DATA.length; i += 1) column.push(fieldValue(i, f).toLowerCase());
+    return column;
+  });
+  HAYSTACK = [];
+  for (let i = 0; i < DATA.length; i += 1) {
+    HAYSTACK.push(texts.map((column) => column[i]).join(" "));
+  }
+  FIELD_DICT = [];
+  FIELD_MASKS = [];
+  FIELD_CODES = [];
+  if (CONFIG.searchMode === "fuzzy") {
+    for (const column of texts) {
+      const interned = new Map();
+      const codes = new Int32Array(column.length);
+      column.forEach((text, i) => {
+        let code = interned.get(text);
+        if (code === undefined) {
+          code = interned.size;
+          interned.set(text, code);
+        }
+        codes[i] = code;
+      });
+      const dict = [...interned.keys()];
+      FIELD_DICT.push(dict);
+      FIELD_MASKS.push(Int32Array.from(dict, charMask));
+      FIELD_CODES.push(codes);
+    }
+  }
+  const trigram = CONFIG.searchIndex === "trigram";
+  TRIGRAMS = trigram && !searchWorker ? buildTrigramIndex() : null;
+  if (searchWorker) {
+    searchWorker.postMessage({
+      type: "index",
+      haystack: HAYSTACK,
+      fieldDict: FIELD_DICT,
+      fieldMasks: FIELD_MASKS,
+      fieldCodes: FIELD_CODES,
+      trigram,
+    });
+  }
+  WORDS = Math.ceil(DATA.length / 32);
+  CHIP_BITS = {};
+  for (const f of CONFIG.filters) {
+    for (const value of f.values) chipBits(f.field, value);
+  }
+  lastQuery = "";
+  lastMatches = null;
+  pendingQuery = null;
+}
+
+function searchMatches(query) {
+  if (!query) return null;
+  const narrowed = lastQuery && query.includes(lastQuery) ? lastMatches : null;
+  if (CONFIG.searchMode === "fuzzy") return fuzzyMatches(query, narrowed);
+  const indexed = searchCandidates(query);
+  const candidates =
+    narrowed && (!indexed || narrowed.length <= indexed.length) ? narrowed : indexed;
+  const matches = [];
+  if (candidates) {
+    for (const i of candidates) if (HAYSTACK[i].includes(query)) matches.push(i);
+  } else {
+    HAYSTACK.forEach((hay, i) => {
+      if (hay.includes(query)) matches.push(i);
+    });
+  }
+  return matches;
+}
+
+// DATA is either an array of record objects or a columnar payload
+// ({length, columns}, see common/columnar.py). Columnar values are looked up
+// per cell, so no record objects are built, only the cells that get drawn.
+function fieldValue(i, field) {
+  if (Array.isArray(DATA)) return DATA[i][field] || "";
+  const column = DATA.columns[field];
+  if (!column) return "";
+  return column.dict ? column.dict[column.codes[i]] : column.values[i];
+}
+
+function fillCell(td, col, index) {
+  const value = fieldValue(index, col.key);
+  if (col.kind === "badge") {
+    td.replaceChildren();
+    if (value) {
       const badge = document.createElement("span");
       const cls = CONFIG.badgeClasses[value] || "badge-gray";
       badge.className = "badge " + cls;
       badge.textContent = value;
       td.appendChild(badge);
-    }}
-  }} else {{
+    }
+  } else {
     td.textContent = value;
-  }}
+    if (VIRTUAL && col.kind === "wrap") td.title = value;
+  }
+}
+
+function makeRow() {
+  const row = document.createElement("tr");
+  for (const col of CONFIG.columns) {
+    const td = document.createElement("td");
+    if (col.kind === "wrap") td.className = "col-wrap";
+    row.appendChild(td);
+  }
+  return row;
+}
+
+function fillRow(row, index) {
+  CONFIG.columns.forEach((col, i) => fillCell(row.cells[i], col, index));
+}
+
+// Virtual mode: tbody holds a top spacer, a pool of recycled rows for the
+// visible window, and a bottom spacer. Scrolling only refills the pool.
+const VIRTUAL = CONFIG.tableMode === "virtual";
+const OVERSCAN = 8;
+let rowHeight = CONFIG.rowHeight;
+let visible = [];
+let pool = [];
+let windowStart = -1;
+let topSpacer = null;
+let bottomSpacer = null;
+
+function makeSpacer() {
+  const row = document.createElement("tr");
+  row.className = "spacer";
+  const td = document.createElement("td");
+  td.colSpan = CONFIG.columns.length;
   row.appendChild(td);
-}}
+  return row;
+}
+
+function setupVirtual() {
+  const wrap = document.getElementById("table-wrap");
+  wrap.classList.add("virtual");
+  wrap.style.setProperty("--row-height", rowHeight + "px");
+  topSpacer = makeSpacer();
+  bottomSpacer = makeSpacer();
+  let pending = false;
+  wrap.addEventListener("scroll", () => {
+    if (pending) return;
+    pending = true;
+    requestAnimationFrame(() => { pending = false; renderWindow(false); });
+  });
+  window.addEventListener("resize", () => renderWindow(true));
+}
+
+function renderWindow(force) {
+  const wrap = document.getElementById("table-wrap");
+  const height = rowHeight;
+  const size = Math.min(
+    visible.length,
+    Math.ceil(wrap.clientHeight / height) + 2 * OVERSCAN,
+  );
+  const maxStart = Math.max(0, visible.length - size);
+  const start = Math.min(
+    maxStart,
+    Math.max(0, Math.floor(wrap.scrollTop / height) - OVERSCAN),
+  );
+  if (!force && start === windowStart && pool.length === size) return;
+  windowStart = start;
+
+  while (pool.length < size) pool.push(makeRow());
+  pool.length = size;
+  for (let i = 0; i < size; i += 1) fillRow(pool[i], visible[start + i]);
+
+  topSpacer.cells[0].style.height = start * height + "px";
+  bottomSpacer.cells[0].style.height =
+    (visible.length - start - size) * height + "px";
+  document.getElementById("tbody").replaceChildren(topSpacer, ...pool, bottomSpacer);
+
+  // Spacer heights assume every row is exactly rowHeight tall; if fonts or
+  // borders make rows taller, adopt the measured height once and redraw.
+  if (size > 0) {
+    const measured = pool[0].getBoundingClientRect().height;
+    if (measured > 0 && Math.abs(measured - rowHeight) > 0.5) {
+      rowHeight = measured;
+      renderWindow(true);
+    }
+  }
+}
 
-function applyFilters() {{
+function renderAllRows() {
   const tbody = document.getElementById("tbody");
   tbody.replaceChildren();
-  let shown = 0;
-  for (const record of DATA) {{
-    if (!recordPasses(record)) continue;
-    shown += 1;
-    const row = document.createElement("tr");
-    for (const col of CONFIG.columns) appendCell(row, col, record);
+  for (const index of visible) {
+    const row = makeRow();
+    fillRow(row, index);
     tbody.appendChild(row);
-  }}
+  }
+}
+
+function applyFilters() {
+  if (!ready) return;
+  const query = state.q.toLowerCase();
+  if (searchWorker && query && query !== lastQuery) {
+    // The table is redrawn by onWorkerMatches once the answer arrives.
+    if (query !== pendingQuery) postQuery(query);
+    return;
+  }
+  pendingQuery = null;
+  if (query !== lastQuery) {
+    lastMatches = searchMatches(query);
+    lastQuery = query;
+  }
+  showMatches();
+}
+
+function showMatches() {
+  const mask = chipMask;
+  const passes = (i) => !mask || (mask[i >>> 5] & (1 << (i & 31))) !== 0;
+  visible = lastMatches
+    ? lastMatches.filter(passes)
+    : Array.from({ length: DATA.length }, (_, i) => i).filter(passes);
+  if (VIRTUAL) {
+    document.getElementById("table-wrap").scrollTop = 0;
+    renderWindow(true);
+  } else {
+    renderAllRows();
+  }
   document.getElementById("count-display").textContent =
-    shown + " / " + DATA.length + " records";
-}}
+    visible.length + " / " + DATA.length + " records";
+}
 
-function render() {{
-  renderControls();
-  renderHead();
+function syncFromState() {
+  syncControls();
+  chipMask = computeChipMask();
   applyFilters();
-}}
+}
+
+function start() {
+  indexData();
+  ready = true;
+  syncFromState();
+  window.addEventListener("hashchange", () => {
+    state = parseHash();
+    syncFromState();
+  });
+}
 
 state = parseHash();
-render();
-window.addEventListener("hashchange", () => {{ state = parseHash(); render(); }});
-</script>
+if (VIRTUAL) setupVirtual();
+buildControls();
+renderHead();
+if (DATA_URL) {
+  // The shell is already usable; records arrive from a separately cached file.
+  syncControls();
+  const counter = document.getElementById("count-display");
+  counter.textContent = "loading records…";
+  fetch(DATA_URL)
+    .then((response) => {
+      if (!response.ok) throw new Error(response.status + " " + response.statusText);
+      return response.json();
+    })
+    .then((payload) => {
+      DATA = payload;
+      start();
+    })
+    .catch((error) => {
+      counter.textContent = "failed to load " + DATA_URL + ": " + error.message;
+    });
+} else {
+  start();
+}
+"""
+
+
+def page_script() -> str:
+    """Return the generic page script.
+
+    It expects DATA, DATA_URL, and CONFIG to be declared by an earlier
+    script on the page; the fuzzy scoring constants are baked in.
+    """
+    fuzzy_json = _embed_json(
+        {
+            "match": fuzzy.SCORE_MATCH,
+            "gapStart": fuzzy.SCORE_GAP_START,
+            "gapExtension": fuzzy.SCORE_GAP_EXTENSION,
+            "boundary": fuzzy.BONUS_BOUNDARY,
+            "consecutive": fuzzy.BONUS_CONSECUTIVE,
+            "firstCharMultiplier": fuzzy.BONUS_FIRST_CHAR_MULTIPLIER,
+        }
+    )
+    return f"const FUZZY = {fuzzy_json};\n\n{PAGE_JS}"
+
+
+def render_searchable_html(
+    records: list[dict[str, str]],
+    config: PageConfig,
+    meta: dict[str, str],
+    *,
+    data_url: str | None = None,
+    assets: AssetLinks | None = None,
+) -> str:
+    """Return a searchable HTML page for the given records.
+
+    The page is self-contained unless ``data_url`` is given; the records are
+    then left out of the HTML and fetched from that URL, which must serve
+    page_payload(records, config) (see common/page_data.py). Filter chips and
+    the table mode are still derived from ``records`` at render time.
+
+    With ``assets`` the stylesheet and the page script are linked from the
+    shared site bundle (common/assets.py) instead of being inlined; only the
+    page's DATA, DATA_URL, and CONFIG stay in the HTML.
+    """
+    data_json = (
+        "[]" if data_url is not None else _embed_json(page_payload(records, config))
+    )
+    data_url_json = _embed_json(data_url)
+    preload = (
+        f'<link rel="preload" href="{_escape(data_url)}" as="fetch" '
+        'crossorigin="anonymous">\n'
+        if data_url is not None
+        else ""
+    )
+    config_json = _embed_json(_config_to_js(config, records))
+    page_globals = (
+        f"let DATA = {data_json};\n"
+        f"const DATA_URL = {data_url_json};\n"
+        f"const CONFIG = {config_json};\n"
+    )
+    if assets is None:
+        style = f"<style>\n{SHARED_CSS}{PAGE_CSS}</style>"
+        scripts = f"<script>\n{page_globals}\n{page_script()}</script>"
+    else:
+        style = f'<link rel="stylesheet" href="{_escape(assets.css)}">'
+        scripts = (
+            f"<script>\n{page_globals}</script>\n"
+            f'<script src="{_escape(assets.js)}"></script>'
+        )
+    title = _escape(config.title)
+    generated_at = _escape(meta.get("generated_at", ""))
+    commit = _escape(meta.get("commit", ""))
+    note = _escape(config.note or meta.get("note", ""))
+    count_items = _meta_count_items(meta)
+    nav = _nav_html(config)
+
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+{preload}{style}
+</head>
+<body>
+<header>
+  {nav}
+  <h1>{title}</h1>
+  <div class="meta">
+    <span>generated: {generated_at}</span>
+    <span>commit: {commit}</span>
+    {count_items}
+    <span>{note}</span>
+  </div>
+</header>
+<div class="controls" id="controls"></div>
+<div class="table-wrap" id="table-wrap">
+  <table>
+    <thead><tr id="thead-row"></tr></thead>
+    <tbody id="tbody"></tbody>
+  </table>
+</div>
+{scripts}
 </body>
 </html>
 """
@@ -0,0 +1,66 @@
+"""Keys for skipping pages whose inputs did not change.
+
+A rendered page embeds its generation time and the current commit, so
+rendering the same records twice still yields different bytes and every
+downstream cache, rsync, or artifact upload sees a changed file. Instead,
+a page is keyed by what actually determines its content, the records and
+the pipeline source (which holds the PageConfig and the renderer), and is
+only rendered again, with a fresh timestamp, when that key changes.
+
+render.py and render_hub.py keep the key under the cache directory, one file
+per output path, so nothing but the page is written to the output directory;
+build_site.py keeps it in the site manifest (common/site_manifest.py).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from functools import cache
+from pathlib import Path
+
+from common.build_cache import code_version
+from common.cache import cache_dir, read_keyed_json, write_keyed_json
+
+
+@cache
+def _code_version() -> str:
+    return code_version()
+
+
+def render_inputs_key(*inputs: object) -> str:
+    """Hash JSON-serializable page inputs together with the pipeline source."""
+    digest = hashlib.sha256(_code_version().encode("utf-8"))
+    digest.update(
+        json.dumps(inputs, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    )
+    return digest.hexdigest()
+
+
+def inputs_path(out_path: Path) -> Path:
+    """Cache file holding the render-inputs key of ``out_path``."""
+    name = hashlib.sha256(str(out_path.resolve()).encode("utf-8")).hexdigest()
+    return cache_dir() / "render-inputs" / f"{name}.json"
+
+
+def _content_digest(out_path: Path) -> str | None:
+    try:
+        return hashlib.sha256(out_path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def output_is_current(out_path: Path, key: str) -> bool:
+    """True when ``out_path`` was rendered for ``key`` and not modified since."""
+    stored = read_keyed_json(inputs_path(out_path), key)
+    if not isinstance(stored, dict):
+        return False
+    digest = _content_digest(out_path)
+    return digest is not None and stored.get("sha256") == digest
+
+
+def record_output(out_path: Path, key: str) -> None:
+    """Remember that ``out_path`` now holds the page rendered for ``key``."""
+    digest = _content_digest(out_path)
+    if digest is not None:
+        write_keyed_json(inputs_path(out_path), key, {"sha256": digest})
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Sequence
 
 
 def sanitize_tsv_field(value: str) -> str:
@@ -10,10 +10,15 @@ def sanitize_tsv_field(value: str) -> str:
     return value.replace("\t", " ").replace("\n", " ").replace("\r", " ")
 
 
-def render_tsv(records: list[dict[str, str]], fields: Sequence[str]) -> str:
-    """Render records as tab-separated lines using the given field order."""
-    lines: list[str] = []
+def iter_tsv_lines(
+    records: Iterable[dict[str, str]], fields: Sequence[str]
+) -> Iterator[str]:
+    """Yield one newline-terminated TSV line per record, lazily."""
     for record in records:
         cells = [sanitize_tsv_field(record.get(field, "")) for field in fields]
-        lines.append("\t".join(cells))
-    return "\n".join(lines) + ("\n" if lines else "")
+        yield "\t".join(cells) + "\n"
+
+
+def render_tsv(records: Iterable[dict[str, str]], fields: Sequence[str]) -> str:
+    """Render records as tab-separated lines using the given field order."""
+    return "".join(iter_tsv_lines(records, fields))
@@ -0,0 +1,156 @@
+"""Write a built site through a content-hash manifest.
+
+``publish_site`` takes every output file of a build (site-relative path ->
+bytes) and records each one in ``manifest.json`` at the site root::
+
+    {"version": 1,
+     "files": {"index.html": {"sha256": "...", "size": 3120,
+                              "gzip_size": 1204, "brotli_size": 1013,
+                              "inputs": "..."}}}
+
+A file whose hash matches the previous manifest, and whose compressed
+siblings are still on disk, is not written again. Changed files are written
+first and then precompressed (common/precompress.py) on a thread pool: zlib
+releases the GIL and ``brotli`` runs as a child process. Paths from the
+previous manifest that the build no longer produces are removed together
+with their siblings. Rendered pages also record their render-inputs key, so
+the next build can keep a page whose records did not change as it is.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+
+from common.precompress import brotli_available, write_brotli, write_gzip
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    sha256: str
+    size: int
+    gzip_size: int
+    brotli_size: int | None = None
+    inputs: str | None = None
+
+
+@dataclass(frozen=True)
+class PublishResult:
+    manifest: dict[str, ManifestEntry]
+    written: tuple[str, ...]
+    unchanged: tuple[str, ...]
+    removed: tuple[str, ...]
+
+
+def load_manifest(site_dir: Path) -> dict[str, ManifestEntry]:
+    """Return the previous build's entries; empty if missing or unreadable."""
+    try:
+        raw = json.loads((site_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+        if raw.get("version") != MANIFEST_VERSION:
+            return {}
+        entries = {path: ManifestEntry(**entry) for path, entry in raw["files"].items()}
+    except (OSError, ValueError, TypeError, KeyError, AttributeError):
+        return {}
+    # Stale entries get deleted, so only paths inside the site count.
+    return {
+        path: entry
+        for path, entry in entries.items()
+        if not Path(path).is_absolute() and ".." not in Path(path).parts
+    }
+
+
+def _is_current(
+    site_dir: Path, path: str, digest: str, entry: ManifestEntry | None, brotli: bool
+) -> bool:
+    if entry is None or entry.sha256 != digest:
+        return False
+    target = site_dir / path
+    siblings = [Path(f"{target}.gz")]
+    if brotli:
+        if entry.brotli_size is None:
+            return False
+        siblings.append(Path(f"{target}.br"))
+    return target.is_file() and all(sibling.is_file() for sibling in siblings)
+
+
+def reusable_output(
+    site_dir: Path, path: str, entry: ManifestEntry | None, inputs: str
+) -> bytes | None:
+    """The published bytes of ``path`` if they were rendered from ``inputs``.
+
+    ``inputs`` is a common/render_inputs.py key. Reusing the bytes instead of
+    rendering again keeps the page, and its generated_at, as they were.
+    """
+    if entry is None or entry.inputs != inputs:
+        return None
+    try:
+        content = (site_dir / path).read_bytes()
+    except OSError:
+        return None
+    return content if hashlib.sha256(content).hexdigest() == entry.sha256 else None
+
+
+def _compress(target: Path) -> tuple[int, int | None]:
+    return write_gzip(target), write_brotli(target)
+
+
+def publish_site(
+    site_dir: Path,
+    files: Mapping[str, bytes],
+    jobs: int,
+    inputs: Mapping[str, str] | None = None,
+) -> PublishResult:
+    """Write changed ``files`` under ``site_dir`` and refresh the manifest.
+
+    ``jobs`` bounds the compression threads (1 = serial). ``inputs`` maps
+    rendered pages to their render-inputs key, stored for reusable_output.
+    """
+    inputs = inputs or {}
+    site_dir.mkdir(parents=True, exist_ok=True)
+    previous = load_manifest(site_dir)
+    brotli = brotli_available()
+    manifest: dict[str, ManifestEntry] = {}
+    changed: list[str] = []
+    unchanged: list[str] = []
+    for path, content in files.items():
+        digest = hashlib.sha256(content).hexdigest()
+        if _is_current(site_dir, path, digest, previous.get(path), brotli):
+            manifest[path] = replace(previous[path], inputs=inputs.get(path))
+            unchanged.append(path)
+            continue
+        target = site_dir / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(content)
+        manifest[path] = ManifestEntry(digest, len(content), 0, None, inputs.get(path))
+        changed.append(path)
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        sizes = pool.map(_compress, [site_dir / path for path in changed])
+        for path, (gzip_size, brotli_size) in zip(changed, sizes, strict=True):
+            manifest[path] = replace(
+                manifest[path], gzip_size=gzip_size, brotli_size=brotli_size
+            )
+
+    removed = sorted(set(previous) - set(files))
+    for path in removed:
+        target = site_dir / path
+        for stale in (target, Path(f"{target}.gz"), Path(f"{target}.br")):
+            stale.unlink(missing_ok=True)
+
+    ordered = dict(sorted(manifest.items()))
+    payload = {
+        "version": MANIFEST_VERSION,
+        "files": {path: asdict(entry) for path, entry in ordered.items()},
+    }
+    text = json.dumps(payload, indent=2) + "\n"
+    manifest_path = site_dir / MANIFEST_NAME
+    if not manifest_path.is_file() or manifest_path.read_text("utf-8") != text:
+        manifest_path.write_text(text, encoding="utf-8")
+    return PublishResult(ordered, tuple(changed), tuple(unchanged), tuple(removed))
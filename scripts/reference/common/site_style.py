@@ -0,0 +1,30 @@
+"""CSS shared by the reference hub and every domain page.
+
+Base typography, the top navigation, and the accent used for the active nav
+link and selected filter chips. Page-specific rules live next to their
+renderers (common/render_html.py, common/hub_html.py); common/assets.py
+bundles all three into the site stylesheet.
+"""
+
+from __future__ import annotations
+
+SHARED_CSS = """\
+:root {
+  color-scheme: light dark;
+  font-family: system-ui, -apple-system, "Segoe UI", Roboto, sans-serif;
+  font-size: 13px;
+  line-height: 1.35;
+}
+* { box-sizing: border-box; }
+body { margin: 0; padding: 12px 16px; }
+h1 { margin: 0 0 8px; font-size: 1.25rem; }
+.top-nav { display: flex; flex-wrap: wrap; gap: 4px 8px; margin-bottom: 8px; }
+.nav-link {
+  text-decoration: none; padding: 2px 10px; border-radius: 4px;
+  border: 1px solid #8884; color: inherit; font-size: 12px;
+}
+.nav-link.active, .chip.active { background: #06c; color: #fff; border-color: #06c; }
+@media (prefers-color-scheme: dark) {
+  .nav-link.active, .chip.active { background: #4a9eff; border-color: #4a9eff; }
+}
+"""
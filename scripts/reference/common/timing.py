@@ -0,0 +1,30 @@
+"""Wall-clock stage timings for the in-process reference build drivers."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+class StageTimer:
+    """Collect (stage, seconds) pairs in completion order."""
+
+    def __init__(self) -> None:
+        self.timings: list[tuple[str, float]] = []
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings.append((name, time.perf_counter() - started))
+
+    def format_report(self) -> str:
+        """Return one aligned ``stage  seconds`` line per recorded stage."""
+        if not self.timings:
+            return ""
+        width = max(len(name) for name, _ in self.timings)
+        lines = [f"{name:<{width}}  {seconds:7.3f}s" for name, seconds in self.timings]
+        return "\n".join(lines) + "\n"
@@ -4,21 +4,21 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 from pathlib import Path
 
 from claude.extract import collect_claude_assets
+from common.records_io import RECORD_FORMATS, dump_records
 
 
 def main() -> int:
     parser = argparse.ArgumentParser(description="Extract Claude Code assets")
     parser.add_argument("--root", type=Path, required=True)
+    parser.add_argument("--format", choices=RECORD_FORMATS, default="json")
     args = parser.parse_args()
 
     records = collect_claude_assets(args.root.resolve())
-    json.dump(records, sys.stdout, indent=2, ensure_ascii=False)
-    sys.stdout.write("\n")
+    dump_records(records, sys.stdout, args.format)
     return 0
 
 
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""Extract keybindings from all tools (zsh, skhd, wezterm, nvim) as one array.
+
+All four extractors run in this process and their records are merged in
+memory, so no per-tool JSON file is written and re-read along the way. The
+wezterm and nvim extractors launch external binaries and run concurrently
+with the pure zsh/skhd parsers (see --jobs). Each tool's records are cached
+by a content hash of its input files (common/build_cache.py), so a rebuild
+only re-extracts tools whose sources changed; zsh bindings are stored per
+file, so only the edited zsh files are re-parsed.
+
+The merged records carry a "conflict" field: "shadowed" when another tool
+takes the same key press first, "shadows" for the binding that does
+(keybindings/conflicts.py).
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from functools import partial
+from pathlib import Path
+
+from common.build_cache import BuildCache
+from common.parallel import DEFAULT_JOBS, ExtractStage, run_extract_stages
+from common.record_table import write_record_table
+from common.records_io import RECORD_FORMATS, format_records
+from common.timing import StageTimer
+from extract_nvim import (
+    BASELINES,
+    collect_nvim_bindings,
+    read_nvim_version,
+)
+from extract_skhd import collect_skhd_bindings
+from extract_wezterm import (
+    collect_wezterm_bindings,
+    read_wezterm_version,
+)
+from extract_zsh import collect_zsh_bindings, merge_zsh_bindings, zsh_file_bindings
+from keybindings.chord import Leaders
+from keybindings.conflicts import annotate_conflicts
+from keybindings.leaders import keybinding_leaders, read_mapleader
+from zsh_sources import ZshScanner, default_memo_dir
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def zsh_scanner(root: Path, *, use_cache: bool) -> ZshScanner:
+    return ZshScanner(root, default_memo_dir() if use_cache else None)
+
+
+def keybinding_stages(
+    root: Path,
+    nvim_baseline: str = "clean",
+    *,
+    use_cache: bool = True,
+    scanner: ZshScanner | None = None,
+) -> list[ExtractStage]:
+    """Return one extraction stage per tool, in merged-output order.
+
+    Pass ``scanner`` to share per-file zsh scans with other zsh extractors.
+    """
+    scanner = scanner or zsh_scanner(root, use_cache=use_cache)
+    return [
+        ExtractStage(
+            "extract:zsh",
+            lambda: collect_zsh_bindings(root, scanner),
+            inputs=(".config/zsh/**/*.zsh",),
+            parse_input=partial(zsh_file_bindings, scanner),
+            combine=merge_zsh_bindings,
+        ),
+        ExtractStage(
+            "extract:skhd",
+            lambda: collect_skhd_bindings(root),
+            inputs=(".skhdrc",),
+        ),
+        # config_file is required: in CI $HOME has no .wezterm.lua, so the implicit
+        # config lookup would silently diff defaults against defaults (0 custom keys)
+        ExtractStage(
+            "extract:wezterm",
+            lambda: collect_wezterm_bindings(
+                config_file=str(root / ".wezterm.lua"), use_cache=use_cache
+            ),
+            spawns_process=True,
+            inputs=(".wezterm.lua",),
+            tools=("wezterm",),
+            version=read_wezterm_version,
+        ),
+        ExtractStage(
+            "extract:nvim",
+            lambda: collect_nvim_bindings(
+                baseline=nvim_baseline,
+                use_cache=use_cache,
+                leader=read_mapleader(root / ".config" / "nvim"),
+            ),
+            spawns_process=True,
+            inputs=(".config/nvim/**/*",),
+            salt=lambda: nvim_baseline,
+            tools=("nvim",),
+            version=read_nvim_version,
+        ),
+    ]
+
+
+def merge_stage_records(
+    stages: list[ExtractStage],
+    results: dict[str, list[dict[str, str]]],
+    leaders: Leaders,
+) -> list[dict[str, str]]:
+    merged: list[dict[str, str]] = []
+    for stage in stages:
+        merged.extend(results[stage.name])
+    return annotate_conflicts(merged, leaders)
+
+
+def collect_keybindings(
+    root: Path,
+    timer: StageTimer,
+    jobs: int = DEFAULT_JOBS,
+    nvim_baseline: str = "clean",
+    cache: BuildCache | None = None,
+) -> list[dict[str, str]]:
+    stages = keybinding_stages(root, nvim_baseline, use_cache=cache is not None)
+    results = run_extract_stages(stages, timer, jobs, cache)
+    return merge_stage_records(stages, results, keybinding_leaders(root))
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write ``content`` unless the file already holds it; keeps mtime stable."""
+    try:
+        if path.read_text(encoding="utf-8") == content:
+            return False
+    except OSError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return True
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Extract keybindings from all tools")
+    parser.add_argument("--root", type=Path, default=REPO_ROOT)
+    parser.add_argument("--out", type=Path)
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help="maximum concurrent extractor processes (1 = fully serial)",
+    )
+    parser.add_argument("--nvim-baseline", choices=BASELINES, default="clean")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="ignore the content-hash build cache and the tool baseline caches",
+    )
+    parser.add_argument("--timings", action="store_true")
+    parser.add_argument(
+        "--format",
+        choices=(*RECORD_FORMATS, "table"),
+        default="json",
+        help="table: memory-mappable record table (common/record_table.py)",
+    )
+    args = parser.parse_args()
+    if args.format == "table" and args.out is None:
+        parser.error("--format table requires --out")
+
+    root = args.root.resolve()
+    timer = StageTimer()
+    cache = None if args.no_cache else BuildCache(root)
+    try:
+        records = collect_keybindings(root, timer, args.jobs, args.nvim_baseline, cache)
+    except (subprocess.CalledProcessError, OSError, ValueError) as exc:
+        print(f"keybinding extraction failed: {exc}", file=sys.stderr)
+        return 1
+
+    if args.timings:
+        sys.stderr.write(timer.format_report())
+        if cache is not None and cache.hits:
+            sys.stderr.write(f"cached: {', '.join(cache.hits)}\n")
+
+    if args.format == "table":
+        write_record_table(args.out, records)
+        return 0
+
+    content = format_records(records, args.format)
+    if args.out is None:
+        sys.stdout.write(content)
+        return 0
+    write_if_changed(args.out, content)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,29 +1,193 @@
 #!/usr/bin/env python3
-"""Extract Neovim keybindings by diffing config vs clean dumps."""
+"""Extract Neovim keybindings by diffing config vs builtin keymap dumps.
+
+The builtin baseline comes from one of two places (--baseline):
+
+- ``clean`` (default): a ``nvim --clean`` dump, which also includes maps from
+  runtime plugins such as matchit. It depends only on the nvim binary, so it
+  is cached per ``nvim --version``; on a hit only the config session runs.
+- ``session``: a snapshot taken via ``--cmd`` in the config session itself,
+  before any user config loads. One nvim process yields both inputs; maps
+  added later by runtime plugins are not part of this baseline.
+"""
 
 from __future__ import annotations
 
 import argparse
-import json
+import os
+import subprocess
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from keybindings.nvim_diff import exclude_builtin, parse_keymap_json
+from common.cache import cache_dir, file_digest, read_keyed_json, write_keyed_json
+from common.records_io import RECORD_FORMATS, dump_records
+from keybindings.leaders import read_mapleader
+from keybindings.nvim_diff import (
+    DEFAULT_MAPLEADER,
+    exclude_builtin,
+    parse_keymap_json,
+)
 from keybindings.schema import to_record
 
+NVIM_DUMP_LUA = Path(__file__).resolve().parent / "nvim_dump.lua"
+CLEAN_DUMP_CACHE_NAME = "nvim-clean-keymaps.json"
+BASELINES = ("clean", "session")
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _run_nvim(command: list[str], env: dict[str, str]) -> None:
+    # nvim stdout goes to stderr: on a cold cache, lazy.nvim and
+    # nvim-treesitter print install progress to stdout, which would corrupt
+    # this script's JSON output. Dumps are written to the KB_* paths instead.
+    subprocess.run(
+        command,
+        check=True,
+        stdout=sys.stderr,
+        env={**os.environ, **env},
+    )
+
+
+def read_keymaps_from_nvim(*, clean: bool) -> str:
+    """Run headless Neovim with nvim_dump.lua and return the keymap JSON dump."""
+    command = ["nvim"]
+    if clean:
+        command.append("--clean")
+    command.append("--headless")
+    if not clean:
+        command.append("+Lazy! load all")
+    command.extend([f"+luafile {NVIM_DUMP_LUA}", "+qall!"])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        dump_path = Path(tmp) / "keymaps.json"
+        _run_nvim(command, {"KB_DUMP_PATH": str(dump_path)})
+        return dump_path.read_text(encoding="utf-8")
+
+
+def read_config_and_builtin_keymaps() -> tuple[str, str]:
+    """Dump (config, builtin) keymaps from a single headless session."""
+    command = [
+        "nvim",
+        "--headless",
+        "--cmd",
+        "let g:kb_dump_env = 'KB_BUILTIN_DUMP_PATH'",
+        "--cmd",
+        f"luafile {NVIM_DUMP_LUA}",
+        "--cmd",
+        "unlet g:kb_dump_env",
+        "+Lazy! load all",
+        f"+luafile {NVIM_DUMP_LUA}",
+        "+qall!",
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config_path = Path(tmp) / "config.json"
+        builtin_path = Path(tmp) / "builtin.json"
+        _run_nvim(
+            command,
+            {
+                "KB_DUMP_PATH": str(config_path),
+                "KB_BUILTIN_DUMP_PATH": str(builtin_path),
+            },
+        )
+        return (
+            config_path.read_text(encoding="utf-8"),
+            builtin_path.read_text(encoding="utf-8"),
+        )
+
+
+def read_nvim_version() -> str:
+    completed = subprocess.run(
+        ["nvim", "--version"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    lines = completed.stdout.splitlines()
+    return lines[0].strip() if lines else ""
+
+
+def load_clean_keymaps(*, use_cache: bool) -> str:
+    """Return the ``nvim --clean`` dump, reusing the per-version cache on a hit."""
+    if not use_cache:
+        return read_keymaps_from_nvim(clean=True)
+
+    cache_path = cache_dir() / CLEAN_DUMP_CACHE_NAME
+    key = f"{read_nvim_version()}:{file_digest(NVIM_DUMP_LUA)}"
+    cached = read_keyed_json(cache_path, key)
+    if isinstance(cached, str):
+        return cached
+
+    clean_text = read_keymaps_from_nvim(clean=True)
+    write_keyed_json(cache_path, key, clean_text)
+    return clean_text
+
+
+def read_config_and_clean_keymaps(*, use_cache: bool) -> tuple[str, str]:
+    # The config session and the clean lookup are independent launches; run
+    # them side by side so a cold cache costs one launch of latency, not two.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        config_future = pool.submit(read_keymaps_from_nvim, clean=False)
+        clean_text = load_clean_keymaps(use_cache=use_cache)
+        return config_future.result(), clean_text
+
+
+def collect_nvim_bindings(
+    *,
+    config_json: Path | None = None,
+    clean_json: Path | None = None,
+    baseline: str = "clean",
+    use_cache: bool = True,
+    leader: str = DEFAULT_MAPLEADER,
+) -> list[dict[str, str]]:
+    if config_json is not None and clean_json is not None:
+        config_text = config_json.read_text(encoding="utf-8")
+        clean_text = clean_json.read_text(encoding="utf-8")
+    elif config_json is not None:
+        config_text = config_json.read_text(encoding="utf-8")
+        clean_text = load_clean_keymaps(use_cache=use_cache)
+    elif clean_json is not None:
+        config_text = read_keymaps_from_nvim(clean=False)
+        clean_text = clean_json.read_text(encoding="utf-8")
+    elif baseline == "session":
+        config_text, clean_text = read_config_and_builtin_keymaps()
+    else:
+        config_text, clean_text = read_config_and_clean_keymaps(use_cache=use_cache)
+
+    config_maps = parse_keymap_json(config_text)
+    clean_maps = parse_keymap_json(clean_text)
+    return [to_record(kb) for kb in exclude_builtin(config_maps, clean_maps, leader)]
+
 
 def main() -> int:
     parser = argparse.ArgumentParser(description="Diff Neovim keymap JSON dumps")
-    parser.add_argument("--config-json", required=True, type=Path)
-    parser.add_argument("--clean-json", required=True, type=Path)
+    parser.add_argument("--config-json", type=Path)
+    parser.add_argument("--clean-json", type=Path)
+    parser.add_argument("--baseline", choices=BASELINES, default="clean")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="always launch nvim --clean instead of reusing the version cache",
+    )
+    parser.add_argument(
+        "--root",
+        type=Path,
+        default=REPO_ROOT,
+        help="repo whose .config/nvim sets the mapleader spelled as <leader>",
+    )
+    parser.add_argument("--format", choices=RECORD_FORMATS, default="json")
     args = parser.parse_args()
 
-    config_maps = parse_keymap_json(args.config_json.read_text(encoding="utf-8"))
-    clean_maps = parse_keymap_json(args.clean_json.read_text(encoding="utf-8"))
-    records = [to_record(kb) for kb in exclude_builtin(config_maps, clean_maps)]
+    records = collect_nvim_bindings(
+        config_json=args.config_json,
+        clean_json=args.clean_json,
+        baseline=args.baseline,
+        use_cache=not args.no_cache,
+        leader=read_mapleader(args.root / ".config" / "nvim"),
+    )
 
-    json.dump(records, sys.stdout, indent=2, ensure_ascii=False)
-    sys.stdout.write("\n")
+    dump_records(records, sys.stdout, args.format)
     return 0
 
 
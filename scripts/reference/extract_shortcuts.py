@@ -4,17 +4,13 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sys
-from collections.abc import Callable
+from collections.abc import Mapping
 from pathlib import Path
 
-from shortcuts.abbr_parser import parse_abbr_text
-from shortcuts.alias_parser import parse_alias_text
-from shortcuts.function_parser import parse_function_text
-from shortcuts.schema import Shortcut, to_record
-
-ParseTextFn = Callable[[str, str], list[Shortcut]]
+from common.records_io import RECORD_FORMATS, dump_records
+from shortcuts.schema import to_record
+from zsh_sources import ZshScanner, default_memo_dir
 
 
 def collect_alias_files(zsh_root: Path) -> list[Path]:
@@ -37,45 +33,66 @@ def collect_function_files(zsh_root: Path) -> list[Path]:
     return files
 
 
-def read_shortcuts_from_file(
-    path: Path,
-    root: Path,
-    parse_text: ParseTextFn,
-) -> list[Shortcut]:
-    if not path.is_file():
+def shortcut_file_records(scanner: ZshScanner, zsh_file: Path) -> list[dict[str, str]]:
+    """Every alias, abbr and function record of one file."""
+    scan = scanner.scan(zsh_file)
+    if scan is None:
         return []
+    shortcuts = [*scan.aliases, *scan.abbrs, *scan.functions]
+    return [to_record(shortcut) for shortcut in shortcuts]
 
-    relative_source = path.relative_to(root).as_posix()
-    text = path.read_text(encoding="utf-8")
-    return parse_text(text, relative_source)
-
-
-def collect_shortcuts(root: Path) -> list[dict[str, str]]:
-    zsh_root = root / ".config" / "zsh"
-    shortcuts: list[Shortcut] = []
 
-    for alias_file in collect_alias_files(zsh_root):
-        shortcuts.extend(read_shortcuts_from_file(alias_file, root, parse_alias_text))
+def merge_shortcuts(
+    zsh_root: Path, by_file: Mapping[Path, list[dict[str, str]]]
+) -> list[dict[str, str]]:
+    """Order per-file records as alias, abbr, then function shortcuts.
+
+    Each kind is taken only from the files it is collected from, in that
+    kind's file order.
+    """
+    groups = (
+        ("alias", collect_alias_files(zsh_root)),
+        ("abbr", [zsh_root / "plugins" / "abbr.zsh"]),
+        ("function", collect_function_files(zsh_root)),
+    )
+    return [
+        record
+        for kind, paths in groups
+        for path in paths
+        for record in by_file.get(path, [])
+        if record["kind"] == kind
+    ]
 
-    abbr_file = zsh_root / "plugins" / "abbr.zsh"
-    shortcuts.extend(read_shortcuts_from_file(abbr_file, root, parse_abbr_text))
 
-    for function_file in collect_function_files(zsh_root):
-        shortcuts.extend(
-            read_shortcuts_from_file(function_file, root, parse_function_text)
-        )
+def collect_shortcuts(
+    root: Path, scanner: ZshScanner | None = None
+) -> list[dict[str, str]]:
+    """Collect alias, abbr, then function shortcuts.
 
-    return [to_record(shortcut) for shortcut in shortcuts]
+    Every file is scanned once through ``scanner``, which may be shared with
+    the bindkey extractor.
+    """
+    scanner = scanner or ZshScanner(root)
+    zsh_root = root / ".config" / "zsh"
+    files = {
+        *collect_alias_files(zsh_root),
+        zsh_root / "plugins" / "abbr.zsh",
+        *collect_function_files(zsh_root),
+    }
+    return merge_shortcuts(
+        zsh_root, {path: shortcut_file_records(scanner, path) for path in files}
+    )
 
 
 def main() -> int:
     parser = argparse.ArgumentParser(description="Extract Zsh shortcuts")
     parser.add_argument("--root", type=Path, required=True)
+    parser.add_argument("--format", choices=RECORD_FORMATS, default="json")
     args = parser.parse_args()
 
-    records = collect_shortcuts(args.root.resolve())
-    json.dump(records, sys.stdout, indent=2, ensure_ascii=False)
-    sys.stdout.write("\n")
+    root = args.root.resolve()
+    records = collect_shortcuts(root, ZshScanner(root, default_memo_dir()))
+    dump_records(records, sys.stdout, args.format)
     return 0
 
 
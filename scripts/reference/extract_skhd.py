@@ -4,25 +4,27 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 from pathlib import Path
 
+from common.records_io import RECORD_FORMATS, dump_records
 from keybindings.schema import to_record
 from keybindings.skhd_config import parse_skhdrc
 
 
+def collect_skhd_bindings(root: Path) -> list[dict[str, str]]:
+    text = (root / ".skhdrc").read_text(encoding="utf-8")
+    return [to_record(binding) for binding in parse_skhdrc(text)]
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Extract skhd keybindings")
     parser.add_argument("--root", type=Path, required=True)
+    parser.add_argument("--format", choices=RECORD_FORMATS, default="json")
     args = parser.parse_args()
 
-    skhdrc_path = args.root.resolve() / ".skhdrc"
-    text = skhdrc_path.read_text(encoding="utf-8")
-    records = [to_record(binding) for binding in parse_skhdrc(text)]
-
-    json.dump(records, sys.stdout, indent=2, ensure_ascii=False)
-    sys.stdout.write("\n")
+    records = collect_skhd_bindings(args.root.resolve())
+    dump_records(records, sys.stdout, args.format)
     return 0
 
 
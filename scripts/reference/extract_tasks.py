@@ -4,37 +4,80 @@
 from __future__ import annotations
 
 import argparse
-import json
+import os
 import subprocess
 import sys
 from pathlib import Path
 
+from common.cache import file_digest
+from common.records_io import RECORD_FORMATS, dump_records
 from tasks.transform import parse_tasks_json
 
 
+def read_mise_tasks_json(root: Path) -> str:
+    result = subprocess.run(
+        ["mise", "tasks", "--json"],
+        cwd=root,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout
+
+
+def read_mise_version() -> str:
+    completed = subprocess.run(
+        ["mise", "--version"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return completed.stdout.strip()
+
+
+def mise_global_config() -> Path:
+    """The user-level config whose tasks ``mise tasks`` also lists."""
+    explicit = os.environ.get("MISE_GLOBAL_CONFIG_FILE")
+    if explicit:
+        return Path(explicit)
+    config_dir = os.environ.get("MISE_CONFIG_DIR")
+    if not config_dir:
+        config_home = os.environ.get("XDG_CONFIG_HOME") or str(Path.home() / ".config")
+        config_dir = os.path.join(config_home, "mise")
+    return Path(config_dir) / "config.toml"
+
+
+def mise_config_state() -> str:
+    """Cache key component: the global config's path and content.
+
+    The global config lives outside the repo, so the stage's input globs do
+    not cover it. The mise version is checked separately (tool_stamp).
+    """
+    config = mise_global_config()
+    try:
+        content = file_digest(config)
+    except OSError:
+        content = "absent"
+    return f"{config}:{content}"
+
+
+def collect_tasks(root: Path, input_file: Path | None = None) -> list[dict[str, str]]:
+    if input_file is not None:
+        text = input_file.read_text(encoding="utf-8")
+    else:
+        text = read_mise_tasks_json(root)
+    return parse_tasks_json(text, root)
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Extract mise tasks")
     parser.add_argument("--root", type=Path, required=True)
     parser.add_argument("--input-file", type=Path, default=None)
+    parser.add_argument("--format", choices=RECORD_FORMATS, default="json")
     args = parser.parse_args()
 
-    root = args.root.resolve()
-
-    if args.input_file is not None:
-        text = args.input_file.read_text(encoding="utf-8")
-    else:
-        result = subprocess.run(
-            ["mise", "tasks", "--json"],
-            cwd=root,
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        text = result.stdout
-
-    records = parse_tasks_json(text, root)
-    json.dump(records, sys.stdout, indent=2, ensure_ascii=False)
-    sys.stdout.write("\n")
+    records = collect_tasks(args.root.resolve(), args.input_file)
+    dump_records(records, sys.stdout, args.format)
     return 0
 
 
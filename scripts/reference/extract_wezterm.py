@@ -4,13 +4,24 @@
 from __future__ import annotations
 
 import argparse
-import json
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from common.cache import cache_dir, read_keyed_json, source_digest, write_keyed_json
+from common.records_io import RECORD_FORMATS, dump_records
+from keybindings import wezterm_lua
 from keybindings.schema import to_record
-from keybindings.wezterm_lua import diff_against_default, parse_show_keys_lua
+from keybindings.wezterm_lua import (
+    ParsedWeztermKey,
+    diff_against_default,
+    keys_from_json,
+    keys_to_json,
+    parse_show_keys_lua,
+)
+
+DEFAULT_KEYS_CACHE_NAME = "wezterm-default-keys.json"
 
 
 def read_lua_from_wezterm(*, use_default_config: bool, config_file: str | None) -> str:
@@ -30,32 +41,96 @@ def read_lua_from_wezterm(*, use_default_config: bool, config_file: str | None)
     return completed.stdout
 
 
+def read_wezterm_version() -> str:
+    completed = subprocess.run(
+        ["wezterm", "--version"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return completed.stdout.strip()
+
+
+def default_keys_cache_key(version: str) -> str:
+    # The default keymap depends only on the wezterm binary; the parser digest
+    # invalidates entries written by an older parse_show_keys_lua.
+    return f"{version}:{source_digest(wezterm_lua)}"
+
+
+def load_effective_lua(config_file: str | None, effective_file: Path | None) -> str:
+    if effective_file is not None:
+        return effective_file.read_text(encoding="utf-8")
+    return read_lua_from_wezterm(use_default_config=False, config_file=config_file)
+
+
+def load_default_keys(
+    default_file: Path | None, *, use_cache: bool
+) -> list[ParsedWeztermKey]:
+    """Return the parsed default keymap, reusing the per-version cache on a hit.
+
+    A cache hit skips the ``wezterm -n show-keys --lua`` launch entirely.
+    """
+    if default_file is not None:
+        return parse_show_keys_lua(default_file.read_text(encoding="utf-8"))
+    if not use_cache:
+        return parse_show_keys_lua(
+            read_lua_from_wezterm(use_default_config=True, config_file=None)
+        )
+
+    cache_path = cache_dir() / DEFAULT_KEYS_CACHE_NAME
+    key = default_keys_cache_key(read_wezterm_version())
+    cached = read_keyed_json(cache_path, key)
+    if cached is not None:
+        try:
+            return keys_from_json(cached)
+        except (TypeError, ValueError):
+            pass
+
+    default = parse_show_keys_lua(
+        read_lua_from_wezterm(use_default_config=True, config_file=None)
+    )
+    write_keyed_json(cache_path, key, keys_to_json(default))
+    return default
+
+
+def collect_wezterm_bindings(
+    *,
+    config_file: str | None,
+    effective_file: Path | None = None,
+    default_file: Path | None = None,
+    use_cache: bool = True,
+) -> list[dict[str, str]]:
+    # Each dump starts a full wezterm binary; run the effective dump alongside
+    # the default lookup so the step costs one launch of latency, not two.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        effective_future = pool.submit(load_effective_lua, config_file, effective_file)
+        default = load_default_keys(default_file, use_cache=use_cache)
+        effective_text = effective_future.result()
+
+    effective = parse_show_keys_lua(effective_text)
+    return [to_record(kb) for kb in diff_against_default(effective, default)]
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Extract WezTerm keybindings")
     parser.add_argument("--effective-file", type=Path)
     parser.add_argument("--default-file", type=Path)
     parser.add_argument("--config-file", type=str)
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="always dump the default keymap instead of reusing the version cache",
+    )
+    parser.add_argument("--format", choices=RECORD_FORMATS, default="json")
     args = parser.parse_args()
 
-    if args.effective_file is not None:
-        effective_text = args.effective_file.read_text(encoding="utf-8")
-    else:
-        effective_text = read_lua_from_wezterm(
-            use_default_config=False,
-            config_file=args.config_file,
-        )
-
-    if args.default_file is not None:
-        default_text = args.default_file.read_text(encoding="utf-8")
-    else:
-        default_text = read_lua_from_wezterm(use_default_config=True, config_file=None)
-
-    effective = parse_show_keys_lua(effective_text)
-    default = parse_show_keys_lua(default_text)
-    records = [to_record(kb) for kb in diff_against_default(effective, default)]
-
-    json.dump(records, sys.stdout, indent=2, ensure_ascii=False)
-    sys.stdout.write("\n")
+    records = collect_wezterm_bindings(
+        config_file=args.config_file,
+        effective_file=args.effective_file,
+        default_file=args.default_file,
+        use_cache=not args.no_cache,
+    )
+    dump_records(records, sys.stdout, args.format)
     return 0
 
 
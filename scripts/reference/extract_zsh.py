@@ -4,35 +4,59 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sys
+from collections.abc import Mapping
 from pathlib import Path
 
+from common.records_io import RECORD_FORMATS, dump_records
 from keybindings.schema import Keybinding, to_record
-from keybindings.zsh_bindkey import collapse_equivalent_sequences, parse_bindkey_text
+from keybindings.zsh_bindkey import collapse_equivalent_sequences
+from zsh_sources import ZshScanner, default_memo_dir
 
 
-def collect_zsh_bindings(root: Path) -> list[dict[str, str]]:
-    zsh_root = root / ".config" / "zsh"
-    bindings: list[Keybinding] = []
+def zsh_file_bindings(scanner: ZshScanner, zsh_file: Path) -> list[dict[str, str]]:
+    """Bindkey records of one file; raises ValueError on unsupported syntax."""
+    scan = scanner.scan(zsh_file)
+    if scan is None:
+        return []
+    if scan.bindkey_error:
+        raise ValueError(scan.bindkey_error)
+    return [to_record(binding) for binding in scan.bindkeys]
+
 
-    for zsh_file in sorted(zsh_root.rglob("*.zsh")):
-        relative_source = zsh_file.relative_to(root).as_posix()
-        text = zsh_file.read_text(encoding="utf-8")
-        bindings.extend(parse_bindkey_text(text, relative_source))
+def merge_zsh_bindings(
+    by_file: Mapping[Path, list[dict[str, str]]],
+) -> list[dict[str, str]]:
+    """Concatenate per-file records in path order, collapsing equivalents."""
+    bindings = [
+        Keybinding(**record) for records in by_file.values() for record in records
+    ]
+    return [to_record(binding) for binding in collapse_equivalent_sequences(bindings)]
 
-    collapsed = collapse_equivalent_sequences(bindings)
-    return [to_record(binding) for binding in collapsed]
+
+def collect_zsh_bindings(
+    root: Path, scanner: ZshScanner | None = None
+) -> list[dict[str, str]]:
+    """Collect bindkey bindings; raises ValueError on unsupported syntax."""
+    scanner = scanner or ZshScanner(root)
+    zsh_root = root / ".config" / "zsh"
+    return merge_zsh_bindings(
+        {
+            zsh_file: zsh_file_bindings(scanner, zsh_file)
+            for zsh_file in sorted(zsh_root.rglob("*.zsh"))
+        }
+    )
 
 
 def main() -> int:
     parser = argparse.ArgumentParser(description="Extract Zsh bindkey bindings")
     parser.add_argument("--root", type=Path, required=True)
+    parser.add_argument("--format", choices=RECORD_FORMATS, default="json")
     args = parser.parse_args()
 
-    records = collect_zsh_bindings(args.root.resolve())
-    json.dump(records, sys.stdout, indent=2, ensure_ascii=False)
-    sys.stdout.write("\n")
+    root = args.root.resolve()
+    records = collect_zsh_bindings(root, ZshScanner(root, default_memo_dir()))
+    dump_records(records, sys.stdout, args.format)
     return 0
 
 
@@ -0,0 +1,147 @@
+"""Tool-independent chord notation for keybinding keys.
+
+Each tool spells a key press its own way: wezterm ``CTRL|SHIFT`` + ``K``,
+skhd ``shift+ctrl`` + ``k``, zsh ``^K`` (humanized to ``Ctrl+K``), nvim
+``<C-k>``. A stroke is one key press in a single canonical spelling such as
+``ctrl+shift+k``: modifiers in MODIFIER_ORDER, then the key name. A chord is
+the tuple of strokes a binding is typed as, so strokes from different tools
+are equal exactly when they are the same physical key press.
+
+The tool modules only split their notation into modifiers and keys; the
+canonical spelling comes from the helpers here, and so does the modifier
+order and alias resolution of each tool's displayed key (spell_modifiers,
+stroke_parts), so the key a page shows and the key conflicts are found by
+cannot drift apart. A leader (wezterm's
+``LEADER`` mod, nvim's ``<leader>``) is expanded to the chord the tool's
+config assigns it, so ``LEADER`` + ``c`` with ``leader = CTRL+a`` is
+``("ctrl+a", "c")`` and collides with zsh's ``^A``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+
+Chord = tuple[str, ...]
+
+# tool -> the chord its leader key stands for, e.g. {"wezterm": ("ctrl+a",)}.
+Leaders = Mapping[str, Chord]
+
+MODIFIER_ORDER: tuple[str, ...] = ("ctrl", "alt", "shift", "cmd")
+
+MODIFIER_ALIASES: dict[str, tuple[str, ...]] = {
+    "ctrl": ("ctrl",),
+    "control": ("ctrl",),
+    "lctrl": ("ctrl",),
+    "rctrl": ("ctrl",),
+    "c": ("ctrl",),
+    "alt": ("alt",),
+    "lalt": ("alt",),
+    "ralt": ("alt",),
+    "opt": ("alt",),
+    "option": ("alt",),
+    "meta": ("alt",),
+    "m": ("alt",),
+    "a": ("alt",),
+    "shift": ("shift",),
+    "lshift": ("shift",),
+    "rshift": ("shift",),
+    "s": ("shift",),
+    "cmd": ("cmd",),
+    "lcmd": ("cmd",),
+    "rcmd": ("cmd",),
+    "super": ("cmd",),
+    "d": ("cmd",),
+    "hyper": ("ctrl", "alt", "shift", "cmd"),
+    "meh": ("ctrl", "alt", "shift"),
+}
+
+KEY_ALIASES: dict[str, str] = {
+    " ": "space",
+    "space": "space",
+    "enter": "enter",
+    "return": "enter",
+    "cr": "enter",
+    "esc": "esc",
+    "escape": "esc",
+    "up": "up",
+    "uparrow": "up",
+    "down": "down",
+    "downarrow": "down",
+    "left": "left",
+    "leftarrow": "left",
+    "right": "right",
+    "rightarrow": "right",
+    "bs": "backspace",
+    "backspace": "backspace",
+    "del": "delete",
+    "delete": "delete",
+    "bslash": "\\",
+    "lt": "<",
+    "bar": "|",
+}
+
+
+def canonical_modifiers(mods: Iterable[str]) -> list[str]:
+    """Modifier names in canonical spelling and order; "none" and "" drop out.
+
+    Names outside the vocabulary (e.g. wezterm's ``LEADER``) are kept,
+    lowercased, after the known ones.
+    """
+    found: set[str] = set()
+    for mod in mods:
+        name = mod.strip().lower()
+        if name and name != "none":
+            found.update(MODIFIER_ALIASES.get(name, (name,)))
+    known = [mod for mod in MODIFIER_ORDER if mod in found]
+    return known + sorted(found - set(MODIFIER_ORDER))
+
+
+def stroke(mods: Iterable[str], key: str) -> str:
+    """One key press as ``mod+...+key`` in canonical spelling.
+
+    An uppercase letter is read as shift plus the letter. A shifted symbol
+    such as ``&`` already names the shifted key, so a shift modifier on it is
+    dropped.
+    """
+    modifiers = canonical_modifiers(mods)
+    name = KEY_ALIASES.get(key.lower(), key)
+    if len(name) == 1 and name.isalpha() and name.isupper():
+        name = name.lower()
+        if "shift" not in modifiers:
+            modifiers = canonical_modifiers([*modifiers, "shift"])
+    elif len(name) == 1 and not name.isalnum():
+        modifiers = [mod for mod in modifiers if mod != "shift"]
+    elif len(name) > 1:
+        name = name.lower()
+    return "+".join([*modifiers, name])
+
+
+def spell_modifiers(mods: Iterable[str], names: Mapping[str, str]) -> list[str]:
+    """canonical_modifiers spelled with a tool's ``names`` (e.g. ctrl -> CTRL)."""
+    return [names.get(mod, mod) for mod in canonical_modifiers(mods)]
+
+
+def stroke_parts(pressed: str) -> tuple[list[str], str]:
+    """Split a stroke back into its modifiers and key (``ctrl++`` is ctrl, +)."""
+    head, _, key = pressed.rpartition("+")
+    if not key:
+        head, key = head.removesuffix("+"), "+"
+    return (head.split("+") if head else []), key
+
+
+def split_stroke(mods: str, separator: str, key: str) -> str:
+    """Stroke of modifiers joined by ``separator`` (``CTRL|SHIFT``, ``shift+ctrl``)."""
+    return stroke(mods.split(separator), key)
+
+
+def control_stroke(mods: Iterable[str], key: str) -> str:
+    """Stroke of a control-character notation (zsh ``^N``, nvim ``<C-N>``).
+
+    Control characters ignore case, so an uppercase letter there is not a
+    shift: ``^N`` and ``<C-n>`` are both ctrl+n.
+    """
+    return stroke([*mods, "ctrl"], key.lower() if len(key) == 1 else key)
+
+
+def format_chord(chord: Chord) -> str:
+    return " ".join(chord)
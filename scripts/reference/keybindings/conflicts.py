@@ -0,0 +1,143 @@
+"""Cross-tool shadowing between keybindings that share a key press.
+
+A key press passes through the tools in LAYERS order: skhd takes global
+hotkeys first, then wezterm, then the program running in the terminal (the
+zsh line editor or nvim). A binding whose first stroke an outer layer
+already binds never fires; it is shadowed by that outer binding.
+
+ChordIndex hashes every binding by the first stroke of its chord
+(keybindings/chord.py), so finding all shadowed bindings is one pass over
+the records plus a constant number of lookups per record. Leader bindings
+start with the leader's own chord, so wezterm's ``LEADER`` (e.g. CTRL+a)
+shadows zsh ``^A`` and nvim ``<C-a>``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from keybindings.chord import Chord, Leaders
+from keybindings.dedup import Identity, key_identity
+from keybindings.nvim_diff import nvim_chord
+from keybindings.skhd_config import skhd_chord
+from keybindings.wezterm_lua import wezterm_chord
+from keybindings.zsh_bindkey import zsh_chord
+
+# Outermost first: each layer sees a key press before the ones after it.
+LAYERS: tuple[str, ...] = ("skhd", "wezterm", "zsh", "nvim")
+
+# Layer pairs that never read keys at the same time: the zsh line editor is
+# idle while nvim runs in the terminal.
+EXCLUSIVE_LAYERS: frozenset[frozenset[str]] = frozenset({frozenset({"zsh", "nvim"})})
+
+# layer -> the layers that can take a key press before it, outermost first.
+OUTER_LAYERS: dict[str, tuple[str, ...]] = {
+    layer: tuple(
+        outer
+        for outer in LAYERS[:position]
+        if frozenset({outer, layer}) not in EXCLUSIVE_LAYERS
+    )
+    for position, layer in enumerate(LAYERS)
+}
+
+# Values of the "conflict" field added by annotate_conflicts.
+SHADOWED = "shadowed"
+SHADOWS = "shadows"
+
+
+def record_chord(record: dict[str, str], leaders: Leaders) -> Chord:
+    """The record's key as a chord; () when its notation cannot be read."""
+    tool = record["tool"]
+    if tool == "wezterm":
+        return wezterm_chord(record["mode"], record["key"], leaders.get(tool, ()))
+    if tool == "skhd":
+        return skhd_chord(record["mode"], record["key"])
+    if tool == "zsh":
+        return zsh_chord(record["key"])
+    if tool == "nvim":
+        return nvim_chord(record["key"], leaders.get(tool))
+    return ()
+
+
+def intercepts(record: dict[str, str]) -> bool:
+    """Whether the binding takes its key whenever its tool has focus.
+
+    wezterm key tables (copy_mode, search_mode) only apply inside their mode.
+    """
+    return record["tool"] != "wezterm" or record["context"] == "keys"
+
+
+@dataclass(frozen=True)
+class Shadowing:
+    """Record ``shadowed`` never sees ``stroke`` because ``by`` takes it first.
+
+    Both are positions in the order records were added to the ChordIndex.
+    """
+
+    stroke: str
+    shadowed: int
+    by: int
+
+
+class ChordIndex:
+    """Bindings by first stroke, filled one record at a time.
+
+    ``leaders`` holds each tool's leader chord (keybinding_leaders in
+    keybindings/leaders.py); wezterm LEADER bindings are skipped without one.
+    """
+
+    def __init__(self, leaders: Leaders | None = None) -> None:
+        self.leaders: Leaders = leaders or {}
+        self.identities: list[Identity] = []
+        self._entries: list[tuple[str, str]] = []
+        # first stroke -> layer -> first intercepting binding in that layer
+        self._owners: dict[str, dict[str, int]] = {}
+
+    def add(self, record: dict[str, str]) -> None:
+        position = len(self.identities)
+        self.identities.append(key_identity(record))
+        chord = record_chord(record, self.leaders)
+        if not chord or record["tool"] not in LAYERS:
+            self._entries.append(("", ""))
+            return
+        self._entries.append((record["tool"], chord[0]))
+        if intercepts(record):
+            owners = self._owners.setdefault(chord[0], {})
+            owners.setdefault(record["tool"], position)
+
+    def shadowing(self) -> list[Shadowing]:
+        """Each shadowed binding with the outermost binding that takes its key."""
+        found: list[Shadowing] = []
+        for position, (layer, first) in enumerate(self._entries):
+            owners = self._owners.get(first)
+            if not layer or owners is None:
+                continue
+            for outer in OUTER_LAYERS[layer]:
+                if outer in owners:
+                    found.append(Shadowing(first, position, owners[outer]))
+                    break
+        return found
+
+
+def build_chord_index(
+    records: Iterable[dict[str, str]], leaders: Leaders | None = None
+) -> ChordIndex:
+    index = ChordIndex(leaders)
+    for record in records:
+        index.add(record)
+    return index
+
+
+def annotate_conflicts(
+    records: list[dict[str, str]], leaders: Leaders | None = None
+) -> list[dict[str, str]]:
+    """Copies of ``records`` with "conflict" set to shadowed, shadows, or ""."""
+    conflicts = [""] * len(records)
+    for shadowing in build_chord_index(records, leaders).shadowing():
+        conflicts[shadowing.shadowed] = SHADOWED
+        conflicts[shadowing.by] = SHADOWS
+    return [
+        {**record, "conflict": conflict}
+        for record, conflict in zip(records, conflicts, strict=True)
+    ]
@@ -3,25 +3,28 @@
 from __future__ import annotations
 
 from collections import Counter
+from collections.abc import Iterable
+
+Identity = tuple[str, str, str, str]
+
+
+def key_identity(record: dict[str, str]) -> Identity:
+    return (
+        record["tool"],
+        record["context"],
+        record["mode"],
+        record["key"],
+    )
 
 
 def detect_duplicate_keys(
-    records: list[dict[str, str]],
-) -> list[tuple[str, str, str, str]]:
-    identity_counts: Counter[tuple[str, str, str, str]] = Counter()
-
-    for record in records:
-        identity = (
-            record["tool"],
-            record["context"],
-            record["mode"],
-            record["key"],
-        )
-        identity_counts[identity] += 1
-
-    duplicates: list[tuple[str, str, str, str]] = []
-    for identity, count in sorted(identity_counts.items()):
-        if count > 1:
-            duplicates.append(identity)
-
-    return duplicates
+    records: Iterable[dict[str, str]],
+) -> list[Identity]:
+    identity_counts = Counter(key_identity(record) for record in records)
+    return duplicate_identities(identity_counts)
+
+
+def duplicate_identities(identity_counts: Counter[Identity]) -> list[Identity]:
+    """Return identities seen more than once, sorted."""
+    # Only the (usually few) duplicates are sorted, not every identity.
+    return sorted(identity for identity, count in identity_counts.items() if count > 1)
@@ -0,0 +1,34 @@
+"""Read the leader keys the repo's wezterm and nvim configs set."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from keybindings.chord import Chord, Leaders
+from keybindings.nvim_diff import DEFAULT_MAPLEADER, nvim_chord, parse_mapleader
+from keybindings.wezterm_lua import parse_leader
+
+
+def read_wezterm_leader(config_file: Path) -> Chord:
+    """The leader chord ``config_file`` sets; () when unset or unreadable."""
+    try:
+        return parse_leader(config_file.read_text(encoding="utf-8"))
+    except OSError:
+        return ()
+
+
+def read_mapleader(config_dir: Path) -> str:
+    """The mapleader set by the first Lua file (sorted) under ``config_dir``."""
+    for path in sorted(config_dir.rglob("*.lua")):
+        leader = parse_mapleader(path.read_text(encoding="utf-8"))
+        if leader is not None:
+            return leader
+    return DEFAULT_MAPLEADER
+
+
+def keybinding_leaders(root: Path) -> Leaders:
+    """The wezterm leader and nvim mapleader the repo's configs set, as chords."""
+    return {
+        "wezterm": read_wezterm_leader(root / ".wezterm.lua"),
+        "nvim": nvim_chord(read_mapleader(root / ".config" / "nvim")),
+    }
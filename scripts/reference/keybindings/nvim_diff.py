@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import json
+import re
 from dataclasses import dataclass
 
+from keybindings.chord import Chord, control_stroke, stroke
 from keybindings.schema import Keybinding
 
 
@@ -35,12 +37,88 @@ def parse_keymap_json(text: str) -> list[NvimKeymap]:
     return keymaps
 
 
-def normalize_lhs(lhs: str) -> str:
-    if lhs.startswith(" "):
-        return f"<leader>{lhs[1:]}"
+# Neovim's mapleader when the config sets none.
+DEFAULT_MAPLEADER = "\\"
+
+# `vim.g.mapleader = " "` (or single quotes) at the start of a line.
+MAPLEADER_PATTERN = re.compile(
+    r"""^\s*vim\.g\.mapleader\s*=\s*(?P<q>["'])(?P<value>(?:\\.|(?!(?P=q)).)*)(?P=q)""",
+    re.MULTILINE,
+)
+
+
+def parse_mapleader(config_text: str) -> str | None:
+    """The last ``vim.g.mapleader`` a config file assigns, unescaped."""
+    found = None
+    for match in MAPLEADER_PATTERN.finditer(config_text):
+        found = re.sub(r"\\(.)", r"\1", match.group("value"))
+    return found
+
+
+def normalize_lhs(lhs: str, leader: str = DEFAULT_MAPLEADER) -> str:
+    """Spell a leading ``leader`` key (the config's mapleader) as ``<leader>``.
+
+    The prefix is compared as chord strokes, so ``<Space>w`` and `` w`` both
+    start with a space leader.
+    """
+    leader_strokes = [_token_stroke(token) for token in _lhs_tokens(leader)]
+    tokens = _lhs_tokens(lhs)
+    prefix = tokens[: len(leader_strokes)]
+    if leader_strokes and [_token_stroke(token) for token in prefix] == leader_strokes:
+        return "<leader>" + "".join(tokens[len(prefix) :])
     return lhs
 
 
+def _lhs_tokens(lhs: str) -> list[str]:
+    """Split an lhs into keys: single characters and ``<...>`` names."""
+    tokens: list[str] = []
+    index = 0
+    while index < len(lhs):
+        end = lhs.find(">", index + 2) if lhs[index] == "<" else -1
+        if end != -1 and "<" not in lhs[index + 1 : end]:
+            tokens.append(lhs[index : end + 1])
+            index = end + 1
+        else:
+            tokens.append(lhs[index])
+            index += 1
+    return tokens
+
+
+def _token_stroke(token: str) -> str:
+    """Stroke of one lhs key such as ``w``, ``<C-R>`` or ``<Esc>``."""
+    if len(token) > 2 and token.startswith("<"):
+        return _special_key(token[1:-1])
+    return stroke((), token)
+
+
+def _special_key(name: str) -> str:
+    """Stroke of a ``<...>`` key name such as ``C-R`` or ``Esc``."""
+    # The key itself may be "-", as in <C-->.
+    head, _, key = name.removesuffix("-").rpartition("-")
+    key = key or "-"
+    mods = head.split("-") if head else []
+    if "c" in (mod.lower() for mod in mods):
+        # <C-J> and <C-j> are the same control character.
+        return control_stroke((mod for mod in mods if mod.lower() != "c"), key)
+    return stroke(mods, key)
+
+
+def nvim_chord(lhs: str, leader: Chord | None = None) -> Chord:
+    """Chord of a normalized lhs; ``<leader>`` stands for ``leader``.
+
+    Without ``leader``, ``<leader>`` is Neovim's default mapleader.
+    """
+    if leader is None:
+        leader = (stroke((), DEFAULT_MAPLEADER),)
+    strokes: list[str] = []
+    for token in _lhs_tokens(lhs):
+        if token.lower() == "<leader>":
+            strokes.extend(leader)
+        else:
+            strokes.append(_token_stroke(token))
+    return tuple(strokes)
+
+
 def is_plug_mapping(entry: NvimKeymap) -> bool:
     return entry.lhs.startswith("<Plug>")
 
@@ -60,6 +138,7 @@ def _identity(entry: NvimKeymap) -> tuple[str, str]:
 def exclude_builtin(
     config_maps: list[NvimKeymap],
     clean_maps: list[NvimKeymap],
+    leader: str = DEFAULT_MAPLEADER,
 ) -> list[Keybinding]:
     clean_index: dict[tuple[str, str], NvimKeymap] = {}
     for entry in clean_maps:
@@ -89,7 +168,7 @@ def exclude_builtin(
                 tool="nvim",
                 context="global:all-loaded",
                 mode=entry.mode,
-                key=normalize_lhs(entry.lhs),
+                key=normalize_lhs(entry.lhs, leader),
                 action=resolve_action(entry),
                 description=entry.desc,
                 source=".config/nvim",
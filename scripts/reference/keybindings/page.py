@@ -6,7 +6,7 @@ import json
 from collections import Counter
 
 from common.nav import build_nav
-from common.page_config import Column, Filter, PageConfig
+from common.page_config import Column, Filter, PageConfig, SearchField
 
 PAGE_CONFIG = PageConfig(
     title="Keybindings",
@@ -24,8 +24,18 @@ PAGE_CONFIG = PageConfig(
         Filter("tool", "Tool", values=("wezterm", "zsh", "skhd", "nvim")),
         Filter("mode", "Mode"),
         Filter("origin", "Origin", values=("custom", "default"), default=("custom",)),
+        Filter("conflict", "Conflicts", values=("shadowed", "shadows")),
     ),
-    search_fields=("key", "action", "description", "source"),
+    search_fields=(
+        SearchField("key", weight=3),
+        SearchField("action", weight=2),
+        SearchField("description", weight=2),
+        "source",
+    ),
+    # Key notations vary across tools ("C-k", "Ctrl+K", "ctrl+k"), which a
+    # subsequence match bridges. The page holds a few hundred records, well
+    # under TRIGRAM_AUTO_MIN_RECORDS, so the scorer replaces no index here.
+    search_mode="fuzzy",
     badge_classes={
         "added": "badge-green",
         "overridden": "badge-orange",
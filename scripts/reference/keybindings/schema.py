@@ -7,6 +7,7 @@ from dataclasses import dataclass
 ALLOWED_TOOLS: frozenset[str] = frozenset({"wezterm", "zsh", "skhd", "nvim"})
 ALLOWED_ORIGINS: frozenset[str] = frozenset({"default", "custom"})
 ALLOWED_CHANGES: frozenset[str] = frozenset({"unchanged", "added", "overridden"})
+ALLOWED_CONFLICTS: frozenset[str] = frozenset({"", "shadowed", "shadows"})
 
 REQUIRED_NON_EMPTY_FIELDS: tuple[str, ...] = (
     "tool",
@@ -67,6 +68,10 @@ def validate_record(record: dict[str, str]) -> list[str]:
     if change and change not in ALLOWED_CHANGES:
         errors.append(f"invalid change: {change!r}")
 
+    conflict = record.get("conflict", "")
+    if conflict not in ALLOWED_CONFLICTS:
+        errors.append(f"invalid conflict: {conflict!r}")
+
     description = record.get("description")
     if description is not None and not isinstance(description, str):
         errors.append("description must be a string")
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 
+from keybindings.chord import Chord, canonical_modifiers, split_stroke
 from keybindings.schema import Keybinding
 
 COMMENT_PATTERN = re.compile(r"^\s*#\s*(.+?)\s*$")
@@ -13,8 +14,12 @@ BINDING_PATTERN = re.compile(
 
 
 def normalize_skhd_mods(mods: str) -> str:
-    parts = [part.strip() for part in mods.split("+")]
-    return "+".join(parts)
+    """``shift + ctrl`` style mods as ``ctrl+shift`` (chord.canonical_modifiers)."""
+    return "+".join(canonical_modifiers(mods.split("+")))
+
+
+def skhd_chord(mods: str, key: str) -> Chord:
+    return (split_stroke(mods, "+", key),)
 
 
 def parse_skhdrc(text: str) -> list[Keybinding]:
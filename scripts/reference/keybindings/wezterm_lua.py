@@ -5,6 +5,7 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 
+from keybindings.chord import Chord, spell_modifiers, split_stroke, stroke
 from keybindings.schema import Keybinding
 
 BINDING_LINE_PATTERN = re.compile(
@@ -16,6 +17,23 @@ KEY_TABLES_SECTION_PATTERN = re.compile(r"^\s*key_tables\s*=\s*\{")
 KEY_TABLE_NAME_PATTERN = re.compile(r"^\s*(\w+)\s*=\s*\{")
 EMIT_EVENT_PATTERN = re.compile(r"^EmitEvent\s+'user-defined-\d+'$")
 
+# show-keys does not print the leader, so it is read from the config file:
+# `leader = { key = "a", mods = "CTRL", timeout_milliseconds = 2000 },`
+LEADER_PATTERN = re.compile(r"^\s*leader\s*=\s*\{(?P<fields>[^}]*)\}", re.MULTILINE)
+LEADER_FIELD_PATTERN = re.compile(
+    r"""\b(?P<name>key|mods)\s*=\s*(?P<q>["'])(?P<value>.*?)(?P=q)"""
+)
+
+
+# Canonical modifier -> wezterm spelling; LEADER is kept and listed first.
+WEZTERM_MODIFIER_NAMES: dict[str, str] = {
+    "ctrl": "CTRL",
+    "alt": "ALT",
+    "shift": "SHIFT",
+    "cmd": "SUPER",
+    "leader": "LEADER",
+}
+
 
 @dataclass(frozen=True)
 class ParsedWeztermKey:
@@ -30,10 +48,40 @@ def unescape_lua_key(key: str) -> str:
 
 
 def normalize_mods(mods: str) -> str:
-    if mods == "NONE":
-        return "NONE"
-    parts = sorted(mods.split("|"))
-    return "|".join(parts)
+    """``CTRL|SHIFT`` style mods in canonical order (chord.canonical_modifiers)."""
+    parts = spell_modifiers(mods.split("|"), WEZTERM_MODIFIER_NAMES)
+    if "LEADER" in parts:
+        parts = ["LEADER", *(part for part in parts if part != "LEADER")]
+    return "|".join(parts) or "NONE"
+
+
+def parse_leader(config_text: str) -> Chord:
+    """The chord of the config's ``leader`` key; () when none is set."""
+    match = LEADER_PATTERN.search(config_text)
+    if match is None:
+        return ()
+    fields = {
+        field.group("name"): field.group("value")
+        for field in LEADER_FIELD_PATTERN.finditer(match.group("fields"))
+    }
+    if "key" not in fields:
+        return ()
+    return (split_stroke(fields.get("mods", "NONE"), "|", fields["key"]),)
+
+
+def wezterm_chord(mods: str, key: str, leader: Chord = ()) -> Chord:
+    """Chord of a binding's normalized mods and key.
+
+    LEADER bindings are typed after ``leader`` (parse_leader); without one
+    they cannot fire and give ().
+    """
+    parts = mods.split("|")
+    # phys:/mapped: pick how the key is matched, not which key it is.
+    key = key.split(":", 1)[1] if key.startswith(("phys:", "mapped:")) else key
+    pressed = stroke((part for part in parts if part != "LEADER"), key)
+    if "LEADER" not in parts:
+        return (pressed,)
+    return (*leader, pressed) if leader else ()
 
 
 def strip_act_prefix(action: str) -> str:
@@ -102,6 +150,43 @@ def parse_show_keys_lua(text: str) -> list[ParsedWeztermKey]:
     return parsed
 
 
+def keys_to_json(keys: list[ParsedWeztermKey]) -> list[dict[str, str]]:
+    return [
+        {
+            "context": entry.context,
+            "key": entry.key,
+            "mods": entry.mods,
+            "action": entry.action,
+        }
+        for entry in keys
+    ]
+
+
+def keys_from_json(raw: object) -> list[ParsedWeztermKey]:
+    """Rebuild parsed keys from keys_to_json output.
+
+    Raises TypeError or ValueError when the cached payload is malformed.
+    """
+    if not isinstance(raw, list):
+        raise TypeError("cached WezTerm keys must be a list")
+    keys: list[ParsedWeztermKey] = []
+    for entry in raw:
+        if not isinstance(entry, dict):
+            raise TypeError(f"invalid cached WezTerm key: {entry!r}")
+        try:
+            keys.append(
+                ParsedWeztermKey(
+                    context=str(entry["context"]),
+                    key=str(entry["key"]),
+                    mods=str(entry["mods"]),
+                    action=str(entry["action"]),
+                )
+            )
+        except KeyError as exc:
+            raise ValueError(f"cached WezTerm key missing field: {exc}") from exc
+    return keys
+
+
 def _identity(entry: ParsedWeztermKey) -> tuple[str, str, str]:
     return (entry.context, entry.key, entry.mods)
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 
+from keybindings.chord import Chord, control_stroke, stroke, stroke_parts
 from keybindings.schema import Keybinding
 
 BINDKEY_KEYMAP_PATTERN = re.compile(r"^bindkey\s+-v\s*$")
@@ -50,35 +51,60 @@ def parse_bindkey_line(line: str) -> ZshBindkey | None:
     return ZshBindkey(sequence=sequence, widget=widget)
 
 
-def humanize_key_sequence(seq: str) -> str:
-    if seq == " ":
-        return "Space"
-
-    escape_map = {
-        r"\e[A": "Up",
-        r"\eOA": "Up",
-        r"\e[B": "Down",
-        r"\eOB": "Down",
-    }
-    if seq in escape_map:
-        return escape_map[seq]
-
-    if seq.startswith("^") and len(seq) >= 2:
-        if seq == "^ ":
-            return "Ctrl+Space"
-        if seq == "^]":
-            return "Ctrl+]"
-        if seq == "^\\":
-            return "Ctrl+\\"
-        if len(seq) == 2:
-            control_char = seq[1]
-            return f"Ctrl+{control_char.upper()}"
-        if len(seq) == 3 and seq[1].isupper() and seq[2].islower():
-            return f"Ctrl+{seq[1]} {seq[2]}"
+# Sequences named after the key they send, as a chord.KEY_ALIASES name.
+SEQUENCE_KEYS: dict[str, str] = {
+    " ": "space",
+    r"\e[A": "up",
+    r"\eOA": "up",
+    r"\e[B": "down",
+    r"\eOB": "down",
+}
+
+
+def _spell_stroke(pressed: str) -> str:
+    """A chord stroke as zsh keys are shown: ``ctrl+x`` -> ``Ctrl+X``."""
+    mods, key = stroke_parts(pressed)
+    name = key.upper() if len(key) == 1 else key.capitalize()
+    return "+".join([*(mod.capitalize() for mod in mods), name])
 
+
+def humanize_key_sequence(seq: str) -> str:
+    """Readable key name, spelled from the sequence's chord strokes."""
+    if seq in SEQUENCE_KEYS:
+        return _spell_stroke(stroke((), SEQUENCE_KEYS[seq]))
+    if seq.startswith("^") and len(seq) == 2:
+        return _spell_stroke(control_stroke((), seq[1]))
+    if len(seq) == 3 and seq[0] == "^" and seq[1].isupper() and seq[2].islower():
+        return f"{_spell_stroke(control_stroke((), seq[1]))} {seq[2]}"
     return seq
 
 
+def zsh_chord(key: str) -> Chord:
+    """Chord of a humanize_key_sequence result.
+
+    ``Ctrl+N`` and ``^N`` are control characters (chord.control_stroke). Raw
+    escape sequences (``\\e[1;5C``) encode keys per terminal and give ().
+    """
+    if "\\" in key.replace("Ctrl+\\", ""):
+        return ()
+    if key in ("Space", "Up", "Down"):
+        return (stroke((), key),)
+    strokes: list[str] = []
+    rest = key
+    if key.startswith("Ctrl+"):
+        first, _, rest = key.removeprefix("Ctrl+").partition(" ")
+        strokes.append(control_stroke((), first))
+    index = 0
+    while index < len(rest):
+        if rest[index] == "^" and index + 1 < len(rest):
+            strokes.append(control_stroke((), rest[index + 1]))
+            index += 2
+        else:
+            strokes.append(stroke((), rest[index]))
+            index += 1
+    return tuple(strokes)
+
+
 def bindkey_to_keybinding(bindkey: ZshBindkey, source_path: str) -> Keybinding:
     return Keybinding(
         tool="zsh",
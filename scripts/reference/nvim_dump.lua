@@ -1,3 +1,8 @@
+-- Dump global keymaps as JSON to the file named by an environment variable.
+--
+-- Sourced after user config (`+luafile`) it writes KB_DUMP_PATH. Sourced via
+-- `--cmd` with g:kb_dump_env = "KB_BUILTIN_DUMP_PATH" it runs before any user
+-- config loads and captures Neovim's builtin maps in the same session.
 local modes = { "n", "v", "i", "x", "o", "t", "c" }
 local dump = {}
 
@@ -13,14 +18,15 @@ for _, mode in ipairs(modes) do
   end
 end
 
-local path = vim.env.KB_DUMP_PATH
+local env_name = vim.g.kb_dump_env or "KB_DUMP_PATH"
+local path = vim.env[env_name]
 if path == nil or path == "" then
-  error("KB_DUMP_PATH is not set")
+  error(env_name .. " is not set")
 end
 
 local file = io.open(path, "w")
 if file == nil then
-  error("failed to open KB_DUMP_PATH for writing: " .. path)
+  error("failed to open " .. env_name .. " for writing: " .. path)
 end
 
 file:write(vim.json.encode(dump))
@@ -1,35 +1,68 @@
 #!/usr/bin/env python3
-"""Render reference records to HTML or TSV for a given domain.
+"""Render reference records to HTML, TSV, or a binary record table.
 
 Each domain (keybindings, shortcuts, tasks, claude) exposes a `page` module
 with PAGE_CONFIG, TSV_FIELDS, and build_meta(records). This script dispatches
 on --domain so the renderer itself stays domain-agnostic.
+
+--input accepts JSON, JSONL, or a record table written by --table; tables are
+memory-mapped and read without JSON parsing (see common/record_table.py).
+
+--tsv --query ranks the rows by the fuzzy matcher the HTML page uses
+(common/fuzzy.py), weighted by the domain's PageConfig.search_fields.
+
+--html --split-data writes the records to a content-hashed data file next to
+index.html that the page fetches (see common/page_data.py).
+
+--html --skip-unchanged leaves the page alone when neither the records nor
+the renderer changed since it was written (common/render_inputs.py), so its
+bytes and generated_at stay the same.
 """
 
 from __future__ import annotations
 
 import argparse
 import importlib
-import json
 import subprocess
 import sys
+from collections.abc import Iterator, Mapping
 from datetime import UTC, datetime
 from pathlib import Path
 
-from common.render_html import render_searchable_html
-from common.render_tsv import render_tsv
+from common.fuzzy import rank_records
+from common.page_config import AssetLinks, search_field_specs
+from common.page_data import write_page_data
+from common.record_table import RecordTable, is_record_table, write_record_table
+from common.records_io import read_records
+from common.render_html import page_payload, render_searchable_html
+from common.render_inputs import output_is_current, record_output, render_inputs_key
+from common.render_tsv import iter_tsv_lines
+
+
+def load_records(
+    input_path: str | None, where: Mapping[str, str] | None = None
+) -> Iterator[dict[str, str]]:
+    """Stream records from JSON, JSONL (stdin for None / ``-``), or a table.
+
+    ``where`` keeps only records whose fields equal the given values.
+    """
+    if input_path is not None and is_record_table(Path(input_path)):
+        with RecordTable.open(Path(input_path)) as table:
+            yield from table.records(where)
+        return
+    for record in read_records(input_path):
+        if all(record.get(name) == value for name, value in (where or {}).items()):
+            yield record
 
 
-def load_records(input_path: str | None) -> list[dict[str, str]]:
-    if input_path is None or input_path == "-":
-        text = sys.stdin.read()
-    else:
-        with open(input_path, encoding="utf-8") as handle:
-            text = handle.read()
-    loaded = json.loads(text)
-    if not isinstance(loaded, list):
-        raise TypeError("input JSON must be an array")
-    return loaded
+def parse_where(pairs: list[str]) -> dict[str, str]:
+    where: dict[str, str] = {}
+    for pair in pairs:
+        name, sep, value = pair.partition("=")
+        if not sep:
+            raise ValueError(f"--where expects FIELD=VALUE, got {pair!r}")
+        where[name] = value
+    return where
 
 
 def resolve_git_commit() -> str:
@@ -62,34 +95,143 @@ def write_output(content: str, out_path: Path | None) -> None:
     out_path.write_text(content, encoding="utf-8")
 
 
+def write_lines(lines: Iterator[str], out_path: Path | None) -> None:
+    """Write lines as they are produced instead of joining them first."""
+    if out_path is None:
+        sys.stdout.writelines(lines)
+        return
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    with out_path.open("w", encoding="utf-8") as handle:
+        handle.writelines(lines)
+
+
+def render_domain_html(
+    domain: str,
+    records: list[dict[str, str]],
+    *,
+    generated_at: str,
+    commit: str,
+    data_url: str | None = None,
+    assets: AssetLinks | None = None,
+) -> str:
+    page = importlib.import_module(f"{domain}.page")
+    meta = dict(page.build_meta(records))
+    meta["generated_at"] = generated_at
+    meta["commit"] = commit
+    return render_searchable_html(
+        records, page.PAGE_CONFIG, meta, data_url=data_url, assets=assets
+    )
+
+
+def domain_payload(domain: str, records: list[dict[str, str]]) -> object:
+    """The records in the page's data encoding (what DATA holds)."""
+    page = importlib.import_module(f"{domain}.page")
+    return page_payload(records, page.PAGE_CONFIG)
+
+
+def write_domain_data(domain: str, records: list[dict[str, str]], out_dir: Path) -> str:
+    """Write the page's split-out data file; return its name (the data URL)."""
+    return write_page_data(domain_payload(domain, records), out_dir)
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Render reference records")
     parser.add_argument("--domain", default="keybindings")
     parser.add_argument("--input", default="-")
     parser.add_argument("--html", action="store_true")
     parser.add_argument("--tsv", action="store_true")
+    parser.add_argument(
+        "--table",
+        action="store_true",
+        help="write a memory-mappable record table (requires --out)",
+    )
+    parser.add_argument(
+        "--where",
+        action="append",
+        default=[],
+        metavar="FIELD=VALUE",
+        help="only render records whose FIELD equals VALUE (repeatable)",
+    )
+    parser.add_argument(
+        "--query",
+        help="with --tsv: only rows fuzzy-matching QUERY, best match first",
+    )
+    parser.add_argument(
+        "--split-data",
+        action="store_true",
+        help="with --html: fetch records from a hashed data file (requires --out)",
+    )
+    parser.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help="with --html: keep the existing page (and its generated_at) when "
+        "the records and renderer are unchanged (requires --out)",
+    )
     parser.add_argument("--out")
     args = parser.parse_args()
 
-    if args.html == args.tsv:
-        print("exactly one of --html or --tsv is required", file=sys.stderr)
+    if [args.html, args.tsv, args.table].count(True) != 1:
+        print("exactly one of --html, --tsv, or --table is required", file=sys.stderr)
+        return 1
+    if args.table and args.out is None:
+        print("--table requires --out", file=sys.stderr)
+        return 1
+    if args.split_data and (not args.html or args.out is None):
+        print("--split-data requires --html and --out", file=sys.stderr)
+        return 1
+    if args.skip_unchanged and (not args.html or args.out is None):
+        print("--skip-unchanged requires --html and --out", file=sys.stderr)
+        return 1
+    if args.query is not None and not args.tsv:
+        print("--query requires --tsv", file=sys.stderr)
+        return 1
+    try:
+        where = parse_where(args.where)
+    except ValueError as exc:
+        print(exc, file=sys.stderr)
         return 1
 
     page = importlib.import_module(f"{args.domain}.page")
     input_path = None if args.input == "-" else args.input
-    records = load_records(input_path)
-
-    if args.html:
-        meta = dict(page.build_meta(records))
-        meta["generated_at"] = datetime.now(UTC).isoformat()
-        meta["commit"] = resolve_git_commit()
-        content = render_searchable_html(records, page.PAGE_CONFIG, meta)
-        out_path = resolve_output_path(args.out, html_mode=True)
-    else:
-        content = render_tsv(records, page.TSV_FIELDS)
-        out_path = resolve_output_path(args.out, html_mode=False)
-
+    records = load_records(input_path, where)
+
+    if args.table:
+        write_record_table(Path(args.out), records)
+        return 0
+
+    if args.tsv:
+        # TSV rows depend only on their own record, so they stream through
+        # unless they have to be ranked first.
+        if args.query is not None:
+            fields = search_field_specs(page.PAGE_CONFIG.search_fields)
+            records = iter(rank_records(list(records), args.query, fields))
+        lines = iter_tsv_lines(records, page.TSV_FIELDS)
+        write_lines(lines, resolve_output_path(args.out, html_mode=False))
+        return 0
+
+    rows = list(records)
+    out_path = resolve_output_path(args.out, html_mode=True)
+    data_url = (
+        write_domain_data(args.domain, rows, out_path.parent)
+        if args.split_data and out_path is not None
+        else None
+    )
+    key = None
+    if args.skip_unchanged and out_path is not None:
+        key = render_inputs_key("page", args.domain, rows, data_url, None)
+        if output_is_current(out_path, key):
+            print(f"unchanged: {out_path}", file=sys.stderr)
+            return 0
+    content = render_domain_html(
+        args.domain,
+        rows,
+        generated_at=datetime.now(UTC).isoformat(),
+        commit=resolve_git_commit(),
+        data_url=data_url,
+    )
     write_output(content, out_path)
+    if key is not None and out_path is not None:
+        record_output(out_path, key)
     return 0
 
 
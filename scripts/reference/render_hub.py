@@ -1,5 +1,10 @@
 #!/usr/bin/env python3
-"""Render the reference hub landing page (site root index.html)."""
+"""Render the reference hub landing page (site root index.html).
+
+--skip-unchanged keeps an existing page, and its generated_at, when the
+counts and the renderer are the same as when it was written (see
+common/render_inputs.py).
+"""
 
 from __future__ import annotations
 
@@ -12,6 +17,7 @@ from pathlib import Path
 
 from common.hub_html import render_hub
 from common.nav import DOMAIN_ORDER
+from common.render_inputs import output_is_current, record_output, render_inputs_key
 
 NOTES = {
     "keybindings": "wezterm · zsh · skhd · nvim",
@@ -56,26 +62,47 @@ def main() -> int:
         help='JSON object of per-domain record counts, e.g. {"keybindings": 384}',
     )
     parser.add_argument("--out")
+    parser.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help="keep the existing page (and its generated_at) when the counts and "
+        "renderer are unchanged (requires --out)",
+    )
     args = parser.parse_args()
+    if args.skip_unchanged and args.out is None:
+        print("--skip-unchanged requires --out", file=sys.stderr)
+        return 1
 
     counts = json.loads(args.counts)
     if not isinstance(counts, dict):
         raise TypeError("--counts must be a JSON object")
 
+    cards = build_cards(counts)
+    out_path = None
+    if args.out is not None:
+        out_path = Path(args.out)
+        if out_path.is_dir() or args.out.endswith("/"):
+            out_path = out_path / "index.html"
+    key = None
+    if args.skip_unchanged and out_path is not None:
+        key = render_inputs_key("hub", cards, None)
+        if output_is_current(out_path, key):
+            print(f"unchanged: {out_path}", file=sys.stderr)
+            return 0
+
     meta = {
         "generated_at": datetime.now(UTC).isoformat(),
         "commit": resolve_git_commit(),
     }
-    content = render_hub(build_cards(counts), meta)
+    content = render_hub(cards, meta)
 
-    if args.out is None:
+    if out_path is None:
         sys.stdout.write(content)
         return 0
-    out_path = Path(args.out)
-    if out_path.is_dir() or args.out.endswith("/"):
-        out_path = out_path / "index.html"
     out_path.parent.mkdir(parents=True, exist_ok=True)
     out_path.write_text(content, encoding="utf-8")
+    if key is not None:
+        record_output(out_path, key)
     return 0
 
 
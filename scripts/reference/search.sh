@@ -5,8 +5,7 @@ cd "$(git rev-parse --show-toplevel)"
 source scripts/lib.sh
 
 CACHE_DIR="${XDG_CACHE_HOME:-${HOME}/.cache}/dotfiles/keybindings"
-CACHE_JSON="${CACHE_DIR}/keybindings.json"
-CACHE_TSV="${CACHE_DIR}/keybindings.tsv"
+CACHE_TABLE="${CACHE_DIR}/keybindings.rtb"
 
 SOURCE_PATHS=(
     ".wezterm.lua"
@@ -16,27 +15,39 @@ SOURCE_PATHS=(
     "scripts/reference"
 )
 
+# A warm start is one find over SOURCE_PATHS and the tool executables: Python
+# runs only when something is newer than CACHE_TABLE. Directories are listed
+# too, so a deleted file (which bumps its directory's mtime) also counts;
+# bytecode caches written by the run itself do not.
 cache_needs_refresh() {
-    if [[ ! -f "${CACHE_TSV}" ]] || [[ ! -f "${CACHE_JSON}" ]]; then
+    if [[ ! -f "${CACHE_TABLE}" ]] || [[ "${KEYS_REFRESH:-}" == "1" ]]; then
         return 0
     fi
-    if [[ "${KEYS_REFRESH:-}" == "1" ]]; then
-        return 0
-    fi
-    local newer_files
-    newer_files="$(find "${SOURCE_PATHS[@]}" -newer "${CACHE_TSV}" 2>/dev/null | head -1 || true)"
+    local paths=("${SOURCE_PATHS[@]}") tool newer_files
+    for tool in wezterm nvim; do
+        if command_exists "${tool}"; then
+            paths+=("$(command -v "${tool}")")
+        fi
+    done
+    newer_files="$(find -H "${paths[@]}" -name __pycache__ -prune \
+        -o -newer "${CACHE_TABLE}" -print 2>/dev/null | head -1 || true)"
     [[ -n "${newer_files}" ]]
 }
 
-regenerate_cache() {
-    info "extracting keybindings (first run takes a while)..."
+# extract_keybindings.py keeps a content-hash cache per tool and rewrites
+# CACHE_TABLE only when the extracted records differ; the touch marks the
+# table as checked against the current sources either way.
+refresh_cache() {
+    local extract_args=(--root . --format table --out "${CACHE_TABLE}")
+    if [[ "${KEYS_REFRESH:-}" == "1" ]]; then
+        extract_args+=(--no-cache)
+    fi
+    if [[ ! -f "${CACHE_TABLE}" ]]; then
+        info "extracting keybindings (first run takes a while)..."
+    fi
     mkdir -p "${CACHE_DIR}"
-    bash scripts/reference/extract.sh --out "${CACHE_JSON}"
-    python3 scripts/reference/render.py \
-        --domain keybindings \
-        --input "${CACHE_JSON}" \
-        --tsv \
-        --out "${CACHE_TSV}"
+    python3 scripts/reference/extract_keybindings.py "${extract_args[@]}"
+    touch "${CACHE_TABLE}"
 }
 
 if ! command_exists fzf; then
@@ -45,10 +56,11 @@ if ! command_exists fzf; then
 fi
 
 if cache_needs_refresh; then
-    regenerate_cache
+    refresh_cache
 fi
 
-# fzf substitutes {n} with the n-th tab-delimited field of the selected line
+# fzf substitutes {n} with the n-th tab-delimited field of the selected line;
+# table_tsv.py emits the columns of keybindings/page.py:TSV_FIELDS
 preview_script='printf "tool:        %s\nmode:        %s\nkey:         %s\naction:      %s\ndescription: %s\norigin:      %s\nchange:      %s\nsource:      %s\n" {1} {2} {3} {4} {5} {6} {7} {8}'
 
 fzf \
@@ -58,4 +70,4 @@ fzf \
     --header='keybindings (tool/mode/key/action/description)' \
     --preview="${preview_script}" \
     --preview-window=right:45% \
-    <"${CACHE_TSV}"
+    < <(python3 scripts/reference/table_tsv.py "${CACHE_TABLE}" --domain keybindings)
@@ -0,0 +1,85 @@
+"""Single-regex classifier for alias, abbr, and function lines.
+
+One alternation with named groups recognizes the same lines as
+ALIAS_LINE_PATTERN, ABBR_ADD_PATTERN, FUNCTION_NAME_PATTERN, and
+FUNCTION_KEYWORD_PATTERN, so a file is classified in one pass with one regex
+call per line instead of one pass (and strip) per parser.
+"""
+
+from __future__ import annotations
+
+import re
+
+from shortcuts.alias_parser import strip_quoted_value
+from shortcuts.function_parser import collect_preceding_comment_description
+from shortcuts.schema import Shortcut
+
+# Branches are mutually exclusive (each starts with a different keyword or an
+# identifier followed by "()"), so alternation order only matters between the
+# two function forms, which mirrors parse_function_name.
+SHORTCUT_LINE_PATTERN = re.compile(
+    r"""^[^\S\n]*(?:
+        alias(?:\s+-g)?\s+(?P<alias_name>[^\s=]+)=(?P<alias_value>.*)$
+      | abbr\b.*?\badd\s+(?P<abbr_name>[^\s=]+)=(?P<abbr_value>.+?)\s*$
+      | (?P<function_name>[a-zA-Z_][a-zA-Z0-9_-]*)\s*\(\)\s*\{
+      | function\s+(?P<keyword_name>[a-zA-Z_][a-zA-Z0-9_-]*)\s*(?:\(\))?\s*\{
+    )""",
+    re.VERBOSE,
+)
+
+
+def _shortcut_from_match(
+    match: re.Match[str], source: str, lines: list[str] | None, index: int
+) -> Shortcut:
+    # lastgroup is the branch's final group, which identifies the branch.
+    branch = match.lastgroup
+    if branch == "alias_value":
+        kind, name, value = "alias", match["alias_name"], match["alias_value"]
+    elif branch == "abbr_value":
+        kind, name, value = "abbr", match["abbr_name"], match["abbr_value"]
+    else:
+        name = match["function_name"] or match["keyword_name"]
+        description = (
+            collect_preceding_comment_description(lines, index) if lines else ""
+        )
+        return Shortcut(
+            kind="function", name=name, value="", description=description, source=source
+        )
+    return Shortcut(
+        kind=kind,
+        name=name,
+        value=strip_quoted_value(value),
+        description="",
+        source=source,
+    )
+
+
+def classify_shortcut_line(line: str, source: str = "") -> Shortcut | None:
+    """Return the alias, abbr, or function defined on ``line``, if any.
+
+    Function shortcuts have an empty description; it depends on the
+    preceding lines (see classify_shortcut_at).
+    """
+    match = SHORTCUT_LINE_PATTERN.match(line)
+    if match is None:
+        return None
+    return _shortcut_from_match(match, source, None, 0)
+
+
+def classify_shortcut_at(lines: list[str], index: int, source: str) -> Shortcut | None:
+    """Classify ``lines[index]``, giving functions their comment description."""
+    match = SHORTCUT_LINE_PATTERN.match(lines[index])
+    if match is None:
+        return None
+    return _shortcut_from_match(match, source, lines, index)
+
+
+def parse_shortcut_text(text: str, source: str) -> list[Shortcut]:
+    """Return every alias, abbr, and function in ``text`` in line order."""
+    lines = text.splitlines()
+    match_line = SHORTCUT_LINE_PATTERN.match
+    return [
+        _shortcut_from_match(match, source, lines, index)
+        for index, line in enumerate(lines)
+        if (match := match_line(line)) is not None
+    ]
@@ -6,7 +6,7 @@ import json
 from collections import Counter
 
 from common.nav import build_nav
-from common.page_config import Column, Filter, PageConfig
+from common.page_config import Column, Filter, PageConfig, SearchField
 
 PAGE_CONFIG = PageConfig(
     title="Shortcuts",
@@ -19,7 +19,12 @@ PAGE_CONFIG = PageConfig(
         Column("source", "Source", kind="wrap"),
     ),
     filters=(Filter("kind", "Kind", values=("alias", "abbr", "function")),),
-    search_fields=("name", "value", "description", "source"),
+    search_fields=(
+        SearchField("name", weight=3),
+        SearchField("value", weight=2),
+        SearchField("description", weight=2),
+        "source",
+    ),
     badge_classes={
         "alias": "badge-blue",
         "abbr": "badge-green",
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Stream a record table (common/record_table.py) as TSV for fzf.
+
+The fzf pickers' warm path: it maps the table and decodes only the requested
+columns, importing nothing beyond the table reader and the domain's page
+config (for its TSV_FIELDS), so startup stays close to the interpreter's
+own. render.py --tsv does the same with ranking and JSON inputs on top.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import sys
+from pathlib import Path
+
+from common.record_table import RecordTable
+from common.render_tsv import iter_tsv_lines
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("table", type=Path)
+    parser.add_argument("--domain", default="keybindings")
+    parser.add_argument(
+        "--fields",
+        help="comma-separated columns, in output order (default: the domain "
+        "page's TSV_FIELDS)",
+    )
+    args = parser.parse_args()
+
+    if args.fields is None:
+        fields = list(importlib.import_module(f"{args.domain}.page").TSV_FIELDS)
+    else:
+        fields = args.fields.split(",")
+
+    try:
+        with RecordTable.open(args.table) as table:
+            sys.stdout.writelines(iter_tsv_lines(table.records(), fields))
+    except BrokenPipeError:
+        # fzf exited before reading every line.
+        return 0
+    except (OSError, ValueError) as exc:
+        print(f"cannot read {args.table}: {exc}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -6,7 +6,7 @@ import json
 from collections import Counter
 
 from common.nav import build_nav
-from common.page_config import Column, Filter, PageConfig
+from common.page_config import Column, Filter, PageConfig, SearchField
 
 PAGE_CONFIG = PageConfig(
     title="mise Tasks",
@@ -19,7 +19,12 @@ PAGE_CONFIG = PageConfig(
         Column("source", "Source", kind="wrap"),
     ),
     filters=(Filter("category", "Category"),),
-    search_fields=("name", "description", "aliases", "source"),
+    search_fields=(
+        SearchField("name", weight=3),
+        SearchField("description", weight=2),
+        SearchField("aliases", weight=2),
+        "source",
+    ),
     badge_classes={},
     note="mise task catalog for this repository",
 )
@@ -0,0 +1,64 @@
+"""Tests for the shared, content-hashed site stylesheet and script."""
+
+from __future__ import annotations
+
+import unittest
+
+from common.assets import (
+    AssetBundle,
+    build_asset_bundle,
+    minify_css,
+    minify_js,
+)
+
+
+class TestMinify(unittest.TestCase):
+    def test_css_drops_comments_and_whitespace(self) -> None:
+        source = "/* nav */\n.a > b ,\n.c {\n  color : red;\n  margin: 0 4px;\n}\n"
+        self.assertEqual(minify_css(source), ".a>b,.c{color :red;margin:0 4px}")
+
+    def test_css_keeps_calc_operator_spaces(self) -> None:
+        self.assertEqual(
+            minify_css(".t { max-height: calc(100vh - 190px); }"),
+            ".t{max-height:calc(100vh - 190px)}",
+        )
+
+    def test_js_drops_comment_lines_and_indentation(self) -> None:
+        source = '// header\nfunction f() {\n  // why\n\n  return "a // b";\n}\n'
+        self.assertEqual(minify_js(source), 'function f() {\nreturn "a // b";\n}')
+
+
+class TestAssetBundle(unittest.TestCase):
+    def test_names_follow_content(self) -> None:
+        bundle = AssetBundle(css="a{}", js="f()")
+        self.assertRegex(bundle.css_name, r"^app\.[0-9a-f]{16}\.css$")
+        self.assertRegex(bundle.js_name, r"^app\.[0-9a-f]{16}\.js$")
+        self.assertEqual(bundle.css_name, AssetBundle(css="a{}", js="g()").css_name)
+        self.assertNotEqual(bundle.js_name, AssetBundle(css="a{}", js="g()").js_name)
+
+    def test_links_are_relative_to_the_page(self) -> None:
+        bundle = AssetBundle(css="a{}", js="f()")
+        links = bundle.links("../")
+        self.assertEqual(links.css, f"../assets/{bundle.css_name}")
+        self.assertEqual(links.js, f"../assets/{bundle.js_name}")
+
+    def test_site_bundle_holds_page_and_hub_styles(self) -> None:
+        bundle = build_asset_bundle()
+        for selector in (".nav-link.active,.chip.active", ".table-wrap", ".card"):
+            self.assertIn(selector, bundle.css)
+        self.assertIn("function applyFilters()", bundle.js)
+        self.assertIn("const FUZZY = ", bundle.js)
+
+    def test_files_live_under_assets(self) -> None:
+        bundle = AssetBundle(css="a{}", js="f()")
+        self.assertEqual(
+            bundle.files(),
+            {
+                f"assets/{bundle.css_name}": b"a{}",
+                f"assets/{bundle.js_name}": b"f()",
+            },
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,218 @@
+"""Tests for the content-hash extractor build cache."""
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from common.build_cache import BuildCache, code_version, expand_inputs, inputs_digest
+from common.parallel import ExtractStage, run_extract_stages
+from common.timing import StageTimer
+
+
+def _write(root: Path, rel_path: str, content: str) -> None:
+    target = root / rel_path
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(content, encoding="utf-8")
+
+
+class TestBuildCache(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name) / "repo"
+        self.cache = BuildCache(self.root, Path(tmp.name) / "cache")
+        self.calls = 0
+        _write(self.root, ".config/zsh/alias.zsh", "alias ll='ls -l'\n")
+
+    def _compute(self) -> list[dict[str, str]]:
+        self.calls += 1
+        return [{"name": f"run-{self.calls}"}]
+
+    def _records(self, salt: str = "") -> list[dict[str, str]]:
+        return self.cache.records(
+            "extract:zsh", (".config/zsh/**/*.zsh",), self._compute, salt=salt
+        )
+
+    def test_unchanged_inputs_reuse_records(self) -> None:
+        first = self._records()
+        second = self._records()
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(second, first)
+        self.assertEqual(self.cache.hits, ["extract:zsh"])
+
+    def test_edited_input_recomputes(self) -> None:
+        self._records()
+        _write(self.root, ".config/zsh/alias.zsh", "alias la='ls -a'\n")
+
+        self.assertEqual(self._records(), [{"name": "run-2"}])
+
+    def test_added_input_recomputes(self) -> None:
+        self._records()
+        _write(self.root, ".config/zsh/plugins/fzf.zsh", "")
+
+        self._records()
+
+        self.assertEqual(self.calls, 2)
+
+    def test_salt_change_recomputes(self) -> None:
+        self._records(salt="wezterm 20240203")
+        self._records(salt="wezterm 20240520")
+
+        self.assertEqual(self.calls, 2)
+
+
+class TestToolVersions(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name) / "repo"
+        self.cache = BuildCache(self.root, Path(tmp.name) / "cache")
+        self.calls = 0
+        self.versions: list[str] = []
+        self.version = "wezterm 20240203"
+        self.stamp = "/usr/bin/wezterm:1:1"
+        _write(self.root, ".wezterm.lua", "return {}\n")
+        patcher = mock.patch(
+            "common.build_cache.tool_stamp", side_effect=lambda tools: self.stamp
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _compute(self) -> list[dict[str, str]]:
+        self.calls += 1
+        return [{"name": f"run-{self.calls}"}]
+
+    def _read_version(self) -> str:
+        self.versions.append(self.version)
+        return self.version
+
+    def _records(self) -> list[dict[str, str]]:
+        return self.cache.records(
+            "extract:wezterm",
+            (".wezterm.lua",),
+            self._compute,
+            tools=("wezterm",),
+            version=self._read_version,
+        )
+
+    def test_hit_does_not_read_the_version(self) -> None:
+        self._records()
+        self._records()
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(len(self.versions), 1)
+
+    def test_touched_tool_with_same_version_keeps_records(self) -> None:
+        self._records()
+        self.stamp = "/usr/bin/wezterm:1:2"
+        self._records()
+        self._records()
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(len(self.versions), 2)
+
+    def test_upgraded_tool_recomputes(self) -> None:
+        self._records()
+        self.stamp = "/usr/bin/wezterm:2:2"
+        self.version = "wezterm 20240520"
+
+        self.assertEqual(self._records(), [{"name": "run-2"}])
+
+
+class TestPerInputRecords(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name) / "repo"
+        self.cache = BuildCache(self.root, Path(tmp.name) / "cache")
+        self.parsed: list[str] = []
+        _write(self.root, ".config/zsh/alias.zsh", "alias ll='ls -l'\n")
+        _write(self.root, ".config/zsh/func.zsh", "f() {}\n")
+
+    def _parse(self, path: Path) -> list[dict[str, str]]:
+        source = path.relative_to(self.root).as_posix()
+        self.parsed.append(source)
+        return [{"source": source, "text": path.read_text(encoding="utf-8")}]
+
+    def _records(self) -> list[dict[str, str]]:
+        return self.cache.records_per_input(
+            "extract:zsh",
+            (".config/zsh/**/*.zsh",),
+            self._parse,
+            lambda by_file: [r for records in by_file.values() for r in records],
+        )
+
+    def test_unchanged_inputs_parse_nothing(self) -> None:
+        first = self._records()
+        self.parsed.clear()
+
+        self.assertEqual(self._records(), first)
+        self.assertEqual(self.parsed, [])
+        self.assertEqual(self.cache.hits, ["extract:zsh"])
+
+    def test_edit_reparses_only_that_file(self) -> None:
+        self._records()
+        self.parsed.clear()
+        _write(self.root, ".config/zsh/func.zsh", "g() {}\n")
+
+        records = self._records()
+
+        self.assertEqual(self.parsed, [".config/zsh/func.zsh"])
+        self.assertEqual(
+            [r["text"] for r in records], ["alias ll='ls -l'\n", "g() {}\n"]
+        )
+
+    def test_removed_file_drops_out(self) -> None:
+        self._records()
+        (self.root / ".config/zsh/func.zsh").unlink()
+
+        records = self._records()
+
+        self.assertEqual([r["source"] for r in records], [".config/zsh/alias.zsh"])
+
+
+class TestDigests(unittest.TestCase):
+    def test_rename_changes_digest(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _write(root, "a.zsh", "same")
+            before = inputs_digest(root, expand_inputs(root, ("*.zsh",)))
+            (root / "a.zsh").rename(root / "b.zsh")
+            after = inputs_digest(root, expand_inputs(root, ("*.zsh",)))
+
+        self.assertNotEqual(before, after)
+
+    def test_code_version_ignores_tests(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            reference = Path(tmp)
+            _write(reference, "keybindings/parser.py", "x = 1\n")
+            before = code_version(reference)
+            _write(reference, "tests/test_parser.py", "y = 2\n")
+            self.assertEqual(code_version(reference), before)
+            _write(reference, "keybindings/parser.py", "x = 2\n")
+            self.assertNotEqual(code_version(reference), before)
+
+
+class TestCachedStages(unittest.TestCase):
+    def test_stage_without_inputs_always_runs(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = BuildCache(Path(tmp), Path(tmp) / "cache")
+            calls: list[str] = []
+
+            def run() -> list[dict[str, str]]:
+                calls.append("tasks")
+                return []
+
+            stages = [ExtractStage("extract:tasks", run)]
+            run_extract_stages(stages, StageTimer(), jobs=1, cache=cache)
+            run_extract_stages(stages, StageTimer(), jobs=1, cache=cache)
+
+        self.assertEqual(calls, ["tasks", "tasks"])
+
+
+if __name__ == "__main__":
+    unittest.main()
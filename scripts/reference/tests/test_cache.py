@@ -0,0 +1,43 @@
+"""Tests for the keyed JSON build caches."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from common.cache import cache_dir, read_keyed_json, write_keyed_json
+
+
+class TestKeyedJsonCache(unittest.TestCase):
+    def test_round_trip_with_matching_key(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "nested" / "cache.json"
+            write_keyed_json(path, "v1", [{"key": "a"}])
+
+            self.assertEqual(read_keyed_json(path, "v1"), [{"key": "a"}])
+
+    def test_key_mismatch_is_a_miss(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "cache.json"
+            write_keyed_json(path, "v1", [1, 2])
+
+            self.assertIsNone(read_keyed_json(path, "v2"))
+
+    def test_missing_or_corrupt_file_is_a_miss(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "cache.json"
+            self.assertIsNone(read_keyed_json(path, "v1"))
+
+            path.write_text("{not json", encoding="utf-8")
+            self.assertIsNone(read_keyed_json(path, "v1"))
+
+    def test_cache_dir_honours_xdg_cache_home(self) -> None:
+        with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": "/tmp/xdg"}):
+            self.assertEqual(cache_dir(), Path("/tmp/xdg/dotfiles"))
+
+
+if __name__ == "__main__":
+    unittest.main()
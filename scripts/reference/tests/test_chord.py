@@ -0,0 +1,108 @@
+"""Tests for the shared chord notation and each tool's chord parser."""
+
+from __future__ import annotations
+
+import unittest
+
+from keybindings.chord import (
+    canonical_modifiers,
+    control_stroke,
+    spell_modifiers,
+    split_stroke,
+    stroke,
+    stroke_parts,
+)
+from keybindings.nvim_diff import nvim_chord, parse_mapleader
+from keybindings.skhd_config import normalize_skhd_mods, skhd_chord
+from keybindings.wezterm_lua import normalize_mods, parse_leader, wezterm_chord
+from keybindings.zsh_bindkey import zsh_chord
+
+
+class TestStroke(unittest.TestCase):
+    def test_modifiers_are_canonical_and_ordered(self) -> None:
+        self.assertEqual(canonical_modifiers(["SHIFT", "CTRL"]), ["ctrl", "shift"])
+        self.assertEqual(canonical_modifiers(["NONE"]), [])
+        self.assertEqual(
+            canonical_modifiers(["hyper"]), ["ctrl", "alt", "shift", "cmd"]
+        )
+
+    def test_uppercase_letter_implies_shift(self) -> None:
+        self.assertEqual(stroke(["CTRL"], "K"), "ctrl+shift+k")
+        self.assertEqual(stroke(["CTRL", "SHIFT"], "k"), "ctrl+shift+k")
+
+    def test_shift_on_a_symbol_is_dropped(self) -> None:
+        self.assertEqual(stroke(["SHIFT"], "&"), "&")
+
+    def test_key_names_are_aliased(self) -> None:
+        self.assertEqual(stroke([], "Escape"), stroke([], "Esc"))
+        self.assertEqual(stroke([], "UpArrow"), "up")
+        self.assertEqual(stroke([], " "), "space")
+
+    def test_shared_notation_helpers(self) -> None:
+        self.assertEqual(split_stroke("SHIFT|CTRL", "|", "w"), "ctrl+shift+w")
+        self.assertEqual(control_stroke((), "N"), "ctrl+n")
+        self.assertEqual(control_stroke(["S"], "Tab"), "ctrl+shift+tab")
+        self.assertEqual(spell_modifiers(["cmd", "c"], {"ctrl": "C"}), ["C", "cmd"])
+        self.assertEqual(stroke_parts("ctrl+shift+w"), (["ctrl", "shift"], "w"))
+        self.assertEqual(stroke_parts("ctrl++"), (["ctrl"], "+"))
+
+
+class TestToolChords(unittest.TestCase):
+    def test_same_press_is_equal_across_tools(self) -> None:
+        self.assertEqual(
+            wezterm_chord("CTRL|SHIFT", "W"), skhd_chord("shift+ctrl", "w")
+        )
+        self.assertEqual(wezterm_chord("CTRL", "j"), nvim_chord("<C-J>"))
+        self.assertEqual(zsh_chord("Ctrl+N"), nvim_chord("<C-n>"))
+        self.assertEqual(zsh_chord("Up"), wezterm_chord("NONE", "UpArrow"))
+
+    def test_displayed_mods_are_the_chord_modifiers(self) -> None:
+        skhd_mods = normalize_skhd_mods("shift + lctrl")
+        self.assertEqual(skhd_mods, "ctrl+shift")
+        self.assertEqual(skhd_chord(skhd_mods, "w"), (f"{skhd_mods}+w",))
+        wezterm_mods = normalize_mods("SHIFT|CTRL")
+        self.assertEqual(wezterm_chord(wezterm_mods, "w"), skhd_chord(skhd_mods, "w"))
+
+    def test_multi_stroke_chords(self) -> None:
+        self.assertEqual(zsh_chord("Ctrl+X s"), ("ctrl+x", "s"))
+        self.assertEqual(zsh_chord("^X^E"), ("ctrl+x", "ctrl+e"))
+        self.assertEqual(nvim_chord("<leader>fg", ("space",)), ("space", "f", "g"))
+        self.assertEqual(nvim_chord("<C-R><C-G>"), ("ctrl+r", "ctrl+g"))
+        self.assertEqual(nvim_chord("gT"), ("g", "shift+t"))
+
+    def test_wezterm_leader_and_physical_keys(self) -> None:
+        leader = parse_leader(
+            'leader = { key = "a", mods = "CTRL", timeout_milliseconds = 2000 },\n'
+        )
+        self.assertEqual(leader, ("ctrl+a",))
+        self.assertEqual(wezterm_chord("LEADER", "h", leader), ("ctrl+a", "h"))
+        self.assertEqual(wezterm_chord("LEADER", "h"), ())
+        self.assertEqual(wezterm_chord("NONE", "phys:Space"), ("space",))
+
+    def test_wezterm_leader_is_read_from_the_config(self) -> None:
+        self.assertEqual(parse_leader("-- leader = { key = 'b' }\n"), ())
+        self.assertEqual(
+            parse_leader("  leader = {\n    mods = 'SUPER', key = 'b',\n  },\n"),
+            ("cmd+b",),
+        )
+
+    def test_nvim_leader_comes_from_mapleader(self) -> None:
+        self.assertEqual(parse_mapleader('vim.g.mapleader = " "\n'), " ")
+        self.assertEqual(parse_mapleader("vim.g.mapleader = '\\\\'\n"), "\\")
+        self.assertIsNone(parse_mapleader('-- vim.g.mapleader = ","\n'))
+        self.assertEqual(nvim_chord("<leader>w", (",",)), (",", "w"))
+        self.assertEqual(nvim_chord("<leader>w"), ("\\", "w"))
+
+    def test_unreadable_zsh_sequence_has_no_chord(self) -> None:
+        self.assertEqual(zsh_chord(r"\e[1;5C"), ())
+        self.assertEqual(zsh_chord("Ctrl+\\"), ("ctrl+\\",))
+
+    def test_nvim_special_keys(self) -> None:
+        self.assertEqual(nvim_chord("<C-Bslash>"), ("ctrl+\\",))
+        self.assertEqual(nvim_chord("<C-->"), ("ctrl+-",))
+        self.assertEqual(nvim_chord("<CR>"), ("enter",))
+        self.assertEqual(nvim_chord("a<b"), ("a", "<", "b"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import shutil
+import tempfile
 import unittest
 from pathlib import Path
 
-from claude.extract import collect_from_claude_dir
+from claude.extract import (
+    claude_file_records,
+    collect_claude_assets,
+    collect_from_claude_dir,
+    merge_claude_records,
+)
 
 FIXTURES = Path(__file__).parent / "fixtures"
 CLAUDE_DIR = FIXTURES / "claude"
@@ -43,5 +50,23 @@ class TestClaudeExtract(unittest.TestCase):
         self.assertEqual(command["description"], "Plain Command")
 
 
+class TestPerFileRecords(unittest.TestCase):
+    def test_merged_file_records_match_tree_collection(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            shutil.copytree(CLAUDE_DIR, root / ".claude")
+            shutil.copytree(FIXTURES / ".apm", root / ".apm")
+            files = sorted(path for path in root.rglob("*.md") if path.is_file())
+
+            merged = merge_claude_records(
+                {path: claude_file_records(root, path) for path in files}
+            )
+
+            self.assertEqual(merged, collect_claude_assets(root))
+            self.assertEqual(
+                {record["type"] for record in merged}, {"agent", "command", "rule"}
+            )
+
+
 if __name__ == "__main__":
     unittest.main()
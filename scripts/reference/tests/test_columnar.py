@@ -0,0 +1,42 @@
+"""Tests for the columnar, dictionary-encoded page payload."""
+
+from __future__ import annotations
+
+import unittest
+
+from common.columnar import decode_columnar, encode_columnar
+
+RECORDS = [
+    {"tool": "zsh", "key": "^R", "origin": "custom"},
+    {"tool": "zsh", "key": "^A", "origin": "default"},
+    {"tool": "skhd", "key": "alt - h", "origin": "custom"},
+    {"tool": "zsh", "key": "^E", "origin": "custom"},
+]
+
+
+class TestColumnar(unittest.TestCase):
+    def test_round_trip(self) -> None:
+        self.assertEqual(decode_columnar(encode_columnar(RECORDS)), RECORDS)
+
+    def test_repeated_values_become_dictionary_codes(self) -> None:
+        columns = encode_columnar(RECORDS)["columns"]
+        assert isinstance(columns, dict)
+        self.assertEqual(
+            columns["tool"], {"dict": ["zsh", "skhd"], "codes": [0, 0, 1, 0]}
+        )
+        self.assertEqual(columns["key"], {"values": ["^R", "^A", "alt - h", "^E"]})
+
+    def test_missing_fields_decode_as_empty(self) -> None:
+        payload = encode_columnar([{"tool": "zsh"}, {"key": "^R"}])
+        self.assertEqual(
+            decode_columnar(payload),
+            [{"tool": "zsh", "key": ""}, {"tool": "", "key": "^R"}],
+        )
+
+    def test_empty(self) -> None:
+        self.assertEqual(encode_columnar([]), {"length": 0, "columns": {}})
+        self.assertEqual(decode_columnar({"length": 0, "columns": {}}), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
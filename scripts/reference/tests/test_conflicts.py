@@ -0,0 +1,92 @@
+"""Tests for cross-tool shadowing detection."""
+
+from __future__ import annotations
+
+import unittest
+
+from keybindings.conflicts import annotate_conflicts, build_chord_index
+from validate import shadowing_report
+
+
+def _binding(tool: str, context: str, mode: str, key: str) -> dict[str, str]:
+    return {
+        "tool": tool,
+        "context": context,
+        "mode": mode,
+        "key": key,
+        "action": "act",
+        "description": "",
+        "source": "src",
+        "origin": "custom",
+        "change": "added",
+    }
+
+
+SKHD_CTRL_J = _binding("skhd", "focus", "ctrl", "j")
+WEZTERM_CTRL_J = _binding("wezterm", "keys", "CTRL", "j")
+WEZTERM_COPY_ALT_F = _binding("wezterm", "copy_mode", "ALT", "f")
+ZSH_CTRL_N = _binding("zsh", "zle", "viins", "Ctrl+N")
+NVIM_CTRL_J = _binding("nvim", "global", "n", "<C-J>")
+NVIM_CTRL_N = _binding("nvim", "global", "i", "<C-N>")
+NVIM_ALT_F = _binding("nvim", "global", "n", "<M-f>")
+
+
+class TestShadowing(unittest.TestCase):
+    def test_outermost_layer_shadows(self) -> None:
+        records = [NVIM_CTRL_J, WEZTERM_CTRL_J, SKHD_CTRL_J]
+        found = build_chord_index(records).shadowing()
+
+        self.assertEqual(
+            [(s.stroke, s.shadowed, s.by) for s in found],
+            [("ctrl+j", 0, 2), ("ctrl+j", 1, 2)],
+        )
+
+    def test_wezterm_leader_shadows_its_chord(self) -> None:
+        leader = _binding("wezterm", "keys", "LEADER", "c")
+        zsh_ctrl_a = _binding("zsh", "zle", "viins", "^A")
+        nvim_ctrl_a = _binding("nvim", "global", "n", "<C-a>")
+        records = [leader, zsh_ctrl_a, nvim_ctrl_a]
+
+        found = build_chord_index(records, {"wezterm": ("ctrl+a",)}).shadowing()
+
+        self.assertEqual(
+            [(s.stroke, s.shadowed, s.by) for s in found],
+            [("ctrl+a", 1, 0), ("ctrl+a", 2, 0)],
+        )
+        self.assertEqual(build_chord_index(records).shadowing(), [])
+
+    def test_nvim_leader_follows_mapleader(self) -> None:
+        nvim_leader_w = _binding("nvim", "global", "n", "<leader>w")
+        skhd_comma = _binding("skhd", "focus", "", ",")
+        index = build_chord_index([nvim_leader_w, skhd_comma], {"nvim": (",",)})
+
+        self.assertEqual(len(index.shadowing()), 1)
+
+    def test_zsh_does_not_shadow_nvim(self) -> None:
+        self.assertEqual(build_chord_index([ZSH_CTRL_N, NVIM_CTRL_N]).shadowing(), [])
+
+    def test_wezterm_key_tables_only_shadow_inside_their_mode(self) -> None:
+        index = build_chord_index([WEZTERM_COPY_ALT_F, NVIM_ALT_F])
+        self.assertEqual(index.shadowing(), [])
+
+    def test_annotate_marks_both_sides(self) -> None:
+        records = [NVIM_CTRL_J, WEZTERM_CTRL_J, ZSH_CTRL_N]
+        annotated = annotate_conflicts(records)
+
+        self.assertEqual(
+            [record["conflict"] for record in annotated], ["shadowed", "shadows", ""]
+        )
+        self.assertNotIn("conflict", records[0])
+
+    def test_shadowing_report_names_both_bindings(self) -> None:
+        report = shadowing_report(build_chord_index([SKHD_CTRL_J, NVIM_CTRL_J]))
+
+        self.assertEqual(len(report), 1)
+        self.assertEqual(
+            report[0],
+            "shadowed: nvim 'global' 'n' '<C-J>' by skhd 'focus' 'ctrl' 'j' on ctrl+j",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""Tests for the Neovim extractor's launch and baseline caching."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import extract_nvim
+
+FIXTURES = Path(__file__).parent / "fixtures"
+CONFIG_TEXT = (FIXTURES / "nvim-config.json").read_text(encoding="utf-8")
+CLEAN_TEXT = (FIXTURES / "nvim-clean.json").read_text(encoding="utf-8")
+
+
+class TestCollectNvimBindings(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        env = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": tmp.name})
+        env.start()
+        self.addCleanup(env.stop)
+        self.launches: list[bool] = []
+
+    def _fake_read(self, *, clean: bool) -> str:
+        self.launches.append(clean)
+        return CLEAN_TEXT if clean else CONFIG_TEXT
+
+    def _collect(self, version: str) -> list[dict[str, str]]:
+        with (
+            mock.patch.object(extract_nvim, "read_keymaps_from_nvim", self._fake_read),
+            mock.patch.object(extract_nvim, "read_nvim_version", return_value=version),
+        ):
+            return extract_nvim.collect_nvim_bindings()
+
+    def test_clean_dump_cached_per_version(self) -> None:
+        cold = self._collect("NVIM v0.10.0")
+        self.assertEqual(sorted(self.launches), [False, True])
+
+        self.launches.clear()
+        warm = self._collect("NVIM v0.10.0")
+        self.assertEqual(self.launches, [False])
+        self.assertEqual(warm, cold)
+
+        self.launches.clear()
+        self._collect("NVIM v0.11.0")
+        self.assertEqual(sorted(self.launches), [False, True])
+
+    def test_session_baseline_uses_one_launch(self) -> None:
+        with (
+            mock.patch.object(
+                extract_nvim,
+                "read_config_and_builtin_keymaps",
+                return_value=(CONFIG_TEXT, CLEAN_TEXT),
+            ) as session,
+            mock.patch.object(extract_nvim, "read_keymaps_from_nvim") as separate,
+        ):
+            records = extract_nvim.collect_nvim_bindings(baseline="session")
+
+        session.assert_called_once()
+        separate.assert_not_called()
+        self.assertEqual(records, self._collect("NVIM v0.10.0"))
+
+    def test_json_files_skip_launch(self) -> None:
+        with mock.patch.object(extract_nvim, "read_keymaps_from_nvim") as launch:
+            records = extract_nvim.collect_nvim_bindings(
+                config_json=FIXTURES / "nvim-config.json",
+                clean_json=FIXTURES / "nvim-clean.json",
+            )
+
+        launch.assert_not_called()
+        self.assertGreater(len(records), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
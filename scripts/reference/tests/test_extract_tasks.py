@@ -0,0 +1,53 @@
+"""Tests for the mise tasks extractor's cache key."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import extract_tasks
+from claude.extract import claude_dir_state
+
+
+class TestMiseConfigState(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.config = Path(tmp.name) / "mise" / "config.toml"
+        env = mock.patch.dict(os.environ, {"XDG_CONFIG_HOME": tmp.name})
+        env.start()
+        self.addCleanup(env.stop)
+        for name in ("MISE_GLOBAL_CONFIG_FILE", "MISE_CONFIG_DIR"):
+            os.environ.pop(name, None)
+
+    def test_global_config_follows_the_environment(self) -> None:
+        self.assertEqual(extract_tasks.mise_global_config(), self.config)
+        with mock.patch.dict(os.environ, {"MISE_GLOBAL_CONFIG_FILE": "/x/mise.toml"}):
+            self.assertEqual(extract_tasks.mise_global_config(), Path("/x/mise.toml"))
+
+    def test_global_config_content_changes_the_state(self) -> None:
+        absent = extract_tasks.mise_config_state()
+        self.config.parent.mkdir(parents=True)
+        self.config.write_text("[tasks.a]\nrun = 'true'\n", encoding="utf-8")
+        present = extract_tasks.mise_config_state()
+        self.config.write_text("[tasks.b]\nrun = 'true'\n", encoding="utf-8")
+
+        self.assertNotEqual(absent, present)
+        self.assertNotEqual(present, extract_tasks.mise_config_state())
+        self.assertTrue(present.startswith(f"{self.config}:"))
+
+
+class TestClaudeDirState(unittest.TestCase):
+    def test_presence_of_claude_dir(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            self.assertEqual(claude_dir_state(root), "absent")
+            (root / ".claude").mkdir()
+            self.assertEqual(claude_dir_state(root), "present")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+"""Tests for the WezTerm extractor's show-keys invocation."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import extract_wezterm
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+class TestCollectWeztermBindings(unittest.TestCase):
+    def test_effective_and_default_dumps_run_concurrently(self) -> None:
+        # Each fake launch waits for the other, so this only completes when
+        # both wezterm processes are in flight at the same time
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_launch(*, use_default_config: bool, config_file: str | None) -> str:
+            barrier.wait()
+            name = (
+                "wezterm-default.lua" if use_default_config else "wezterm-effective.lua"
+            )
+            return (FIXTURES / name).read_text(encoding="utf-8")
+
+        with mock.patch.object(
+            extract_wezterm, "read_lua_from_wezterm", side_effect=fake_launch
+        ) as launch:
+            records = extract_wezterm.collect_wezterm_bindings(
+                config_file=".wezterm.lua", use_cache=False
+            )
+
+        self.assertEqual(launch.call_count, 2)
+        self.assertTrue(any(record["origin"] == "custom" for record in records))
+
+    def test_files_skip_launch(self) -> None:
+        with mock.patch.object(extract_wezterm, "read_lua_from_wezterm") as launch:
+            records = extract_wezterm.collect_wezterm_bindings(
+                config_file=None,
+                effective_file=FIXTURES / "wezterm-effective.lua",
+                default_file=FIXTURES / "wezterm-default.lua",
+            )
+
+        launch.assert_not_called()
+        self.assertGreater(len(records), 0)
+
+
+def _fake_launch(*, use_default_config: bool, config_file: str | None) -> str:
+    name = "wezterm-default.lua" if use_default_config else "wezterm-effective.lua"
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+class TestDefaultKeysCache(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        env = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": tmp.name})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def _collect(self, version: str) -> tuple[list[dict[str, str]], list[bool]]:
+        launches: list[bool] = []
+
+        def launch(*, use_default_config: bool, config_file: str | None) -> str:
+            launches.append(use_default_config)
+            return _fake_launch(
+                use_default_config=use_default_config, config_file=config_file
+            )
+
+        with (
+            mock.patch.object(extract_wezterm, "read_lua_from_wezterm", launch),
+            mock.patch.object(
+                extract_wezterm, "read_wezterm_version", return_value=version
+            ),
+        ):
+            records = extract_wezterm.collect_wezterm_bindings(config_file=None)
+        return records, launches
+
+    def test_cache_hit_skips_default_launch(self) -> None:
+        cold_records, cold_launches = self._collect("wezterm 20240203")
+        warm_records, warm_launches = self._collect("wezterm 20240203")
+
+        self.assertEqual(sorted(cold_launches), [False, True])
+        self.assertEqual(warm_launches, [False])
+        self.assertEqual(warm_records, cold_records)
+
+    def test_version_change_relaunches_default(self) -> None:
+        self._collect("wezterm 20240203")
+        _, launches = self._collect("wezterm 20240520")
+
+        self.assertEqual(sorted(launches), [False, True])
+
+
+if __name__ == "__main__":
+    unittest.main()
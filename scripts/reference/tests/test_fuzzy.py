@@ -0,0 +1,78 @@
+"""Tests for the fuzzy ranked matcher shared by TSV output and the page."""
+
+from __future__ import annotations
+
+import unittest
+
+from common.fuzzy import FuzzyIndex, char_mask, fuzzy_score, rank_records
+from common.page_config import SearchField, search_field_specs
+
+FIELDS = (SearchField("key", weight=3), SearchField("source"))
+RECORDS = [
+    {"key": "gd", "source": "lsp/goto.lua"},
+    {"key": "<leader>gs", "source": "git/diff.lua"},
+    {"key": "q", "source": "gd.lua"},
+    {"key": "ctrl-d", "source": "scroll.lua"},
+]
+
+
+class TestFuzzyScore(unittest.TestCase):
+    def test_subsequence_required(self) -> None:
+        self.assertIsNotNone(fuzzy_score("gtd", "goto definition"))
+        self.assertIsNone(fuzzy_score("dg", "goto"))
+        self.assertIsNone(fuzzy_score("x", ""))
+
+    def test_contiguous_beats_gapped(self) -> None:
+        contiguous = fuzzy_score("split", "split pane")
+        gapped = fuzzy_score("split", "s-p-l-i-t")
+        assert contiguous is not None and gapped is not None
+        self.assertGreater(contiguous, gapped)
+
+    def test_word_boundary_beats_mid_word(self) -> None:
+        boundary = fuzzy_score("pane", "split pane")
+        mid_word = fuzzy_score("pane", "splitpane")
+        assert boundary is not None and mid_word is not None
+        self.assertGreater(boundary, mid_word)
+
+    def test_shortest_window_is_scored(self) -> None:
+        # The leading "a" far from "b" must not add a long gap.
+        self.assertEqual(fuzzy_score("ab", "a------ab"), fuzzy_score("ab", "ab"))
+
+    def test_long_gaps_still_score_positive(self) -> None:
+        self.assertEqual(fuzzy_score("ab", "a" + "-" * 200 + "b"), 1)
+
+    def test_char_mask_is_a_necessary_condition(self) -> None:
+        self.assertEqual(char_mask("ab") & ~char_mask("cab"), 0)
+        self.assertNotEqual(char_mask("az") & ~char_mask("abc"), 0)
+
+
+class TestFuzzyIndex(unittest.TestCase):
+    def test_weighted_field_ranks_first(self) -> None:
+        index = FuzzyIndex(RECORDS, FIELDS)
+        # "gd" is the key of record 0 and the source of record 2.
+        self.assertEqual(index.search("gd"), [0, 2, 1])
+
+    def test_every_term_must_match(self) -> None:
+        index = FuzzyIndex(RECORDS, FIELDS)
+        self.assertEqual(index.search("gd goto"), [0])
+        self.assertEqual(index.search("gd zzz"), [])
+
+    def test_ties_keep_data_order(self) -> None:
+        records = [{"key": "x", "source": "a.lua"} for _ in range(3)]
+        self.assertEqual(FuzzyIndex(records, FIELDS).search("lua"), [0, 1, 2])
+
+    def test_candidates_restrict_the_search(self) -> None:
+        index = FuzzyIndex(RECORDS, FIELDS)
+        self.assertEqual(index.search("gd", candidates=[2, 1]), [2, 1])
+
+    def test_empty_query_returns_everything_in_order(self) -> None:
+        self.assertEqual(FuzzyIndex(RECORDS, FIELDS).search("  "), [0, 1, 2, 3])
+
+    def test_rank_records(self) -> None:
+        fields = search_field_specs(("key", SearchField("source", weight=2)))
+        ranked = rank_records(RECORDS, "CTRL", fields)
+        self.assertEqual(ranked, [RECORDS[3]])
+
+
+if __name__ == "__main__":
+    unittest.main()
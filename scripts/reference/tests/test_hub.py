@@ -6,6 +6,7 @@ import unittest
 
 from common.hub_html import render_hub
 from common.nav import build_nav
+from common.page_config import AssetLinks
 
 
 class TestNav(unittest.TestCase):
@@ -55,6 +56,13 @@ class TestRenderHub(unittest.TestCase):
         self.assertNotIn("<b>x", output)
         self.assertIn("&lt;b&gt;x", output)
 
+    def test_assets_link_the_shared_stylesheet(self) -> None:
+        meta = {"generated_at": "", "commit": ""}
+        assets = AssetLinks(css="./assets/app.1.css", js="./assets/app.2.js")
+        output = render_hub(self._cards(), meta, assets=assets)
+        self.assertIn('<link rel="stylesheet" href="./assets/app.1.css">', output)
+        self.assertNotIn("<style>", output)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,37 @@
+"""Tests for reading the configured wezterm and nvim leaders."""
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from keybindings.leaders import keybinding_leaders
+
+
+class TestKeybindingLeaders(unittest.TestCase):
+    def test_leaders_come_from_the_configs(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / ".wezterm.lua").write_text(
+                'leader = { key = "a", mods = "CTRL" },\n', encoding="utf-8"
+            )
+            lua_dir = root / ".config" / "nvim" / "lua"
+            lua_dir.mkdir(parents=True)
+            (lua_dir / "options.lua").write_text(
+                'vim.g.mapleader = " "\n', encoding="utf-8"
+            )
+
+            leaders = keybinding_leaders(root)
+
+        self.assertEqual(leaders, {"wezterm": ("ctrl+a",), "nvim": ("space",)})
+
+    def test_missing_configs_fall_back_to_defaults(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            leaders = keybinding_leaders(Path(tmp))
+
+        self.assertEqual(leaders, {"wezterm": (), "nvim": ("\\",)})
+
+
+if __name__ == "__main__":
+    unittest.main()
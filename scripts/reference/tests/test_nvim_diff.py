@@ -29,7 +29,11 @@ class TestNvimDiff(unittest.TestCase):
         self.assertEqual(len(parsed), 111)
 
     def test_normalize_lhs_maps_leader_space(self) -> None:
-        self.assertEqual(normalize_lhs(" fmt"), "<leader>fmt")
+        self.assertEqual(normalize_lhs(" fmt", " "), "<leader>fmt")
+        self.assertEqual(normalize_lhs("\\w"), "<leader>w")
+        self.assertEqual(normalize_lhs(",w", ","), "<leader>w")
+        self.assertEqual(normalize_lhs("<Space>w", " "), "<leader>w")
+        self.assertEqual(normalize_lhs(" w", ","), " w")
 
     def test_exclude_builtin_emits_added_and_overridden(self) -> None:
         config_maps = parse_keymap_json(self.config_text)
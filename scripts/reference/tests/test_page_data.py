@@ -0,0 +1,67 @@
+"""Tests for split-out, content-hashed page data files."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from common.page_data import data_file_name, encode_page_data, write_page_data
+
+RECORDS = [
+    {"tool": "zsh", "key": "^R", "description": "履歴検索"},
+    {"tool": "skhd", "key": "alt - h", "description": "focus west"},
+]
+
+
+class TestPageData(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.out = Path(tmp.name) / "keybindings"
+        # Keep the tests independent of whether brotli is installed.
+        patcher = mock.patch("common.precompress.shutil.which", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_name_follows_content(self) -> None:
+        name = data_file_name(encode_page_data(RECORDS))
+        self.assertRegex(name, r"^data\.[0-9a-f]{16}\.json$")
+        self.assertEqual(name, data_file_name(encode_page_data(list(RECORDS))))
+        self.assertNotEqual(name, data_file_name(encode_page_data(RECORDS[:1])))
+
+    def test_writes_json_and_gzip_sibling(self) -> None:
+        name = write_page_data(RECORDS, self.out)
+        payload = (self.out / name).read_bytes()
+        self.assertEqual(json.loads(payload), RECORDS)
+        self.assertEqual(
+            gzip.decompress((self.out / f"{name}.gz").read_bytes()), payload
+        )
+
+    def test_gzip_output_is_reproducible(self) -> None:
+        name = write_page_data(RECORDS, self.out)
+        first = (self.out / f"{name}.gz").read_bytes()
+        (self.out / name).unlink()
+        write_page_data(RECORDS, self.out)
+        self.assertEqual((self.out / f"{name}.gz").read_bytes(), first)
+
+    def test_unchanged_data_is_not_rewritten(self) -> None:
+        name = write_page_data(RECORDS, self.out)
+        before = (self.out / name).stat().st_mtime_ns
+        self.assertEqual(write_page_data(RECORDS, self.out), name)
+        self.assertEqual((self.out / name).stat().st_mtime_ns, before)
+
+    def test_stale_data_files_are_removed(self) -> None:
+        old = write_page_data(RECORDS, self.out)
+        new = write_page_data(RECORDS[:1], self.out)
+        self.assertNotEqual(old, new)
+        self.assertEqual(
+            sorted(path.name for path in self.out.iterdir()), [new, f"{new}.gz"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""Tests for concurrent extraction stages."""
+
+from __future__ import annotations
+
+import threading
+import unittest
+
+from common.parallel import ExtractStage, run_extract_stages
+from common.timing import StageTimer
+
+
+def _records(name: str) -> list[dict[str, str]]:
+    return [{"name": name}]
+
+
+class TestRunExtractStages(unittest.TestCase):
+    def test_results_keyed_and_ordered_by_stage(self) -> None:
+        stages = [
+            ExtractStage("b", lambda: _records("b"), spawns_process=True),
+            ExtractStage("a", lambda: _records("a")),
+        ]
+
+        results = run_extract_stages(stages, StageTimer(), jobs=4)
+
+        self.assertEqual(list(results), ["b", "a"])
+        self.assertEqual(results["a"], [{"name": "a"}])
+
+    def test_process_stages_overlap(self) -> None:
+        # Both stages block on the barrier, so it only trips if they run at once
+        barrier = threading.Barrier(2, timeout=5)
+
+        def wait_then(name: str) -> list[dict[str, str]]:
+            barrier.wait()
+            return _records(name)
+
+        stages = [
+            ExtractStage("wezterm", lambda: wait_then("wezterm"), spawns_process=True),
+            ExtractStage("nvim", lambda: wait_then("nvim"), spawns_process=True),
+        ]
+
+        results = run_extract_stages(stages, StageTimer(), jobs=2)
+
+        self.assertEqual(results["nvim"], [{"name": "nvim"}])
+
+    def test_single_job_runs_serially_in_order(self) -> None:
+        order: list[str] = []
+
+        def record(name: str) -> list[dict[str, str]]:
+            order.append(name)
+            return []
+
+        stages = [
+            ExtractStage("x", lambda: record("x"), spawns_process=True),
+            ExtractStage("y", lambda: record("y")),
+            ExtractStage("z", lambda: record("z"), spawns_process=True),
+        ]
+        timer = StageTimer()
+
+        run_extract_stages(stages, timer, jobs=1)
+
+        self.assertEqual(order, ["x", "y", "z"])
+        self.assertEqual([name for name, _ in timer.timings], ["x", "y", "z"])
+
+    def test_worker_exception_propagates(self) -> None:
+        def fail() -> list[dict[str, str]]:
+            raise ValueError("wezterm exited 1")
+
+        stages = [ExtractStage("wezterm", fail, spawns_process=True)]
+
+        with self.assertRaises(ValueError):
+            run_extract_stages(stages, StageTimer(), jobs=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
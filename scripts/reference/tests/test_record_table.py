@@ -0,0 +1,71 @@
+"""Tests for the memory-mappable columnar record table."""
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from common.record_table import (
+    RecordTable,
+    encode_record_table,
+    is_record_table,
+    write_record_table,
+)
+
+RECORDS = [
+    {"tool": "zsh", "key": "Ctrl-R", "action": "history-search", "origin": "custom"},
+    {"tool": "skhd", "key": "Alt-H", "action": "focus west", "origin": "custom"},
+    {"tool": "zsh", "key": "Ctrl-A", "action": "beginning-of-line", "origin": ""},
+]
+
+
+class TestRecordTable(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "records.rtb"
+
+    def test_round_trip_through_mmap(self) -> None:
+        write_record_table(self.path, RECORDS)
+
+        with RecordTable.open(self.path) as table:
+            self.assertEqual(len(table), 3)
+            self.assertEqual(table.fields, ("tool", "key", "action", "origin"))
+            self.assertEqual(list(table.records()), RECORDS)
+
+    def test_strings_are_interned(self) -> None:
+        repeated = [dict(RECORDS[0]) for _ in range(100)]
+
+        # Each extra row only adds four 2-byte indices; no string is repeated.
+        single = len(encode_record_table(RECORDS[:1]))
+        self.assertEqual(len(encode_record_table(repeated)), single + 99 * 4 * 2)
+
+    def test_where_filters_by_exact_field_values(self) -> None:
+        table = RecordTable(encode_record_table(RECORDS))
+
+        zsh = list(table.records({"tool": "zsh", "origin": "custom"}))
+        self.assertEqual(zsh, RECORDS[:1])
+        self.assertEqual(list(table.records({"tool": "nvim"})), [])
+        self.assertEqual(list(table.records({"missing": "zsh"})), [])
+
+    def test_explicit_fields_fill_missing_values(self) -> None:
+        table = RecordTable(encode_record_table(RECORDS[:1], ("tool", "mode")))
+
+        self.assertEqual(table.row(0), {"tool": "zsh", "mode": ""})
+
+    def test_unchanged_table_is_not_rewritten(self) -> None:
+        self.assertTrue(write_record_table(self.path, RECORDS))
+        self.assertFalse(write_record_table(self.path, RECORDS))
+        self.assertTrue(write_record_table(self.path, RECORDS[:1]))
+
+    def test_detects_tables_and_rejects_other_input(self) -> None:
+        write_record_table(self.path, RECORDS)
+        self.assertTrue(is_record_table(self.path))
+        self.assertFalse(is_record_table(self.path.with_suffix(".json")))
+        with self.assertRaises(ValueError):
+            RecordTable(b"[" + bytes(40))
+
+
+if __name__ == "__main__":
+    unittest.main()
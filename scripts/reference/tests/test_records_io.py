@@ -0,0 +1,83 @@
+"""Tests for JSON / JSONL record stream I/O."""
+
+from __future__ import annotations
+
+import io
+import unittest
+from collections.abc import Iterator
+
+from common.records_io import dump_records, format_records, iter_records
+from common.render_tsv import iter_tsv_lines
+from validate import validate_keybinding_records
+
+RECORDS = [
+    {"tool": "zsh", "key": "Ctrl-R", "action": "history\tsearch"},
+    {"tool": "skhd", "key": "Alt-H", "action": "focus west"},
+]
+
+
+class TestRecordsIO(unittest.TestCase):
+    def test_json_and_jsonl_round_trip(self) -> None:
+        for fmt in ("json", "jsonl"):
+            with self.subTest(fmt=fmt):
+                text = format_records(RECORDS, fmt)
+                self.assertEqual(list(iter_records(io.StringIO(text))), RECORDS)
+
+    def test_jsonl_is_one_compact_record_per_line(self) -> None:
+        out = io.StringIO()
+        dump_records(iter(RECORDS), out, "jsonl")
+
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].startswith('{"tool": "zsh"'))
+
+    def test_jsonl_is_decoded_lazily(self) -> None:
+        # A malformed later line only fails once the reader gets there.
+        text = format_records(RECORDS[:1], "jsonl") + "not json\n"
+        records = iter_records(io.StringIO(text))
+
+        self.assertEqual(next(records), RECORDS[0])
+        with self.assertRaises(ValueError):
+            next(records)
+
+    def test_blank_lines_and_empty_input_are_ignored(self) -> None:
+        self.assertEqual(list(iter_records(io.StringIO(""))), [])
+        text = "\n" + format_records(RECORDS, "jsonl").replace("\n", "\n\n")
+        self.assertEqual(list(iter_records(io.StringIO(text))), RECORDS)
+
+    def test_non_object_record_is_rejected(self) -> None:
+        with self.assertRaisesRegex(TypeError, "line 2"):
+            list(iter_records(io.StringIO('{"a": "b"}\n[1]\n')))
+        with self.assertRaisesRegex(TypeError, "record\\[0\\]"):
+            list(iter_records(io.StringIO("[1]")))
+
+    def test_tsv_lines_stream_from_records(self) -> None:
+        lines = iter_tsv_lines(iter(RECORDS), ("key", "action"))
+
+        self.assertEqual(next(lines), "Ctrl-R\thistory search\n")
+
+    def test_validation_consumes_a_single_pass_iterator(self) -> None:
+        binding = {
+            "tool": "zsh",
+            "context": "",
+            "mode": "emacs",
+            "key": "Ctrl-R",
+            "action": "history-search",
+            "description": "",
+            "source": ".config/zsh/keys.zsh",
+            "origin": "custom",
+            "change": "added",
+        }
+        text = format_records([binding, binding], "jsonl")
+
+        def one_pass() -> Iterator[dict[str, str]]:
+            yield from iter_records(io.StringIO(text))
+
+        errors = validate_keybinding_records(one_pass())
+
+        self.assertTrue(any("duplicate key identity" in error for error in errors))
+        self.assertTrue(any("actual=2" in error for error in errors))
+
+
+if __name__ == "__main__":
+    unittest.main()
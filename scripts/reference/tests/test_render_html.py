@@ -2,11 +2,25 @@
 
 from __future__ import annotations
 
+import importlib
 import json
 import re
 import unittest
+from dataclasses import replace
 
-from common.render_html import render_searchable_html
+from common.columnar import decode_columnar
+from common.page_config import AssetLinks
+from common.render_html import (
+    TRIGRAM_AUTO_MIN_RECORDS,
+    VIRTUAL_AUTO_MIN_RECORDS,
+    WORKER_AUTO_MIN_RECORDS,
+    page_payload,
+    render_searchable_html,
+    resolve_search_index,
+    resolve_search_mode,
+    resolve_search_thread,
+    resolve_table_mode,
+)
 from keybindings.page import PAGE_CONFIG
 
 
@@ -39,13 +53,13 @@ def _meta(**overrides: str) -> dict[str, str]:
 class TestRenderHtml(unittest.TestCase):
     def test_data_embedded_in_output(self) -> None:
         output = render_searchable_html([_sample_record()], PAGE_CONFIG, _meta())
-        self.assertIn("const DATA", output)
+        self.assertIn("let DATA = [{", output)
         self.assertIn("const CONFIG", output)
 
     def test_script_injection_neutralized(self) -> None:
         records = [_sample_record(action="</script><b>x")]
         output = render_searchable_html(records, PAGE_CONFIG, _meta())
-        data_match = re.search(r"const DATA = (\[.*?\]);", output, re.DOTALL)
+        data_match = re.search(r"let DATA = (\[.*?\]);", output, re.DOTALL)
         self.assertIsNotNone(data_match)
         data_json = data_match.group(1) if data_match else ""
         self.assertIn(r"<\/script>", data_json)
@@ -54,7 +68,7 @@ class TestRenderHtml(unittest.TestCase):
     def test_leader_not_emitted_as_html_tag(self) -> None:
         records = [_sample_record(key="<leader>ff", action="Telescope find_files")]
         output = render_searchable_html(records, PAGE_CONFIG, _meta())
-        before_script, after_data = output.split("const DATA = ", 1)
+        before_script, after_data = output.split("let DATA = ", 1)
         _script_body, after_script = after_data.split("</script>", 1)
         self.assertNotIn("<leader>", before_script)
         self.assertNotIn("<leader>", after_script)
@@ -81,6 +95,137 @@ class TestRenderHtml(unittest.TestCase):
             ["Tool", "Mode", "Key", "Action", "Description", "Source", "Change"],
         )
 
+    def test_auto_table_mode_switches_to_virtual_for_large_pages(self) -> None:
+        self.assertEqual(resolve_table_mode(PAGE_CONFIG, 10), "full")
+        self.assertEqual(
+            resolve_table_mode(PAGE_CONFIG, VIRTUAL_AUTO_MIN_RECORDS), "virtual"
+        )
+
+    def test_explicit_table_mode_is_embedded(self) -> None:
+        config = replace(PAGE_CONFIG, table_mode="virtual", row_height=30)
+        output = render_searchable_html([_sample_record()], config, _meta())
+        config_match = re.search(r"const CONFIG = (\{.*?\});", output, re.DOTALL)
+        embedded = json.loads(config_match.group(1)) if config_match else {}
+        self.assertEqual(embedded["tableMode"], "virtual")
+        self.assertEqual(embedded["rowHeight"], 30)
+
+    def test_unknown_table_mode_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            resolve_table_mode(replace(PAGE_CONFIG, table_mode="paged"), 1)
+
+    def test_auto_search_index_builds_trigrams_for_large_pages(self) -> None:
+        substring = replace(PAGE_CONFIG, search_mode="substring")
+        self.assertEqual(resolve_search_index(substring, 10), "none")
+        self.assertEqual(
+            resolve_search_index(substring, TRIGRAM_AUTO_MIN_RECORDS), "trigram"
+        )
+        forced = replace(substring, search_index="trigram")
+        self.assertEqual(resolve_search_index(forced, 1), "trigram")
+
+    def test_fuzzy_search_skips_the_trigram_index(self) -> None:
+        fuzzy = replace(PAGE_CONFIG, search_mode="fuzzy")
+        self.assertEqual(resolve_search_index(fuzzy, TRIGRAM_AUTO_MIN_RECORDS), "none")
+        with self.assertRaises(ValueError):
+            resolve_search_index(replace(fuzzy, search_index="trigram"), 1)
+        with self.assertRaises(ValueError):
+            resolve_search_index(replace(PAGE_CONFIG, search_mode="regex"), 1)
+
+    def test_fuzzy_search_is_opt_in_per_domain(self) -> None:
+        for domain in ("shortcuts", "tasks", "claude"):
+            page = importlib.import_module(f"{domain}.page")
+            with self.subTest(domain=domain):
+                self.assertEqual(resolve_search_mode(page.PAGE_CONFIG), "substring")
+
+    def test_search_weights_are_embedded(self) -> None:
+        output = render_searchable_html([_sample_record()], PAGE_CONFIG, _meta())
+        config_match = re.search(r"const CONFIG = (\{.*?\});\n", output)
+        embedded = json.loads(config_match.group(1)) if config_match else {}
+        self.assertEqual(
+            embedded["searchFields"], ["key", "action", "description", "source"]
+        )
+        self.assertEqual(embedded["searchWeights"], [3, 2, 2, 1])
+        self.assertEqual(embedded["searchMode"], "fuzzy")
+        self.assertIn('"firstCharMultiplier": 2', output)
+
+    def test_haystack_is_built_once_not_per_keystroke(self) -> None:
+        output = render_searchable_html([_sample_record()], PAGE_CONFIG, _meta())
+        self.assertIn("HAYSTACK.push(", output)
+        self.assertIn("HAYSTACK[i].includes(query)", output)
+
+    def test_chip_filters_use_bitsets_and_search_is_debounced(self) -> None:
+        output = render_searchable_html([_sample_record()], PAGE_CONFIG, _meta())
+        self.assertIn("new Uint32Array(WORDS)", output)
+        self.assertIn("SEARCH_DEBOUNCE_MS", output)
+        self.assertNotIn("renderControls", output)
+
+    def test_data_url_leaves_records_out_of_the_page(self) -> None:
+        records = [_sample_record(description="only-in-data-file")]
+        output = render_searchable_html(
+            records, PAGE_CONFIG, _meta(), data_url="data.0123abcd.json"
+        )
+        self.assertIn("let DATA = [];", output)
+        self.assertIn('const DATA_URL = "data.0123abcd.json";', output)
+        self.assertIn('<link rel="preload" href="data.0123abcd.json"', output)
+        self.assertNotIn("only-in-data-file", output)
+        # Chip values are still derived from the records at render time.
+        self.assertIn('"values": ["n"]', output)
+
+    def test_inline_page_has_no_data_url(self) -> None:
+        output = render_searchable_html([_sample_record()], PAGE_CONFIG, _meta())
+        self.assertIn("const DATA_URL = null;", output)
+        self.assertNotIn('rel="preload"', output)
+
+    def test_assets_replace_the_inline_style_and_script(self) -> None:
+        assets = AssetLinks(css="../assets/app.1.css", js="../assets/app.2.js")
+        output = render_searchable_html(
+            [_sample_record()], PAGE_CONFIG, _meta(), assets=assets
+        )
+        self.assertIn('<link rel="stylesheet" href="../assets/app.1.css">', output)
+        self.assertIn('<script src="../assets/app.2.js"></script>', output)
+        self.assertNotIn("<style>", output)
+        self.assertNotIn("function applyFilters", output)
+        # The page-specific globals stay inline, ahead of the shared script.
+        self.assertLess(
+            output.index("const CONFIG = "), output.index("../assets/app.2.js")
+        )
+
+    def test_auto_data_encoding_picks_the_smaller_payload(self) -> None:
+        single = [_sample_record()]
+        self.assertEqual(page_payload(single, PAGE_CONFIG), single)
+
+        many = [_sample_record(key=f"k{i}") for i in range(50)]
+        payload = page_payload(many, PAGE_CONFIG)
+        assert isinstance(payload, dict)
+        self.assertEqual(decode_columnar(payload), many)
+        self.assertLess(len(json.dumps(payload)), len(json.dumps(many)) / 2)
+
+    def test_explicit_data_encoding(self) -> None:
+        many = [_sample_record(key=f"k{i}") for i in range(50)]
+        rows = replace(PAGE_CONFIG, data_encoding="rows")
+        self.assertEqual(page_payload(many, rows), many)
+        columnar = replace(PAGE_CONFIG, data_encoding="columnar")
+        output = render_searchable_html(many[:1], columnar, _meta())
+        self.assertIn('let DATA = {"length": 1, "columns": {', output)
+        with self.assertRaises(ValueError):
+            page_payload(many, replace(PAGE_CONFIG, data_encoding="packed"))
+
+    def test_auto_search_thread_moves_large_pages_to_a_worker(self) -> None:
+        self.assertEqual(resolve_search_thread(PAGE_CONFIG, 10), "main")
+        self.assertEqual(
+            resolve_search_thread(PAGE_CONFIG, WORKER_AUTO_MIN_RECORDS), "worker"
+        )
+        with self.assertRaises(ValueError):
+            resolve_search_thread(replace(PAGE_CONFIG, search_thread="gpu"), 1)
+
+    def test_worker_search_drops_stale_answers(self) -> None:
+        config = replace(PAGE_CONFIG, search_thread="worker")
+        output = render_searchable_html([_sample_record()], config, _meta())
+        self.assertIn('"searchThread": "worker"', output)
+        self.assertIn("new Worker(url)", output)
+        self.assertIn(
+            "if (seq !== searchSeq || query !== pendingQuery) return;", output
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,66 @@
+"""Tests for render-inputs keys and where they are stored."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from common.render_inputs import (
+    inputs_path,
+    output_is_current,
+    record_output,
+    render_inputs_key,
+)
+
+RECORDS = [{"tool": "zsh", "key": "^R"}]
+
+
+class TestRenderInputsKey(unittest.TestCase):
+    def test_same_inputs_same_key(self) -> None:
+        self.assertEqual(
+            render_inputs_key("page", "keybindings", RECORDS),
+            render_inputs_key("page", "keybindings", [dict(RECORDS[0])]),
+        )
+
+    def test_any_input_changes_the_key(self) -> None:
+        key = render_inputs_key("page", "keybindings", RECORDS)
+        self.assertNotEqual(key, render_inputs_key("page", "shortcuts", RECORDS))
+        self.assertNotEqual(
+            key, render_inputs_key("page", "keybindings", [{"tool": "zsh"}])
+        )
+
+
+class TestRecordedOutput(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache = Path(tmp.name) / "cache"
+        patcher = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": str(self.cache)})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.site = Path(tmp.name) / "site"
+        self.site.mkdir()
+        self.page = self.site / "index.html"
+        self.page.write_text("<h1>keys</h1>", encoding="utf-8")
+
+    def test_recorded_output_is_current(self) -> None:
+        self.assertFalse(output_is_current(self.page, "k1"))
+        record_output(self.page, "k1")
+        self.assertTrue(inputs_path(self.page).is_relative_to(self.cache))
+        self.assertEqual(list(self.site.iterdir()), [self.page])
+        self.assertTrue(output_is_current(self.page, "k1"))
+        self.assertFalse(output_is_current(self.page, "k2"))
+
+    def test_edited_or_missing_output_is_not_current(self) -> None:
+        record_output(self.page, "k1")
+        self.page.write_text("<h1>edited</h1>", encoding="utf-8")
+        self.assertFalse(output_is_current(self.page, "k1"))
+        self.page.unlink()
+        self.assertFalse(output_is_current(self.page, "k1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -55,6 +55,24 @@ class TestSchema(unittest.TestCase):
         errors = validate_record(record)
         self.assertTrue(any("invalid tool" in error for error in errors))
 
+    def test_validate_record_reports_invalid_conflict(self) -> None:
+        record = to_record(
+            Keybinding(
+                tool="nvim",
+                context="global",
+                mode="n",
+                key="<C-J>",
+                action="<C-W>j",
+                description="",
+                source=".config/nvim/init.lua",
+                origin="custom",
+                change="added",
+            )
+        )
+        self.assertEqual(validate_record({**record, "conflict": "shadowed"}), [])
+        errors = validate_record({**record, "conflict": "maybe"})
+        self.assertEqual(errors, ["invalid conflict: 'maybe'"])
+
     def test_validate_record_reports_missing_required_field(self) -> None:
         record = {
             "tool": "nvim",
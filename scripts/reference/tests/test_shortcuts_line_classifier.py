@@ -0,0 +1,58 @@
+"""Tests for the combined alias/abbr/function line classifier."""
+
+from __future__ import annotations
+
+import unittest
+from pathlib import Path
+
+from bench_shortcuts import parse_three_passes, same_shortcuts, synthetic_zsh
+from shortcuts.line_classifier import classify_shortcut_line, parse_shortcut_text
+
+FIXTURES = Path(__file__).parent / "fixtures"
+FIXTURE_NAMES = (
+    "shortcuts-alias.zsh",
+    "shortcuts-abbr.zsh",
+    "shortcuts-function.zsh",
+)
+
+
+class TestShortcutsLineClassifier(unittest.TestCase):
+    def test_classifies_each_kind(self) -> None:
+        cases = {
+            "alias ll='ls -l'": ("alias", "ll", "ls -l"),
+            "  alias -g G='| grep'": ("alias", "G", "| grep"),
+            "abbr -S --quieter add gs='git status'": ("abbr", "gs", "git status"),
+            "ch() { cheat $* | bat }": ("function", "ch", ""),
+            "function history-all { history -E 1 }": ("function", "history-all", ""),
+        }
+        for line, expected in cases.items():
+            with self.subTest(line=line):
+                shortcut = classify_shortcut_line(line)
+                assert shortcut is not None
+                self.assertEqual(
+                    (shortcut.kind, shortcut.name, shortcut.value), expected
+                )
+
+    def test_ignores_comments_and_other_lines(self) -> None:
+        for line in ("# alias ll='ls'", "", "export PATH=x", "bindkey '^R' x"):
+            with self.subTest(line=line):
+                self.assertIsNone(classify_shortcut_line(line))
+
+    def test_fixtures_match_per_parser_passes(self) -> None:
+        for name in FIXTURE_NAMES:
+            with self.subTest(fixture=name):
+                text = (FIXTURES / name).read_text(encoding="utf-8")
+                self.assertTrue(same_shortcuts(text))
+
+    def test_synthetic_corpus_matches_per_parser_passes(self) -> None:
+        text = synthetic_zsh(20)
+
+        self.assertTrue(same_shortcuts(text))
+        self.assertEqual(
+            len(parse_shortcut_text(text, "x.zsh")),
+            len(parse_three_passes(text, "x.zsh")),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+"""Tests for publishing a built site through its content-hash manifest."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from common.site_manifest import (
+    MANIFEST_NAME,
+    load_manifest,
+    publish_site,
+    reusable_output,
+)
+
+FILES = {
+    "index.html": b"<h1>hub</h1>",
+    "keybindings/index.html": b"<h1>keys</h1>",
+    "assets/app.0123.css": b"a{}",
+}
+
+
+class TestPublishSite(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.site = Path(tmp.name) / "site"
+        # Keep the tests independent of whether brotli is installed.
+        patcher = mock.patch("common.precompress.shutil.which", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_writes_files_gzip_siblings_and_manifest(self) -> None:
+        result = publish_site(self.site, FILES, jobs=2)
+        self.assertEqual(sorted(result.written), sorted(FILES))
+        for path, content in FILES.items():
+            self.assertEqual((self.site / path).read_bytes(), content)
+            compressed = (self.site / f"{path}.gz").read_bytes()
+            self.assertEqual(gzip.decompress(compressed), content)
+            entry = result.manifest[path]
+            self.assertEqual(entry.size, len(content))
+            self.assertEqual(entry.gzip_size, len(compressed))
+            self.assertIsNone(entry.brotli_size)
+        raw = json.loads((self.site / MANIFEST_NAME).read_text(encoding="utf-8"))
+        self.assertEqual(list(raw["files"]), sorted(FILES))
+        self.assertEqual(load_manifest(self.site), result.manifest)
+
+    def test_unchanged_files_are_not_rewritten(self) -> None:
+        publish_site(self.site, FILES, jobs=1)
+        hub = self.site / "index.html"
+        before = hub.stat().st_mtime_ns
+        changed = {**FILES, "keybindings/index.html": b"<h1>keys v2</h1>"}
+        result = publish_site(self.site, changed, jobs=1)
+        self.assertEqual(result.written, ("keybindings/index.html",))
+        self.assertEqual(hub.stat().st_mtime_ns, before)
+
+    def test_missing_sibling_is_rewritten(self) -> None:
+        publish_site(self.site, FILES, jobs=1)
+        (self.site / "index.html.gz").unlink()
+        result = publish_site(self.site, FILES, jobs=1)
+        self.assertEqual(result.written, ("index.html",))
+        self.assertTrue((self.site / "index.html.gz").is_file())
+
+    def test_files_no_longer_built_are_removed(self) -> None:
+        publish_site(self.site, FILES, jobs=1)
+        renamed = {**FILES, "assets/app.4567.css": b"b{}"}
+        del renamed["assets/app.0123.css"]
+        result = publish_site(self.site, renamed, jobs=1)
+        self.assertEqual(result.removed, ("assets/app.0123.css",))
+        self.assertEqual(
+            sorted(path.name for path in (self.site / "assets").iterdir()),
+            ["app.4567.css", "app.4567.css.gz"],
+        )
+
+    def test_unreadable_manifest_rebuilds_everything(self) -> None:
+        publish_site(self.site, FILES, jobs=1)
+        (self.site / MANIFEST_NAME).write_text("{not json", encoding="utf-8")
+        result = publish_site(self.site, FILES, jobs=1)
+        self.assertEqual(sorted(result.written), sorted(FILES))
+
+    def test_pages_rendered_from_the_same_inputs_are_reusable(self) -> None:
+        publish_site(self.site, FILES, jobs=1, inputs={"index.html": "k1"})
+        entry = load_manifest(self.site)["index.html"]
+        self.assertEqual(entry.inputs, "k1")
+        self.assertEqual(
+            reusable_output(self.site, "index.html", entry, "k1"), FILES["index.html"]
+        )
+        self.assertIsNone(reusable_output(self.site, "index.html", entry, "k2"))
+        (self.site / "index.html").write_bytes(b"<h1>edited</h1>")
+        self.assertIsNone(reusable_output(self.site, "index.html", entry, "k1"))
+
+    def test_manifest_paths_outside_the_site_are_ignored(self) -> None:
+        self.site.mkdir()
+        outside = self.site.parent / "keep.txt"
+        outside.write_text("keep", encoding="utf-8")
+        entry = {"sha256": "0", "size": 4, "gzip_size": 4, "brotli_size": None}
+        (self.site / MANIFEST_NAME).write_text(
+            json.dumps({"version": 1, "files": {"../keep.txt": entry}}),
+            encoding="utf-8",
+        )
+        publish_site(self.site, FILES, jobs=1)
+        self.assertTrue(outside.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -29,7 +29,7 @@ class TestSkhdConfig(unittest.TestCase):
 
     def test_parse_skhdrc_normalizes_modifiers(self) -> None:
         bindings = parse_skhdrc(self.valid_text)
-        self.assertEqual(bindings[1].mode, "shift+alt")
+        self.assertEqual(bindings[1].mode, "alt+shift")
         self.assertEqual(bindings[1].key, "x")
 
     def test_parse_skhdrc_fixture_count(self) -> None:
@@ -0,0 +1,42 @@
+"""Tests for build stage timings."""
+
+from __future__ import annotations
+
+import unittest
+
+from common.timing import StageTimer
+
+
+class TestStageTimer(unittest.TestCase):
+    def test_stages_recorded_in_completion_order(self) -> None:
+        timer = StageTimer()
+        with timer.stage("extract:zsh"):
+            pass
+        with timer.stage("render:hub"):
+            pass
+
+        self.assertEqual(
+            [name for name, _ in timer.timings], ["extract:zsh", "render:hub"]
+        )
+
+    def test_stage_recorded_when_body_raises(self) -> None:
+        timer = StageTimer()
+        with self.assertRaises(ValueError), timer.stage("extract:skhd"):
+            raise ValueError("bad line")
+
+        self.assertEqual([name for name, _ in timer.timings], ["extract:skhd"])
+
+    def test_report_aligns_stage_names(self) -> None:
+        timer = StageTimer()
+        timer.timings.extend([("a", 0.5), ("longer", 1.25)])
+
+        report = timer.format_report()
+
+        self.assertEqual(report, "a         0.500s\nlonger    1.250s\n")
+
+    def test_empty_report(self) -> None:
+        self.assertEqual(StageTimer().format_report(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
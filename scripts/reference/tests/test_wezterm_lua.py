@@ -33,8 +33,11 @@ class TestWeztermLua(unittest.TestCase):
         parsed = parse_show_keys_lua(self.default_text)
         self.assertEqual(len(parsed), 214)
 
-    def test_normalize_mods_sorts_pipe_separated_modifiers(self) -> None:
+    def test_normalize_mods_orders_pipe_separated_modifiers(self) -> None:
         self.assertEqual(normalize_mods("SHIFT|CTRL"), "CTRL|SHIFT")
+        self.assertEqual(normalize_mods("SUPER|ALT|CTRL"), "CTRL|ALT|SUPER")
+        self.assertEqual(normalize_mods("SHIFT|LEADER"), "LEADER|SHIFT")
+        self.assertEqual(normalize_mods("CMD|SHIFT"), normalize_mods("SHIFT|SUPER"))
         self.assertEqual(normalize_mods("NONE"), "NONE")
 
     def test_unescape_lua_key(self) -> None:
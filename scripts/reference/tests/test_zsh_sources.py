@@ -0,0 +1,117 @@
+"""Tests for the single-pass, memoized zsh source scanner."""
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from extract_shortcuts import collect_shortcuts
+from extract_zsh import collect_zsh_bindings
+from keybindings.zsh_bindkey import parse_bindkey_text
+from shortcuts.abbr_parser import parse_abbr_text
+from shortcuts.alias_parser import parse_alias_text
+from shortcuts.function_parser import parse_function_text
+from zsh_sources import ZshScanner, scan_from_json, scan_to_json, scan_zsh_text
+
+MIXED_ZSH = """\
+alias ll='ls -l'
+abbr -S --quieter add gs='git status'
+# Jump to a repo
+repo() {
+  cd "$1"
+}
+bindkey '^R' history-search
+# not a function() {
+function greet { echo hi }
+"""
+
+
+def _write(root: Path, rel_path: str, content: str) -> None:
+    target = root / rel_path
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(content, encoding="utf-8")
+
+
+class TestScanZshText(unittest.TestCase):
+    def test_matches_individual_parsers(self) -> None:
+        scan = scan_zsh_text(MIXED_ZSH, "x.zsh")
+
+        self.assertEqual(list(scan.aliases), parse_alias_text(MIXED_ZSH, "x.zsh"))
+        self.assertEqual(list(scan.abbrs), parse_abbr_text(MIXED_ZSH, "x.zsh"))
+        self.assertEqual(list(scan.functions), parse_function_text(MIXED_ZSH, "x.zsh"))
+        self.assertEqual(list(scan.bindkeys), parse_bindkey_text(MIXED_ZSH, "x.zsh"))
+        self.assertEqual(scan.functions[0].description, "Jump to a repo")
+
+    def test_unsupported_bindkey_is_recorded_not_raised(self) -> None:
+        scan = scan_zsh_text("alias a=b\nbindkey -M viins '^A' x\n", "x.zsh")
+
+        self.assertIn("unsupported bindkey", scan.bindkey_error)
+        self.assertEqual(len(scan.aliases), 1)
+
+    def test_json_round_trip(self) -> None:
+        scan = scan_zsh_text(MIXED_ZSH, "x.zsh")
+
+        self.assertEqual(scan_from_json(scan_to_json(scan)), scan)
+
+
+class TestZshScanner(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name) / "repo"
+        self.memo_dir = Path(tmp.name) / "memo"
+        _write(self.root, ".config/zsh/alias.zsh", "alias ll='ls -l'\n")
+        _write(self.root, ".config/zsh/func.zsh", "# Say hi\nhi() {\n}\n")
+        _write(self.root, ".config/zsh/plugins/abbr.zsh", MIXED_ZSH)
+
+    def test_shared_scanner_reads_each_file_once(self) -> None:
+        scanner = ZshScanner(self.root)
+
+        collect_shortcuts(self.root, scanner)
+        collect_zsh_bindings(self.root, scanner)
+
+        self.assertEqual(
+            sorted(scanner.parsed),
+            [
+                ".config/zsh/alias.zsh",
+                ".config/zsh/func.zsh",
+                ".config/zsh/plugins/abbr.zsh",
+            ],
+        )
+
+    def test_collectors_keep_record_order(self) -> None:
+        records = collect_shortcuts(self.root)
+
+        self.assertEqual(
+            [(r["kind"], r["name"]) for r in records],
+            [
+                ("alias", "ll"),
+                ("alias", "ll"),
+                ("abbr", "gs"),
+                ("function", "hi"),
+                ("function", "repo"),
+                ("function", "greet"),
+            ],
+        )
+
+    def test_memo_rescans_only_edited_file(self) -> None:
+        collect_shortcuts(self.root, ZshScanner(self.root, self.memo_dir))
+        _write(self.root, ".config/zsh/alias.zsh", "alias la='ls -a'\n")
+
+        scanner = ZshScanner(self.root, self.memo_dir)
+        records = collect_shortcuts(self.root, scanner)
+
+        self.assertEqual(scanner.parsed, [".config/zsh/alias.zsh"])
+        self.assertEqual(records[0]["name"], "la")
+
+    def test_unsupported_bindkey_raises_in_bindkey_extractor(self) -> None:
+        _write(self.root, ".config/zsh/keys.zsh", "bindkey -M viins '^A' x\n")
+
+        with self.assertRaises(ValueError):
+            collect_zsh_bindings(self.root)
+        self.assertTrue(collect_shortcuts(self.root))
+
+
+if __name__ == "__main__":
+    unittest.main()
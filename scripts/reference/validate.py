@@ -4,13 +4,19 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 from collections import Counter
+from collections.abc import Iterable, Iterator
+from pathlib import Path
 
-from keybindings.dedup import detect_duplicate_keys
+from common.records_io import read_records
+from keybindings.conflicts import ChordIndex
+from keybindings.dedup import Identity, duplicate_identities, key_identity
+from keybindings.leaders import keybinding_leaders
 from keybindings.schema import validate_record
 
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
 MINIMUM_CUSTOM_COUNTS: dict[str, int] = {
     "wezterm": 25,
     "zsh": 11,
@@ -19,53 +25,40 @@ MINIMUM_CUSTOM_COUNTS: dict[str, int] = {
 }
 
 
-def load_records(input_path: str | None) -> list[dict[str, str]]:
-    if input_path is None or input_path == "-":
-        text = sys.stdin.read()
-    else:
-        with open(input_path, encoding="utf-8") as handle:
-            text = handle.read()
-    loaded = json.loads(text)
-    if not isinstance(loaded, list):
-        raise TypeError("input JSON must be an array")
-    return loaded
-
+def load_records(input_path: str | None) -> Iterator[dict[str, str]]:
+    """Stream records from a JSON array or JSONL file (stdin for None / ``-``)."""
+    return read_records(input_path)
 
-def count_custom_by_tool(records: list[dict[str, str]]) -> Counter[str]:
-    counts: Counter[str] = Counter()
-    for record in records:
-        if record.get("origin") == "custom":
-            counts[record["tool"]] += 1
-    return counts
 
+def validate_keybinding_records(
+    records: Iterable[dict[str, str]], chords: ChordIndex | None = None
+) -> list[str]:
+    """Return schema, duplicate-identity, and minimum-count errors.
 
-def main() -> int:
-    parser = argparse.ArgumentParser(description="Validate keybinding records")
-    parser.add_argument("--input", default="-")
-    parser.add_argument("--count-only", action="store_true")
-    args = parser.parse_args()
-
-    records = load_records(None if args.input == "-" else args.input)
-
-    if args.count_only:
-        sys.stdout.write(f"{len(records)}\n")
-        return 0
-
+    Records are consumed in one pass, keeping only per-identity and per-tool
+    counters, so a JSONL stream is never materialized. ``chords``, if given,
+    is filled in the same pass for shadowing_report.
+    """
     errors: list[str] = []
+    identity_counts: Counter[Identity] = Counter()
+    custom_counts: Counter[str] = Counter()
 
     for index, record in enumerate(records):
         field_errors = validate_record(record)
         for field_error in field_errors:
             errors.append(f"record[{index}]: {field_error}")
+        identity_counts[key_identity(record)] += 1
+        if chords is not None and not field_errors:
+            chords.add(record)
+        if record.get("origin") == "custom":
+            custom_counts[record["tool"]] += 1
 
-    duplicates = detect_duplicate_keys(records)
-    for tool, context, mode, key in duplicates:
+    for tool, context, mode, key in duplicate_identities(identity_counts):
         errors.append(
             "duplicate key identity: "
             f"tool={tool!r} context={context!r} mode={mode!r} key={key!r}"
         )
 
-    custom_counts = count_custom_by_tool(records)
     for tool, minimum in MINIMUM_CUSTOM_COUNTS.items():
         actual = custom_counts.get(tool, 0)
         if actual < minimum:
@@ -74,6 +67,54 @@ def main() -> int:
                 f"expected>={minimum}, actual={actual}"
             )
 
+    return errors
+
+
+def shadowing_report(chords: ChordIndex) -> list[str]:
+    """One line per binding an outer layer (skhd > wezterm > zsh > nvim) shadows."""
+    lines: list[str] = []
+    for shadowing in chords.shadowing():
+        shadowed = chords.identities[shadowing.shadowed]
+        by = chords.identities[shadowing.by]
+        lines.append(
+            f"shadowed: {_describe(shadowed)} by {_describe(by)} on {shadowing.stroke}"
+        )
+    return lines
+
+
+def _describe(identity: Identity) -> str:
+    tool, context, mode, key = identity
+    return f"{tool} {context!r} {mode!r} {key!r}"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Validate keybinding records")
+    parser.add_argument("--input", default="-")
+    parser.add_argument("--count-only", action="store_true")
+    parser.add_argument(
+        "--shadowing",
+        action="store_true",
+        help="also list bindings shadowed by another tool's (does not fail)",
+    )
+    parser.add_argument(
+        "--root",
+        type=Path,
+        default=REPO_ROOT,
+        help="with --shadowing: repo whose wezterm/nvim configs set the leaders",
+    )
+    args = parser.parse_args()
+
+    records = load_records(None if args.input == "-" else args.input)
+
+    if args.count_only:
+        sys.stdout.write(f"{sum(1 for _ in records)}\n")
+        return 0
+
+    chords = ChordIndex(keybinding_leaders(args.root)) if args.shadowing else None
+    errors = validate_keybinding_records(records, chords)
+    if chords is not None:
+        for line in shadowing_report(chords):
+            print(line)
     if errors:
         for error in errors:
             print(error, file=sys.stderr)
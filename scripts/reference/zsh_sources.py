@@ -0,0 +1,161 @@
+"""Read and scan each Zsh source file once per build.
+
+collect_shortcuts (aliases, abbreviations, functions) and collect_zsh_bindings
+(bindkey) both walk .config/zsh. A ZshScanner reads each file once, runs every
+recognizer over it in a single pass, and memoizes the result in memory and on
+disk, keyed by the file's content hash. Editing one plugin re-scans only that
+file.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sys
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from common.cache import cache_dir, read_keyed_json, source_digest, write_keyed_json
+from keybindings import schema as keybinding_schema
+from keybindings import zsh_bindkey
+from keybindings.schema import Keybinding
+from keybindings.zsh_bindkey import bindkey_to_keybinding, parse_bindkey_line
+from shortcuts import alias_parser, function_parser, line_classifier
+from shortcuts import schema as shortcut_schema
+from shortcuts.line_classifier import classify_shortcut_at
+from shortcuts.schema import Shortcut
+
+
+@dataclass(frozen=True)
+class ZshFileScan:
+    """Everything recognized in one file.
+
+    bindkey_error: the first unsupported bindkey line, if any. It is raised
+    only by the bindkey extractor, so shortcut extraction is unaffected.
+    """
+
+    aliases: tuple[Shortcut, ...] = ()
+    abbrs: tuple[Shortcut, ...] = ()
+    functions: tuple[Shortcut, ...] = ()
+    bindkeys: tuple[Keybinding, ...] = ()
+    bindkey_error: str = ""
+
+
+def scan_zsh_text(text: str, source: str) -> ZshFileScan:
+    """Classify every line of a Zsh file in a single pass.
+
+    Shortcut lines are recognized by one regex call (line_classifier); only
+    lines starting with ``bindkey`` reach the bindkey parser.
+    """
+    lines = text.splitlines()
+    by_kind: dict[str, list[Shortcut]] = {"alias": [], "abbr": [], "function": []}
+    bindkeys: list[Keybinding] = []
+    bindkey_error = ""
+
+    for index, line in enumerate(lines):
+        shortcut = classify_shortcut_at(lines, index, source)
+        if shortcut is not None:
+            by_kind[shortcut.kind].append(shortcut)
+
+        if bindkey_error or not line.lstrip().startswith("bindkey"):
+            continue
+        try:
+            bindkey = parse_bindkey_line(line)
+        except ValueError as exc:
+            bindkey_error = str(exc)
+            continue
+        if bindkey is not None:
+            bindkeys.append(bindkey_to_keybinding(bindkey, source))
+
+    return ZshFileScan(
+        aliases=tuple(by_kind["alias"]),
+        abbrs=tuple(by_kind["abbr"]),
+        functions=tuple(by_kind["function"]),
+        bindkeys=tuple(bindkeys),
+        bindkey_error=bindkey_error,
+    )
+
+
+def scan_to_json(scan: ZshFileScan) -> dict[str, object]:
+    return {
+        "aliases": [shortcut_schema.to_record(item) for item in scan.aliases],
+        "abbrs": [shortcut_schema.to_record(item) for item in scan.abbrs],
+        "functions": [shortcut_schema.to_record(item) for item in scan.functions],
+        "bindkeys": [keybinding_schema.to_record(item) for item in scan.bindkeys],
+        "bindkey_error": scan.bindkey_error,
+    }
+
+
+def scan_from_json(raw: object) -> ZshFileScan:
+    """Rebuild a scan from scan_to_json output; TypeError/KeyError if malformed."""
+    if not isinstance(raw, dict):
+        raise TypeError("cached zsh scan must be an object")
+    return ZshFileScan(
+        aliases=tuple(Shortcut(**item) for item in raw["aliases"]),
+        abbrs=tuple(Shortcut(**item) for item in raw["abbrs"]),
+        functions=tuple(Shortcut(**item) for item in raw["functions"]),
+        bindkeys=tuple(Keybinding(**item) for item in raw["bindkeys"]),
+        bindkey_error=str(raw["bindkey_error"]),
+    )
+
+
+def scanner_code_version() -> str:
+    return source_digest(
+        sys.modules[__name__],
+        line_classifier,
+        alias_parser,
+        function_parser,
+        shortcut_schema,
+        zsh_bindkey,
+        keybinding_schema,
+    )
+
+
+class ZshScanner:
+    """Per-build scan memo shared by the shortcut and bindkey extractors.
+
+    With ``memo_dir`` set, scans also persist across builds as one file per
+    content hash.
+    """
+
+    def __init__(self, root: Path, memo_dir: Path | None = None) -> None:
+        self.root = root
+        self.memo_dir = memo_dir
+        self.code = scanner_code_version() if memo_dir is not None else ""
+        self.parsed: list[str] = []
+        self._scans: dict[Path, ZshFileScan | None] = {}
+        self._lock = threading.Lock()
+
+    def scan(self, path: Path) -> ZshFileScan | None:
+        """Return the scan of ``path``, or None when it is not a file."""
+        with self._lock:
+            if path not in self._scans:
+                self._scans[path] = self._scan_uncached(path)
+            return self._scans[path]
+
+    def _scan_uncached(self, path: Path) -> ZshFileScan | None:
+        if not path.is_file():
+            return None
+        source = path.relative_to(self.root).as_posix()
+        data = path.read_bytes()
+        if self.memo_dir is None:
+            self.parsed.append(source)
+            return scan_zsh_text(data.decode("utf-8"), source)
+
+        memo_path = self.memo_dir / f"{hashlib.sha256(data).hexdigest()}.json"
+        key = f"{self.code}:{source}"
+        cached = read_keyed_json(memo_path, key)
+        if cached is not None:
+            try:
+                return scan_from_json(cached)
+            except (KeyError, TypeError):
+                pass
+
+        self.parsed.append(source)
+        scan = scan_zsh_text(data.decode("utf-8"), source)
+        write_keyed_json(memo_path, key, scan_to_json(scan))
+        return scan
+
+
+def default_memo_dir() -> Path:
+    return cache_dir() / "reference" / "zsh-scan"